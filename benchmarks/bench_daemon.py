@@ -0,0 +1,64 @@
+"""
+렌더링 데몬 벤치마크
+
+짧은 Markdown 문서(Mermaid 1개, 수식 2개)를 md2html CLI로 여러 번 변환할 때
+매번 Chromium을 기동하는 방식과 --daemon(상주 브라우저)의 호출당 시간을 비교한다.
+데몬 첫 호출(기동 포함)은 따로 출력하고 측정에서 제외한다.
+
+사용법:
+    python benchmarks/bench_daemon.py [반복 횟수]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from helper_md_doc.helper_render_daemon import RenderDaemonClient  # noqa: E402
+
+MD_TEXT = "# 짧은 문서\n\n```mermaid\ngraph TD; A-->B\n```\n\n$E = mc^2$ 그리고 $a_{n+1}$\n"
+
+
+def run_cli(md_path: str, socket_path: str, daemon: bool) -> float:
+    """md2html CLI 한 번 실행 시간 (초)"""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), HELPER_MD_DOC_DAEMON=socket_path)
+    if not daemon:
+        env.pop("HELPER_MD_DOC_DAEMON")
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "helper_md_doc.helper_md_html", md_path, "--base64"],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        md_path = os.path.join(tmp_dir, "short.md")
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(MD_TEXT)
+        socket_path = os.path.join(tmp_dir, "render.sock")
+
+        cold = [run_cli(md_path, socket_path, daemon=False) for _ in range(repeat)]
+        first = run_cli(md_path, socket_path, daemon=True)
+        warm = [run_cli(md_path, socket_path, daemon=True) for _ in range(repeat)]
+        RenderDaemonClient(socket_path, autostart=False).shutdown()
+
+    print(f"반복 {repeat}회 (호출당 평균)")
+    print(f"  매번 Chromium 기동: {sum(cold) / repeat * 1000:.0f} ms")
+    print(f"  데몬 첫 호출(기동 포함): {first * 1000:.0f} ms")
+    print(f"  데몬 사용: {sum(warm) / repeat * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
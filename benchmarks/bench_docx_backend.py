@@ -0,0 +1,89 @@
+"""
+DOCX 백엔드 벤치마크
+
+Base64 이미지가 포함된 HTML 문서 여러 개를 DOCX로 변환할 때 백엔드별
+(pandoc: 문서별 프로세스, pandoc-server: 상주 서버, native: python-docx)
+전체 변환 시간을 비교한다. 사용할 수 없는 백엔드는 사유를 출력하고 건너뛴다.
+
+사용법:
+    python benchmarks/bench_docx_backend.py [문서 개수] [문서당 섹션 수]
+"""
+
+import base64
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_docx_backend import (  # noqa: E402
+    DOCX_BACKENDS,
+    close_docx_backends,
+    get_docx_backend,
+)
+
+
+def make_png(width: int, height: int, seed: int) -> bytes:
+    """단색 RGB PNG 생성 (렌더링된 수식/다이어그램 이미지 대용)"""
+    pixel = bytes(((seed * 37) % 256, (seed * 91) % 256, 200))
+    raw = b"".join(b"\x00" + pixel * width for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(kind + data) & 0xFFFFFFFF
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def build_html(index: int, sections: int) -> str:
+    """제목/문단/목록/표/코드 블록/Base64 이미지가 섞인 HTML 문서 생성"""
+    parts = [f"<html><head><title>문서 {index}</title></head><body><h1>문서 {index}</h1>"]
+    for i in range(sections):
+        png = base64.b64encode(make_png(320, 80, index * sections + i)).decode("ascii")
+        parts.append(
+            f"<h2>섹션 {i}</h2>"
+            f"<p>본문 <strong>강조</strong>와 <code>code</code>가 섞인 문단 {i}.</p>"
+            "<ul><li>항목 하나</li><li>항목 둘</li></ul>"
+            "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>"
+            "<pre><code>for i in range(10):\n    print(i)\n</code></pre>"
+            f'<div style="text-align: center;"><img src="data:image/png;base64,{png}" '
+            f'alt="Equation {i}" /></div>'
+        )
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    sections = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    documents = [build_html(index, sections) for index in range(count)]
+    megabytes = sum(len(html_text) for html_text in documents) / (1024 * 1024)
+    print(f"문서 {count}개, 문서당 섹션 {sections}개, HTML 합계 {megabytes:.1f} MB")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in DOCX_BACKENDS:
+            backend = get_docx_backend(name)
+            start = time.perf_counter()
+            try:
+                for index, html_text in enumerate(documents):
+                    backend.convert(html_text, os.path.join(tmp_dir, f"{name}_{index}.docx"))
+            except Exception as e:
+                print(f"{name:>13}: 사용 불가 ({str(e).splitlines()[0]})")
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"{name:>13}: {elapsed * 1000:.1f} ms ({elapsed * 1000 / count:.1f} ms/문서)")
+    close_docx_backends()
+
+
+if __name__ == "__main__":
+    main()
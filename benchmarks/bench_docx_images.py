@@ -0,0 +1,70 @@
+"""
+DOCX 이미지 전달 방식 벤치마크
+
+렌더링이 끝난 PNG(합성 이미지, 브라우저 불필요)를 Base64로 HTML에 임베딩하는 방식과
+임시 미디어 디렉토리에 저장하여 Pandoc --resource-path로 전달하는 방식의
+HTML 생성 + DOCX 변환 시간과 HTML 크기를 비교한다.
+
+사용법:
+    python benchmarks/bench_docx_images.py [이미지 개수] [이미지 한 변 픽셀]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_docx_backend import make_png  # noqa: E402
+from helper_md_doc.helper_html_doc import clean_html_for_pandoc  # noqa: E402
+from helper_md_doc.helper_md_doc import (  # noqa: E402
+    _html_to_docx,
+    _make_media_dir,
+    _remove_media_dir,
+)
+from helper_md_doc.helper_md_html import build_html, extract_render_jobs  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+
+    md_text = "# 이미지 벤치마크\n\n" + "".join(
+        f"## 다이어그램 {i}\n\n```mermaid\ngraph TD; A{i}-->B{i}\n```\n\n" for i in range(count)
+    )
+    body_text, jobs = extract_render_jobs(md_text)
+    png_list = [
+        make_png(size, size // 2, index) + index.to_bytes(4, "big") for index in range(count)
+    ]
+    megabytes = sum(len(png) for png in png_list) / (1024 * 1024)
+    print(f"이미지 {count}개, PNG 합계 {megabytes:.1f} MB")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for images in ("base64", "files"):
+            start = time.perf_counter()
+            media_dir = _make_media_dir() if images == "files" else None
+            try:
+                html_text = build_html(
+                    md_text,
+                    body_text,
+                    jobs,
+                    png_list,
+                    use_base64=media_dir is None,
+                    media_dir=media_dir,
+                )
+                html_text = clean_html_for_pandoc(html_text)
+                html_size = len(html_text.encode("utf-8")) / (1024 * 1024)
+                _html_to_docx(
+                    html_text, os.path.join(tmp_dir, f"{images}.docx"), media_dir=media_dir
+                )
+            finally:
+                _remove_media_dir(media_dir)
+            elapsed = time.perf_counter() - start
+            print(f"{images:>6}: {elapsed * 1000:.1f} ms, HTML {html_size:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
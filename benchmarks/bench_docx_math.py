@@ -0,0 +1,52 @@
+"""
+DOCX 수식 출력 방식 벤치마크
+
+수식이 많은 문서를 md_to_doc으로 변환할 때 KaTeX PNG 임베딩(math="image")과
+Pandoc OMML 변환(math="omml")의 전체 변환 시간과 DOCX 크기를 비교한다.
+
+사용법:
+    python benchmarks/bench_docx_math.py [수식 개수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_md_doc import md_to_doc  # noqa: E402
+
+
+def build_document(count: int) -> str:
+    """인라인/블록 수식이 섞인 Markdown 문서 생성"""
+    lines = ["# 수식 벤치마크", ""]
+    for i in range(count):
+        if i % 5 == 0:
+            lines += [f"$$\\sum_{{k=1}}^{{{i + 1}}} \\frac{{x_k^2}}{{k!}} = S_{{{i}}}$$", ""]
+        else:
+            lines += [f"문장 {i}: $\\alpha_{{{i}}} + \\sqrt{{\\beta^{{{i}}}}}$ 의 값", ""]
+    return "\n".join(lines)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        md_path = os.path.join(tmp_dir, "math.md")
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(build_document(count))
+
+        print(f"수식 개수: {count}")
+        for math in ("image", "omml"):
+            output_path = os.path.join(tmp_dir, f"math_{math}.docx")
+            start = time.perf_counter()
+            md_to_doc(md_path, output_path, math=math)
+            elapsed = time.perf_counter() - start
+            size_kb = os.path.getsize(output_path) / 1024
+            print(f"{math:>5}: {elapsed * 1000:.1f} ms, DOCX {size_kb:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+HTML 이미지 Base64 임베딩 벤치마크
+
+같은 로고/아이콘을 여러 번 참조하고 고유 이미지도 많은 HTML 문서에서
+기존 방식(참조마다 파일 읽기/인코딩)과 embed_images_as_base64
+(참조 중복 제거 + 병렬 읽기, 호출 간 캐시)를 비교한다.
+
+사용법:
+    python benchmarks/bench_embed_images.py [고유 이미지 수] [반복 참조 수] [이미지 KB]
+"""
+
+import base64
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_html_doc import (  # noqa: E402
+    clear_embed_cache,
+    embed_images_as_base64,
+)
+
+
+def legacy_embed(html_text: str, base_dir: str) -> str:
+    """기존 구현 (비교용): 참조마다 MIME 표 생성, 파일 읽기, 인코딩"""
+
+    def replace_img(match):
+        img_path = match.group(1)
+        if img_path.startswith("data:"):
+            return match.group(0)
+        full_path = os.path.normpath(os.path.join(base_dir, img_path))
+        if not os.path.isfile(full_path):
+            return match.group(0)
+        mime_map = {".png": "image/png", ".jpg": "image/jpeg", ".gif": "image/gif"}
+        mime_type = mime_map.get(os.path.splitext(full_path)[1].lower(), "image/png")
+        with open(full_path, "rb") as f:
+            img_data = base64.b64encode(f.read()).decode("utf-8")
+        return f'<img src="data:{mime_type};base64,{img_data}"'
+
+    return re.sub(r'<img src="([^"]+)"', replace_img, html_text)
+
+
+def build_fixture(base_dir: str, distinct: int, repeats: int, size_kb: int) -> str:
+    """고유 이미지 distinct개와 반복 참조되는 로고/아이콘으로 구성된 HTML 생성"""
+    for name in ("logo.png", "icon.png"):
+        with open(os.path.join(base_dir, name), "wb") as f:
+            f.write(os.urandom(size_kb * 1024))
+    parts = []
+    for index in range(distinct):
+        name = f"figure_{index:04d}.png"
+        with open(os.path.join(base_dir, name), "wb") as f:
+            f.write(os.urandom(size_kb * 1024))
+        parts.append(f'<p><img src="{name}" alt="figure {index}" /></p>')
+    for index in range(repeats):
+        parts.insert(index * len(parts) // max(1, repeats), '<img src="logo.png" />')
+        parts.append('<img src="icon.png" />')
+    return "<html><body>" + "\n".join(parts) + "</body></html>"
+
+
+def measure(func, repeat: int = 10) -> float:
+    """가장 빠른 실행 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    distinct = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    size_kb = int(sys.argv[3]) if len(sys.argv) > 3 else 64
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        html_text = build_fixture(base_dir, distinct, repeats, size_kb)
+        references = distinct + repeats * 2
+        print(f"고유 이미지 {distinct + 2}개, 참조 {references}개, 이미지당 {size_kb} KB")
+
+        def cold():
+            clear_embed_cache()
+            embed_images_as_base64(html_text, base_dir)
+
+        results = (
+            ("기존 방식", lambda: legacy_embed(html_text, base_dir)),
+            ("중복 제거 (캐시 없음)", lambda: embed_images_as_base64(html_text, base_dir, False)),
+            (
+                "중복 제거 + 병렬 읽기 4 (캐시 없음)",
+                lambda: embed_images_as_base64(html_text, base_dir, False, 4),
+            ),
+            ("중복 제거 + 캐시 (첫 호출)", cold),
+            ("캐시 재사용", lambda: embed_images_as_base64(html_text, base_dir)),
+        )
+        for name, func in results:
+            print(f"  {name}: {measure(func) * 1000:.1f} ms")
+        clear_embed_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Mermaid/LaTeX 추출 벤치마크
+
+수 MB 크기의 Markdown에서 단일 패스 스캐너(extract_render_jobs)와 기존 방식
+(Mermaid, $$, $ 순서의 re.sub 연쇄)의 추출 시간과 처리 속도(MB/s)를 비교한다.
+브라우저 렌더링은 포함하지 않는다.
+
+사용법:
+    python benchmarks/bench_extract.py [문서 크기 MB]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_md_html import (  # noqa: E402
+    RenderJob,
+    _add_job,
+    extract_render_jobs,
+    is_simple_text,
+)
+
+SECTION = """## 섹션 {i}
+
+본문 문장과 인라인 수식 $a_{{{i}}} + b^2$ 그리고 `code $x$ span` 이 섞여 있다.
+가격은 \\$5 이며 단순 수식 $n$ 도 있다.
+
+$$
+\\sum_{{k=1}}^{{{i}}} \\frac{{1}}{{k^2}}
+$$
+
+```python
+value = "$not_math$"
+```
+
+```mermaid
+graph TD; A{i}-->B{i}
+```
+
+- 항목 {i}
+- 항목 {i}+1
+
+"""
+
+PROSE_SECTION = (
+    "## 섹션 {i}\n\n"
+    + "일반 문단 텍스트가 길게 이어지는 본문이다. Markdown 문서의 대부분은 산문으로 구성된다. " * 8
+    + "\n\n수식 $x_{{{i}}}^2$ 한 개.\n\n"
+)
+
+
+def legacy_extract(md_text: str) -> Tuple[str, List[RenderJob]]:
+    """기존 re.sub 연쇄 방식 (비교용, 이전 extract_mermaid_jobs/extract_latex_jobs와 동일)"""
+    jobs: Dict[RenderJob, int] = {}
+
+    def replace_block(match):
+        return _add_job(jobs, RenderJob("mermaid", match.group(1).strip()))
+
+    def replace_math(display_mode):
+        def replace(match):
+            latex_code = match.group(1).strip()
+            if is_simple_text(latex_code):
+                return f"<code>{latex_code}</code>"
+            return _add_job(jobs, RenderJob("latex", latex_code, display_mode))
+
+        return replace
+
+    md_text = re.sub(r"```mermaid\n(.*?)```", replace_block, md_text, flags=re.DOTALL)
+    md_text = re.sub(r"\$\$(.*?)\$\$", replace_math(True), md_text, flags=re.DOTALL)
+    md_text = re.sub(r"(?<!\$)\$(?!\$)(.+?)(?<!\$)\$(?!\$)", replace_math(False), md_text)
+    return md_text, list(jobs)
+
+
+def measure(func, md_text: str, repeat: int = 3) -> float:
+    """가장 빠른 실행 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(md_text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_document(section: str, size_mb: float) -> str:
+    """섹션 템플릿을 반복하여 size_mb 크기 이상의 문서 생성"""
+    sections = []
+    total = 0
+    while total < size_mb * 1024 * 1024:
+        text = section.format(i=len(sections))
+        sections.append(text)
+        total += len(text.encode("utf-8"))
+    return "# 대용량 문서\n\n" + "".join(sections)
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+    for label, section in (("수식/코드 밀집", SECTION), ("산문 위주", PROSE_SECTION)):
+        md_text = build_document(section, size_mb)
+        megabytes = len(md_text.encode("utf-8")) / (1024 * 1024)
+        _, jobs = extract_render_jobs(md_text)
+        print(f"[{label}] 문서 크기: {megabytes:.1f} MB, 고유 렌더링 작업 {len(jobs)}개")
+
+        for name, func in (("단일 패스", extract_render_jobs), ("re.sub 연쇄", legacy_extract)):
+            elapsed = measure(func, md_text)
+            print(f"  {name}: {elapsed * 1000:.1f} ms ({megabytes / elapsed:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+렌더링 PNG 최적화 벤치마크
+
+흰 여백이 큰 RGBA 스크린샷(수식/다이어그램 대용, Pillow로 합성하여 브라우저 불필요)을
+optimize_png_list로 최적화할 때 스레드 수별 처리 시간, PNG 합계 크기, Pandoc DOCX 크기를
+비교한다. Pillow가 필요하다 (pip install helper-md-doc[image]).
+
+사용법:
+    python benchmarks/bench_image_optimize.py [이미지 개수]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from helper_md_doc.helper_html_doc import clean_html_for_pandoc  # noqa: E402
+from helper_md_doc.helper_image_optimize import (  # noqa: E402
+    OPTIMIZE_WORKERS,
+    ImageOptimizeOptions,
+    optimize_png_list,
+)
+from helper_md_doc.helper_md_doc import (  # noqa: E402
+    _html_to_docx,
+    _make_media_dir,
+    _remove_media_dir,
+)
+from helper_md_doc.helper_md_html import build_html, extract_render_jobs  # noqa: E402
+
+
+def make_screenshot(index: int) -> bytes:
+    """수식(무채색 텍스트)과 다이어그램(유채색 도형)을 번갈아 합성한 RGBA PNG"""
+    width, height = (720, 360) if index % 2 else (480, 120)
+    image = Image.new("RGBA", (width, height), (255, 255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    if index % 2:
+        for box in range(4):
+            left = 60 + box * 150
+            draw.rounded_rectangle(
+                (left, 120, left + 110, 200),
+                radius=8,
+                fill=(236, 236, 255),
+                outline=(147, 112, 219),
+            )
+            draw.text((left + 20, 150), f"Node {index}-{box}", fill=(51, 51, 51))
+            if box:
+                draw.line((left - 40, 160, left, 160), fill=(51, 51, 51), width=2)
+    else:
+        draw.text((40, 50), f"f_{index}(x) = sum_k a_k x^k + {index}", fill=(0, 0, 0))
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def docx_size(md_text: str, png_list, tmp_dir: str, name: str) -> int:
+    """렌더링 결과를 파일 미디어 디렉토리로 전달하여 만든 DOCX 크기 (바이트)"""
+    body_text, jobs = extract_render_jobs(md_text)
+    media_dir = _make_media_dir()
+    try:
+        html_text = build_html(md_text, body_text, jobs, png_list, media_dir=media_dir)
+        output_path = os.path.join(tmp_dir, f"{name}.docx")
+        _html_to_docx(clean_html_for_pandoc(html_text), output_path, media_dir=media_dir)
+    finally:
+        _remove_media_dir(media_dir)
+    return os.path.getsize(output_path)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    png_list = [make_screenshot(index) for index in range(count)]
+    original = sum(len(png) for png in png_list)
+    print(f"이미지 {count}개, PNG 합계 {original / 1024:.0f} KB")
+
+    options = ImageOptimizeOptions()
+    optimized = png_list
+    for workers in sorted({1, OPTIMIZE_WORKERS}):
+        start = time.perf_counter()
+        optimized, stats = optimize_png_list(png_list, options, workers)
+        elapsed = time.perf_counter() - start
+        print(
+            f"  스레드 {workers}: {elapsed * 1000:.1f} ms, "
+            f"{stats.optimized_bytes / 1024:.0f} KB ({stats.saved_bytes / original:.0%} 절감)"
+        )
+
+    md_text = "# 최적화 벤치마크\n\n" + "".join(
+        f"## 그림 {i}\n\n```mermaid\ngraph TD; A{i}-->B{i}\n```\n\n" for i in range(count)
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        try:
+            before = docx_size(md_text, png_list, tmp_dir, "original")
+            after = docx_size(md_text, optimized, tmp_dir, "optimized")
+        except (OSError, RuntimeError) as e:
+            print(f"  DOCX 크기 비교 생략 ({str(e).splitlines()[0]})")
+            return
+        print(f"  DOCX: {before / 1024:.0f} KB → {after / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
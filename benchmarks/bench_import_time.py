@@ -0,0 +1,47 @@
+"""
+패키지 임포트 시간 벤치마크
+
+새 인터프리터에서 `import helper_md_doc`에 걸리는 시간과, 임포트 직후
+무거운 의존성(playwright, pypandoc, markdown)이 로드되었는지 확인한다.
+
+사용법:
+    python benchmarks/bench_import_time.py [반복 횟수]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = str(Path(__file__).resolve().parents[1] / "src")
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+import helper_md_doc
+elapsed = time.perf_counter() - start
+heavy = [name for name in ("playwright", "pypandoc", "markdown") if name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    samples = []
+    heavy = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", PROBE.format(src=SRC_DIR)])
+        result = json.loads(output)
+        samples.append(result["elapsed"])
+        heavy = result["heavy"]
+
+    print(f"반복 횟수: {runs}")
+    print(f"import helper_md_doc 중앙값: {statistics.median(samples) * 1000:.1f} ms")
+    print(f"최소/최대: {min(samples) * 1000:.1f} / {max(samples) * 1000:.1f} ms")
+    print(f"임포트 직후 로드된 무거운 의존성: {heavy or '없음'}")
+
+
+if __name__ == "__main__":
+    main()
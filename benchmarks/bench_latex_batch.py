@@ -0,0 +1,58 @@
+"""
+KaTeX 일괄 렌더링 벤치마크
+
+단일 페이지 일괄 렌더링(render_latex_batch)과 수식별 호출(render_latex_base64)의
+수식당 평균 렌더링 시간을 비교한다.
+
+사용법:
+    python benchmarks/bench_latex_batch.py [수식 개수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_md_html import (  # noqa: E402
+    _cleanup_browser,
+    _get_katex_page,
+    render_latex_base64,
+    render_latex_batch,
+)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    items = [
+        (f"\\frac{{a_{{{i}}}}}{{b^{{{i}}}}} + \\sqrt{{x_{i}}}", i % 5 == 0) for i in range(count)
+    ]
+
+    # 브라우저 기동 및 KaTeX 로드 비용은 측정에서 제외
+    start = time.perf_counter()
+    _get_katex_page()
+    warmup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render_latex_batch(items)
+    batch_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for code, display_mode in items:
+        render_latex_base64(code, display_mode=display_mode)
+    single_elapsed = time.perf_counter() - start
+
+    _cleanup_browser()
+
+    print(f"수식 개수: {count}")
+    print(f"브라우저/KaTeX 준비: {warmup * 1000:.1f} ms")
+    print(
+        f"일괄 렌더링: {batch_elapsed * 1000:.1f} ms ({batch_elapsed / count * 1000:.2f} ms/수식)"
+    )
+    print(
+        f"개별 렌더링: {single_elapsed * 1000:.1f} ms ({single_elapsed / count * 1000:.2f} ms/수식)"
+    )
+
+
+if __name__ == "__main__":
+    main()
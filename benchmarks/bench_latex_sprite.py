@@ -0,0 +1,51 @@
+"""
+KaTeX 스프라이트 렌더링 벤치마크
+
+인라인 수식이 많은 문서에서 스프라이트 렌더링(격자 배치 + 띠 스크린샷 분할),
+요소별 스크린샷 일괄 렌더링, 수식별 호출(render_latex_base64)의 처리량을 비교한다.
+스프라이트 분할에는 Pillow가 필요하다.
+
+사용법:
+    python benchmarks/bench_latex_sprite.py [인라인 수식 개수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_md_html import (  # noqa: E402
+    _cleanup_browser,
+    _get_katex_page,
+    render_latex_base64,
+    render_latex_batch,
+)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    items = [(f"x_{{{i}}}^2 + \\alpha_{{{i % 7}}}", False) for i in range(count)]
+
+    # 브라우저 기동 및 KaTeX 로드 비용은 측정에서 제외
+    _get_katex_page()
+
+    results = []
+    for name, func in (
+        ("스프라이트", lambda: render_latex_batch(items, sprite=True)),
+        ("요소별 스크린샷", lambda: render_latex_batch(items, sprite=False)),
+        ("수식별 호출", lambda: [render_latex_base64(code) for code, _ in items]),
+    ):
+        start = time.perf_counter()
+        func()
+        results.append((name, time.perf_counter() - start))
+
+    _cleanup_browser()
+
+    print(f"인라인 수식 개수: {count}")
+    for name, elapsed in results:
+        print(f"{name}: {elapsed * 1000:.1f} ms ({count / elapsed:.0f} 수식/초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+수식 빠른 경로 벤치마크
+
+단순한 인라인 수식(첨자, 그리스 문자, 연산자) 여러 개(기본 200개)를
+latex_to_html(브라우저 없음)로 변환하는 시간과 render_latex_batch(KaTeX 스크린샷)로
+렌더링하는 시간의 수식당 비용을 비교한다. Chromium이 없으면 빠른 경로만 측정한다.
+
+사용법:
+    python benchmarks/bench_math_fast.py [수식 개수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_math_fast import latex_to_html  # noqa: E402
+from helper_md_doc.helper_md_html import _cleanup_browser, render_latex_batch  # noqa: E402
+
+
+def make_codes(count: int):
+    """서로 다른 단순 수식 count개"""
+    templates = ("x_{%d}^2", r"\alpha_%d + \beta", "E_%d = mc^2", r"a_{n+%d} \leq b_n")
+    return [templates[i % len(templates)] % i for i in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    codes = make_codes(count)
+
+    start = time.perf_counter()
+    handled = sum(latex_to_html(code) is not None for code in codes)
+    fast = time.perf_counter() - start
+    print(f"수식 개수: {count} (빠른 경로 처리 {handled}개)")
+    print(f"빠른 경로: {fast * 1000:.2f} ms (수식당 {fast / count * 1e6:.1f} us)")
+
+    try:
+        start = time.perf_counter()
+        render_latex_batch([(code, False) for code in codes])
+        browser = time.perf_counter() - start
+    except Exception as e:
+        print(f"브라우저 렌더링 측정 생략: {e}")
+        return
+    finally:
+        _cleanup_browser()
+    print(
+        f"브라우저 렌더링 (기동 포함): {browser * 1000:.1f} ms (수식당 {browser / count * 1000:.2f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
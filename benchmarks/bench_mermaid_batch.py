@@ -0,0 +1,61 @@
+"""
+Mermaid 일괄 렌더링 벤치마크
+
+다이어그램이 많은 문서(기본 60개)에서 render_mermaid_batch(한 번의 page.evaluate +
+다이어그램별 clip 스크린샷)와 다이어그램별 render_mermaid_png 호출의
+다이어그램당 비용을 비교한다.
+
+사용법:
+    python benchmarks/bench_mermaid_batch.py [다이어그램 개수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_md_html import (  # noqa: E402
+    _cleanup_browser,
+    _get_browser_page,
+    render_mermaid_batch,
+    render_mermaid_png,
+)
+
+
+def make_codes(count: int):
+    """흐름도/시퀀스 다이어그램을 섞은 count개의 서로 다른 Mermaid 코드"""
+    codes = []
+    for i in range(count):
+        if i % 2:
+            codes.append(f"sequenceDiagram\n    A{i}->>B: 요청 {i}\n    B-->>A{i}: 응답")
+        else:
+            codes.append(f"graph TD\n    S{i}[시작] --> C{{조건 {i}}}\n    C --> E[끝]")
+    return codes
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    codes = make_codes(count)
+
+    # 브라우저 기동 및 mermaid.min.js 로드 비용은 측정에서 제외
+    _get_browser_page()
+
+    results = []
+    for name, func in (
+        ("일괄 렌더링", lambda: render_mermaid_batch(codes)),
+        ("다이어그램별 호출", lambda: [render_mermaid_png(code) for code in codes]),
+    ):
+        start = time.perf_counter()
+        func()
+        results.append((name, time.perf_counter() - start))
+
+    _cleanup_browser()
+
+    print(f"Mermaid 다이어그램 개수: {count}")
+    for name, elapsed in results:
+        print(f"{name}: {elapsed * 1000:.1f} ms (다이어그램당 {elapsed / count * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+RenderSession 벤치마크
+
+짧은 Markdown 문서(Mermaid 1개, 수식 1개)를 여러 번 DOCX로 변환할 때
+세션 없이 호출(md_to_doc마다 Chromium 기동/종료)하는 방식과
+RenderSession 하나를 재사용하는 방식의 문서당 시간을 비교한다.
+렌더 캐시는 매 변환 비우고, DOCX 변환은 native 백엔드를 사용한다.
+
+사용법:
+    python benchmarks/bench_render_session.py [문서 수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_md_doc import md_to_doc  # noqa: E402
+from helper_md_doc.helper_md_html import RenderSession  # noqa: E402
+from helper_md_doc.helper_render_cache import RenderCache  # noqa: E402
+
+
+def convert_all(tmp_dir: str, count: int, session=None) -> float:
+    """count개 문서 변환 시간 (초)"""
+    start = time.perf_counter()
+    for index in range(count):
+        md_path = os.path.join(tmp_dir, f"doc{index}.md")
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write(f"# 문서 {index}\n\n```mermaid\ngraph TD; A{index}-->B\n```\n\n$x_{index}$\n")
+        md_to_doc(
+            md_path,
+            md_path[:-3] + ".docx",
+            cache=RenderCache(os.path.join(tmp_dir, f"cache-{session is not None}-{index}")),
+            backend="native",
+            session=session,
+        )
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        without_session = convert_all(tmp_dir, count)
+        with RenderSession() as session:
+            with_session = convert_all(tmp_dir, count, session)
+
+    print(f"문서 {count}개 (문서당 평균)")
+    print(f"  세션 없음 (매번 Chromium 기동): {without_session / count * 1000:.0f} ms")
+    print(f"  RenderSession 재사용: {with_session / count * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
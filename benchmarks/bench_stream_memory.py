@@ -0,0 +1,71 @@
+"""
+스트리밍 HTML 출력 메모리 벤치마크
+
+큰 Base64 이미지가 많은 문서에서 build_html(문자열 생성)과 write_html(파일 객체에
+점진적 기록)의 최대 메모리 사용량(tracemalloc)과 소요 시간을 비교한다.
+렌더링 결과는 임의 바이트 파일로 대신하므로 브라우저가 필요 없다.
+
+사용법:
+    python benchmarks/bench_stream_memory.py [이미지 개수] [이미지 크기 KB]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from helper_md_doc.helper_md_html import (  # noqa: E402
+    build_html,
+    extract_render_jobs,
+    write_html,
+)
+
+
+def measure(func) -> tuple:
+    """(최대 메모리 MB, 소요 시간 초)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024), elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    size_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    md_text = "# 대용량 문서\n\n" + "".join(
+        f"## 섹션 {i}\n\n본문 {i}\n\n$$x_{{{i}}}^2$$\n\n" for i in range(count)
+    )
+    body_text, jobs = extract_render_jobs(md_text)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for index in range(len(jobs)):
+            path = os.path.join(tmp_dir, f"{index:06d}.bin")
+            with open(path, "wb") as f:
+                f.write(os.urandom(size_kb * 1024))
+            paths.append(path)
+
+        def to_string():
+            build_html(md_text, body_text, jobs, paths, use_base64=True)
+
+        def to_file():
+            with open(os.path.join(tmp_dir, "out.html"), "w", encoding="utf-8") as f:
+                write_html(f, md_text, body_text, jobs, paths, use_base64=True)
+
+        total_mb = count * size_kb / 1024
+        print(f"이미지 {count}개 x {size_kb} KB (합계 {total_mb:.1f} MB)")
+        for name, func in (("build_html", to_string), ("write_html", to_file)):
+            peak, elapsed = measure(func)
+            print(f"{name}: 최대 메모리 {peak:.1f} MB, {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ Markdown/HTML을 DOCX로 변환하는 문서 변환 라이브러리
 - Markdown → DOCX 직접 변환
 - Playwright 기반 Mermaid/KaTeX 렌더링
 - Base64 인코딩 또는 파일 기반 이미지 처리
+- playwright.async_api 기반 비동기 API (amd_to_html, amd_to_doc, ahtml_to_doc)
 
 기본 사용법:
     from helper_md_doc import md_to_html, html_to_doc, md_to_doc
@@ -17,40 +18,127 @@ Markdown/HTML을 DOCX로 변환하는 문서 변환 라이브러리
     # Markdown → HTML
     html = md_to_html(md_text, title="문서 제목")
 
+    # 대용량 문서: 파일 객체에 점진적으로 기록 (Base64 이미지를 청크 단위로 인코딩)
+    with open("output.html", "w", encoding="utf-8") as f:
+        md_to_html_stream(md_text, f, use_base64=True)
+
     # HTML → DOCX
     html_to_doc("input.html", "output.docx")
 
     # Markdown → DOCX (원스텝)
     md_to_doc("input.md", "output.docx")
+
+    # HTML과 DOCX를 렌더링 한 번으로 동시 출력 (CLI: md2doc input.md --html out.html --docx out.docx)
+    md_to_targets("input.md", html_path="output.html", docx_path="output.docx")
+
+    # 의존성 확인 (명시적 호출, CLI: md2doc check)
+    import helper_md_doc
+    helper_md_doc.check()
+
+    # asyncio 환경 (이벤트 루프 차단 없음)
+    html = await amd_to_html(md_text)
+    await amd_to_doc("input.md", "output.docx")
+
+    # 렌더링 PNG 여백 제거/색상 축소/재압축 (pip install helper-md-doc[image])
+    md_to_doc("input.md", "output.docx", optimize_images=ImageOptimizeOptions())
+
+    # 상주 렌더링 데몬 사용 (CLI: --daemon, 환경 변수 HELPER_MD_DOC_DAEMON=1)
+    set_render_daemon(RenderDaemonClient())
+
+    # 여러 문서 변환 시 브라우저 재사용 (세션 종료 시 정리)
+    with RenderSession() as session:
+        for md_path in md_paths:
+            md_to_doc(md_path, md_path[:-3] + ".docx", session=session)
+
+    # 단순한 수식은 브라우저 없이 텍스트(아래/위 첨자)로, 나머지만 렌더링 (CLI: --math fast)
+    md_to_doc("input.md", "output.docx", math="fast")
+
+    # 로컬 HTTP 변환 서버 (CLI: md2doc serve, POST /convert, GET /stats)
+    with ConversionServer(port=8765) as server:
+        ...
+
+    # 단계별 소요 시간/횟수/바이트 기록 (CLI: --profile [PATH])
+    profile = ConversionProfile()
+    md_to_doc("input.md", "output.docx", profile=profile)
+    print(profile.to_json())
 """
 
 __version__ = "0.5.5"
 
-import os
 import sys
+import importlib
 from pathlib import Path
-import importlib.util
 
 _project_root = Path(__file__).resolve().parents[1]
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-spec = importlib.util.spec_from_file_location(
-    "requirements_rnac", os.path.join(os.path.dirname(__file__), "requirements_rnac.py")
-)
-requirements_rnac = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(requirements_rnac)
-requirements_rnac.check_and_print_dependencies()
+# 공개 API → 정의 모듈 (첫 접근 시 임포트하여 패키지 임포트를 가볍게 유지)
+_LAZY_EXPORTS = {
+    "md_to_html": "helper_md_doc.helper_md_html",
+    "md_to_html_stream": "helper_md_doc.helper_md_html",
+    "RenderSession": "helper_md_doc.helper_md_html",
+    "html_to_doc": "helper_md_doc.helper_html_doc",
+    "clean_html_for_pandoc": "helper_md_doc.helper_html_doc",
+    "embed_images_as_base64": "helper_md_doc.helper_html_doc",
+    "md_to_doc": "helper_md_doc.helper_md_doc",
+    "md_to_targets": "helper_md_doc.helper_md_doc",
+    "amd_to_html": "helper_md_doc.helper_md_async",
+    "amd_to_doc": "helper_md_doc.helper_md_async",
+    "ahtml_to_doc": "helper_md_doc.helper_md_async",
+    "ImageOptimizeOptions": "helper_md_doc.helper_image_optimize",
+    "optimize_png": "helper_md_doc.helper_image_optimize",
+    "ConversionProfile": "helper_md_doc.helper_profile",
+    "ConversionServer": "helper_md_doc.helper_serve",
+    "RenderDaemonClient": "helper_md_doc.helper_render_daemon",
+    "set_render_daemon": "helper_md_doc.helper_render_daemon",
+    "RenderCache": "helper_md_doc.helper_render_cache",
+    "get_render_cache": "helper_md_doc.helper_render_cache",
+    "set_render_cache": "helper_md_doc.helper_render_cache",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
+
+def check(install: bool = False) -> None:
+    """필요한 의존성 라이브러리 확인 (패키지 임포트 시에는 실행되지 않음)
+
+    Args:
+        install: True면 누락된 패키지와 Playwright 브라우저를 대화형으로 설치,
+            False면 누락된 패키지 목록을 ImportError로 알림
+    """
+    from helper_md_doc import requirements_rnac
+
+    if install:
+        requirements_rnac.check_and_install_dependencies()
+    else:
+        requirements_rnac.check_and_print_dependencies()
 
-from helper_md_doc.helper_md_html import md_to_html
-from helper_md_doc.helper_html_doc import html_to_doc, clean_html_for_pandoc, embed_images_as_base64
-from helper_md_doc.helper_md_doc import md_to_doc
 
 __all__ = [
     "md_to_html",
+    "md_to_html_stream",
     "html_to_doc",
     "md_to_doc",
+    "amd_to_html",
+    "amd_to_doc",
+    "ahtml_to_doc",
     "clean_html_for_pandoc",
     "embed_images_as_base64",
+    "RenderCache",
+    "get_render_cache",
+    "set_render_cache",
+    "check",
     "__version__",
 ]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, Optional
+
+from helper_md_doc import __version__
+from helper_md_doc.helper_docx_backend import local_image_path
+
+# 출력 디렉토리에 저장되는 빌드 매니페스트 파일 이름
+MANIFEST_NAME = ".helper_md_doc_manifest.json"
+
+# 출력에 포함되는 로컬 이미지 참조: Markdown 인라인 이미지 ![alt](path "title")와 <img src="path">
+_IMAGE_REF_RE = re.compile(
+    r"!\[[^\]]*\]\(\s*<?([^)\s>]+)|<img\s[^>]*?\bsrc\s*=\s*[\"']([^\"']+)[\"']",
+    re.IGNORECASE,
+)
+
+
+def hash_file(path: str) -> str:
+    """파일 내용의 SHA-256 해시 반환"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_images(md_text: str, base_dir: str) -> Dict[str, Optional[str]]:
+    """Markdown이 참조하는 로컬 이미지 파일별 SHA-256 해시 (없는 파일은 None)
+
+    참조 방식 링크(![alt][id])와 URL/data URI 이미지는 추적하지 않는다.
+
+    Args:
+        md_text: Markdown 텍스트
+        base_dir: 상대 경로 이미지의 기준 디렉토리 (Markdown 파일 디렉토리)
+
+    Returns:
+        {이미지 절대 경로: 해시 또는 None}
+    """
+    hashes: Dict[str, Optional[str]] = {}
+    for match in _IMAGE_REF_RE.finditer(md_text):
+        path = local_image_path(match.group(1) or match.group(2), base_dir)
+        if path is None:
+            continue
+        path = os.path.abspath(path)
+        if path not in hashes:
+            hashes[path] = hash_file(path) if os.path.isfile(path) else None
+    return hashes
+
+
+def hash_options(options: Dict[str, Any]) -> str:
+    """출력 결과에 영향을 주는 변환 옵션의 SHA-256 해시 반환"""
+    payload = json.dumps(options, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """make 방식 증분 빌드를 위한 변환 기록 (입력 해시, 옵션 해시, 패키지 버전, 출력 경로)
+
+    출력 파일의 절대 경로를 키로 마지막 변환 정보를 저장하고, 입력/옵션/버전과
+    입력이 참조하는 로컬 이미지(hash_images)가 모두 같고 출력 파일이 존재하면
+    변환을 건너뛸 수 있다고 판단한다.
+    매니페스트 파일이 손상되었거나 읽을 수 없으면 빈 매니페스트로 시작한다 (전체 재변환).
+
+    Args:
+        path: 매니페스트 JSON 파일 경로
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)
+                if not isinstance(entries, dict):
+                    raise ValueError("JSON 객체가 아님")
+                self.entries = entries
+            except (OSError, ValueError) as e:
+                logging.warning(f"빌드 매니페스트 손상, 무시하고 전체 변환: {self.path} ({e})")
+
+    @classmethod
+    def for_output(cls, output_path: str) -> "BuildManifest":
+        """출력 파일과 같은 디렉토리의 매니페스트 로드"""
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        return cls(os.path.join(output_dir, MANIFEST_NAME))
+
+    def _entry(self, input_path: str, output_path: str, options: Dict[str, Any]):
+        with open(input_path, "rb") as f:
+            data = f.read()
+        base_dir = os.path.dirname(os.path.abspath(input_path))
+        return {
+            "input_path": os.path.abspath(input_path),
+            "input_hash": hashlib.sha256(data).hexdigest(),
+            "images": hash_images(data.decode("utf-8", errors="replace"), base_dir),
+            "options_hash": hash_options(options),
+            "version": __version__,
+        }
+
+    def is_up_to_date(self, input_path: str, output_path: str, options: Dict[str, Any]) -> bool:
+        """이전 변환 이후 입력/참조 이미지/옵션/패키지 버전이 바뀌지 않았는지 확인
+
+        Args:
+            input_path: 입력 파일 경로
+            output_path: 출력 파일 경로
+            options: 출력에 영향을 주는 변환 옵션
+
+        Returns:
+            True면 변환 생략 가능
+        """
+        key = os.path.abspath(output_path)
+        if not os.path.isfile(key) or key not in self.entries:
+            return False
+        return self.entries[key] == self._entry(input_path, output_path, options)
+
+    def record(self, input_path: str, output_path: str, options: Dict[str, Any]) -> None:
+        """변환 완료 기록 (save 호출 시 파일에 저장)"""
+        key = os.path.abspath(output_path)
+        self.entries[key] = self._entry(input_path, output_path, options)
+
+    def save(self) -> None:
+        """매니페스트를 원자적으로 파일에 저장"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        logging.debug(f"빌드 매니페스트 저장: {self.path}")
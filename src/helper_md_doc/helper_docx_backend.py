@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import atexit
+import base64
+import json
+import logging
+import os
+import re
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from urllib.parse import unquote
+from typing import IO, Dict, Optional, Tuple
+
+# HTML -> DOCX 변환 백엔드
+#   pandoc: 문서마다 pandoc 프로세스 실행 (pypandoc.convert_text, 기본값)
+#   pandoc-server: 상주하는 `pandoc server` 프로세스에 HTTP로 요청 (프로세스 시작 비용 제거)
+#   native: python-docx로 프로세스 없이 직접 DOCX 생성 (선택 의존성, 수식은 이미지만 지원)
+DOCX_BACKENDS = ("pandoc", "pandoc-server", "native")
+
+# 백엔드에 이미지를 전달하는 방식
+#   files: 이미지 파일을 미디어 디렉토리에 두고 경로로 참조 (Pandoc --resource-path, 기본값)
+#   base64: data URI로 HTML에 임베딩 (HTML 크기 33% 증가, Pandoc이 다시 디코딩)
+DOCX_IMAGE_MODES = ("files", "base64")
+
+# pandoc server 시작 대기 시간과 요청별 변환 제한 시간 (초)
+PANDOC_SERVER_START_TIMEOUT = 10.0
+PANDOC_SERVER_TIMEOUT = 120
+
+_IMG_SRC_RE = re.compile(r'(<img\b[^>]*?\bsrc=")([^"]+)(")')
+_DATA_URI_RE = re.compile(r"data:image/([\w.+-]+);base64,(.*)", re.DOTALL)
+
+
+class DocxBackend(ABC):
+    """HTML 문자열을 DOCX 파일로 변환하는 백엔드 인터페이스"""
+
+    name = ""
+
+    @abstractmethod
+    def convert(
+        self,
+        html_text: str,
+        output_path: str,
+        input_format: str = "html",
+        resource_dir: Optional[str] = None,
+    ) -> None:
+        """HTML 문자열을 DOCX 파일로 변환
+
+        Args:
+            html_text: 입력 HTML 문자열 (이미지는 data URI 또는 파일 경로)
+            output_path: 출력 DOCX 파일 경로
+            input_format: Pandoc 입력 형식 ("html" 또는 "html+tex_math_single_backslash")
+            resource_dir: 상대 경로 이미지의 기준 디렉토리 (None이면 현재 디렉토리)
+        """
+
+    def warm(self) -> None:
+        """첫 변환 전에 필요한 프로세스 등을 미리 준비 (기본은 아무것도 하지 않음)"""
+
+    def close(self) -> None:
+        """백엔드가 점유한 프로세스 등 리소스 정리"""
+
+
+class PandocBackend(DocxBackend):
+    """문서마다 pandoc 프로세스를 실행하는 기존 변환 방식"""
+
+    name = "pandoc"
+
+    def convert(
+        self,
+        html_text: str,
+        output_path: str,
+        input_format: str = "html",
+        resource_dir: Optional[str] = None,
+    ) -> None:
+        import pypandoc
+
+        extra_args = ["--standalone"]
+        if resource_dir is not None:
+            extra_args += ["--resource-path", resource_dir]
+        pypandoc.convert_text(
+            html_text, "docx", format=input_format, outputfile=output_path, extra_args=extra_args
+        )
+
+
+def local_image_path(src: str, resource_dir: Optional[str] = None) -> Optional[str]:
+    """img src가 로컬 파일을 가리키면 resource_dir 기준으로 해석한 경로 (URL, data URI는 None)"""
+    if src.startswith("data:") or "://" in src:
+        return None
+    path = unquote(src)
+    if resource_dir is not None and not os.path.isabs(path):
+        path = os.path.join(resource_dir, path)
+    return path
+
+
+def _collect_media(
+    html_text: str, resource_dir: Optional[str] = None
+) -> Tuple[str, Dict[str, str]]:
+    """data URI와 로컬 이미지 파일을 pandoc server의 files(미디어백) 항목으로 분리
+
+    pandoc server는 샌드박스로 실행되어 파일 시스템을 읽지 않으므로 이미지를
+    요청의 파일 항목으로 전달하고 HTML에는 미디어백 경로만 남긴다.
+    같은 이미지는 한 번만 전달한다.
+
+    Returns:
+        (이미지 경로가 미디어백 경로로 치환된 HTML, {경로: Base64 내용})
+    """
+    files: Dict[str, str] = {}
+    names: Dict[str, str] = {}
+
+    def add(identity: str, extension: str, load) -> Optional[str]:
+        name = names.get(identity)
+        if name is None:
+            data = load()
+            if data is None:
+                return None
+            name = f"media/image{len(names) + 1}{extension}"
+            names[identity] = name
+            files[name] = data
+        return name
+
+    def read_file(path: str) -> Optional[str]:
+        if not os.path.isfile(path):
+            logging.warning(f"이미지 파일 없음: {path}")
+            return None
+        with open(path, "rb") as f:
+            return base64.b64encode(f.read()).decode("ascii")
+
+    def replace(match):
+        src = match.group(2)
+        data_match = _DATA_URI_RE.match(src)
+        if data_match:
+            subtype, data = data_match.groups()
+            extension = ".svg" if subtype.startswith("svg") else f".{subtype}"
+            name = add(data, extension, lambda: data)
+        else:
+            path = local_image_path(src, resource_dir)
+            if path is None:
+                return match.group(0)
+            extension = os.path.splitext(path)[1].lower()
+            name = add(os.path.abspath(path), extension, lambda: read_file(path))
+        if name is None:
+            return match.group(0)
+        return f"{match.group(1)}{name}{match.group(3)}"
+
+    return _IMG_SRC_RE.sub(replace, html_text), files
+
+
+def _free_port() -> int:
+    """사용 가능한 localhost TCP 포트 번호"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class PandocServerBackend(DocxBackend):
+    """localhost에 상주하는 `pandoc server` 프로세스로 변환하는 백엔드
+
+    첫 변환 시 서버를 시작하고 이후 요청은 HTTP로 처리하여 문서마다
+    pandoc 프로세스를 새로 실행하는 비용을 없앤다. 서버는 close() 또는
+    인터프리터 종료 시 정리된다. 스레드에서 동시에 호출해도 안전하다.
+
+    Args:
+        port: 서버 포트 (None이면 빈 포트 자동 선택)
+        timeout: 요청별 변환 제한 시간 (초)
+    """
+
+    name = "pandoc-server"
+
+    def __init__(self, port: Optional[int] = None, timeout: int = PANDOC_SERVER_TIMEOUT):
+        self.port = port
+        self.timeout = timeout
+        self.process: Optional[subprocess.Popen] = None
+        self._log: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+        # 서버를 다시 시작해도 종료 시 정리 함수는 한 번만 등록
+        atexit.register(self.close)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/"
+
+    def _server_log(self) -> str:
+        """pandoc server 표준 오류 출력의 마지막 부분 (오류 메시지 첨부용)"""
+        if self._log is None:
+            return ""
+        self._log.seek(0)
+        return self._log.read().decode("utf-8", "replace").strip()[-2000:]
+
+    def _start(self) -> None:
+        """pandoc server 프로세스를 시작하고 연결을 받을 때까지 대기"""
+        import pypandoc
+
+        self.port = self.port or _free_port()
+        command = [
+            pypandoc.get_pandoc_path(),
+            "server",
+            "--port",
+            str(self.port),
+            "--timeout",
+            str(self.timeout),
+        ]
+        logging.debug(f"pandoc server 시작: {' '.join(command)}")
+        # 표준 오류는 파이프 대신 임시 파일로 받아 버퍼가 차서 서버가 멈추는 일을 방지
+        self._log = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=self._log)
+
+        deadline = time.monotonic() + PANDOC_SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                self.process = None
+                raise RuntimeError(f"pandoc server 시작 실패: {self._server_log()}")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.5):
+                    return
+            except OSError:
+                time.sleep(0.05)
+        self.close()
+        raise RuntimeError(f"pandoc server 시작 시간 초과: {self.url}")
+
+    def _post(self, payload: dict) -> bytes:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Accept": "application/octet-stream"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout + 5) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            message = e.read().decode("utf-8", "replace").strip()
+            raise RuntimeError(f"pandoc server 변환 실패 ({e.code}): {message}") from e
+        except (urllib.error.URLError, ConnectionError) as e:
+            # 연결이 끊기면 pandoc server의 오류 출력을 함께 전달
+            raise RuntimeError(f"pandoc server 요청 실패: {e}\n{self._server_log()}") from e
+
+    def warm(self) -> None:
+        """pandoc server가 실행 중이 아니면 시작"""
+        with self._lock:
+            if self.process is None or self.process.poll() is not None:
+                self._start()
+
+    def convert(
+        self,
+        html_text: str,
+        output_path: str,
+        input_format: str = "html",
+        resource_dir: Optional[str] = None,
+    ) -> None:
+        self.warm()
+
+        html_text, files = _collect_media(html_text, resource_dir)
+        payload = {
+            "text": html_text,
+            "from": input_format,
+            "to": "docx",
+            "standalone": True,
+            "files": files,
+        }
+        docx_bytes = self._post(payload)
+        with open(output_path, "wb") as f:
+            f.write(docx_bytes)
+
+    def close(self) -> None:
+        process, self.process = self.process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        log, self._log = self._log, None
+        if log is not None:
+            log.close()
+
+
+class NativeDocxBackend(DocxBackend):
+    """python-docx로 프로세스 실행 없이 DOCX를 직접 생성하는 백엔드
+
+    제목, 문단, 강조/코드 서식, 목록, 코드 블록, 인용, 표, 이미지를 지원한다.
+    TeX 수식 입력(math="omml")은 Pandoc 백엔드가 필요하다.
+    """
+
+    name = "native"
+
+    def convert(
+        self,
+        html_text: str,
+        output_path: str,
+        input_format: str = "html",
+        resource_dir: Optional[str] = None,
+    ) -> None:
+        if input_format != "html":
+            raise ValueError(f"native 백엔드는 {input_format} 입력을 지원하지 않습니다")
+        from helper_md_doc.helper_docx_native import html_to_docx_native
+
+        html_to_docx_native(html_text, output_path, resource_dir)
+
+
+_BACKEND_CLASSES = {
+    "pandoc": PandocBackend,
+    "pandoc-server": PandocServerBackend,
+    "native": NativeDocxBackend,
+}
+
+_backends: Dict[str, DocxBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def check_docx_backend(name: str) -> None:
+    """지원하지 않는 DOCX 백엔드 이름이면 ValueError"""
+    if name not in DOCX_BACKENDS:
+        raise ValueError(f"지원하지 않는 DOCX 백엔드: {name} (가능: {', '.join(DOCX_BACKENDS)})")
+
+
+def check_docx_image_mode(images: str) -> None:
+    """지원하지 않는 이미지 전달 방식이면 ValueError"""
+    if images not in DOCX_IMAGE_MODES:
+        raise ValueError(
+            f"지원하지 않는 이미지 전달 방식: {images} (가능: {', '.join(DOCX_IMAGE_MODES)})"
+        )
+
+
+def get_docx_backend(name: str = "pandoc") -> DocxBackend:
+    """이름에 해당하는 프로세스 공용 DOCX 백엔드 반환 (pandoc-server는 서버를 재사용)
+
+    Args:
+        name: DOCX_BACKENDS 중 하나
+
+    Returns:
+        DocxBackend 인스턴스
+    """
+    check_docx_backend(name)
+    with _backends_lock:
+        backend = _backends.get(name)
+        if backend is None:
+            backend = _backends[name] = _BACKEND_CLASSES[name]()
+        return backend
+
+
+def close_docx_backends() -> None:
+    """공용 DOCX 백엔드 리소스 정리 (pandoc server 종료)"""
+    with _backends_lock:
+        backends = list(_backends.values())
+        _backends.clear()
+    for backend in backends:
+        backend.close()
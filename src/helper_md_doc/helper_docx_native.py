@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import base64
+import io
+import logging
+import os
+import re
+from html.parser import HTMLParser
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from helper_md_doc.helper_docx_backend import local_image_path
+
+# python-docx는 native 백엔드 사용 시점에 임포트 (선택 의존성: pip install helper-md-doc[native])
+if TYPE_CHECKING:
+    from docx.document import Document
+    from docx.text.paragraph import Paragraph
+
+# 코드 스팬/코드 블록 글꼴
+CODE_FONT = "Consolas"
+
+# 해상도 정보가 없는 이미지의 기준 DPI (Pandoc --dpi 기본값과 동일)
+DEFAULT_IMAGE_DPI = 96
+
+# 용지 크기/여백이 지정되지 않은 섹션의 본문 너비 (EMU, Letter 용지에서 좌우 여백 1인치 제외)
+DEFAULT_TEXT_WIDTH = 6 * 914400
+
+_INLINE_FORMATS = {
+    "b": "bold",
+    "strong": "bold",
+    "i": "italic",
+    "em": "italic",
+    "u": "underline",
+    "ins": "underline",
+    "s": "strike",
+    "del": "strike",
+    "strike": "strike",
+    "code": "code",
+    "kbd": "code",
+    "samp": "code",
+    "sub": "subscript",
+    "sup": "superscript",
+}
+_HEADINGS = {f"h{level}": level for level in range(1, 7)}
+_SKIPPED = ("head", "script", "style", "title")
+_ALIGN_RE = re.compile(r"text-align\s*:\s*(left|center|right|justify)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# 표 셀 내용 조각: 텍스트 또는 이미지(<img> 속성)
+_CellPart = Union[str, Dict[str, Optional[str]]]
+
+
+def _read_image_source(src: str, resource_dir: Optional[str] = None) -> Optional[bytes]:
+    """img src(data URI 또는 로컬 파일 경로)의 이미지 바이트 (읽을 수 없으면 None)"""
+    if src.startswith("data:"):
+        header, _, data = src.partition(",")
+        return base64.b64decode(data) if header.endswith(";base64") else None
+    path = local_image_path(src, resource_dir)
+    if path is None or not os.path.isfile(path):
+        logging.warning(f"이미지 파일 없음: {path or src}")
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _image_dpi(image, blob: bytes) -> int:
+    """이미지 가로 DPI (python-docx가 정보 없음을 72로 보고하면 DEFAULT_IMAGE_DPI)"""
+    dpi = image.horz_dpi
+    if dpi == 72 and blob.startswith(b"\x89PNG"):
+        # PNG는 이미지 데이터(IDAT) 앞에 pHYs 청크가 있으면 72 DPI를 명시한 것
+        idat = blob.find(b"IDAT")
+        return dpi if b"pHYs" in blob[: idat if idat >= 0 else len(blob)] else DEFAULT_IMAGE_DPI
+    return dpi if dpi and dpi != 72 else DEFAULT_IMAGE_DPI
+
+
+class _DocxHtmlWriter(HTMLParser):
+    """md_to_html/html_to_doc이 만드는 HTML을 순회하며 python-docx 문서를 구성"""
+
+    def __init__(self, document: "Document", resource_dir: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.document = document
+        self.resource_dir = resource_dir
+        self.paragraph: Optional["Paragraph"] = None
+        self.formats: Dict[str, int] = {name: 0 for name in set(_INLINE_FORMATS.values())}
+        self.lists: List[str] = []
+        self.aligns: List[Optional[str]] = []
+        self.pre = 0
+        self.quote = 0
+        self.skip = 0
+        self.title: List[str] = []
+        self.in_title = False
+        self.table: Optional[List[List[Tuple[List[_CellPart], bool]]]] = None
+        self.cell: Optional[List[_CellPart]] = None
+        # <li>가 연 목록 문단 (느슨한 목록의 <li><p>는 이 문단을 그대로 사용)
+        self.list_paragraph: Optional["Paragraph"] = None
+        self.cell_header = False
+
+        # python-docx는 스타일 이름을 지정할 때마다 전체 스타일을 검색하므로 ID를 미리 조회
+        self.style_ids = {style.name: style.style_id for style in document.styles}
+        section = document.sections[0]
+        page_width, left, right = section.page_width, section.left_margin, section.right_margin
+        if page_width is None or left is None or right is None:
+            self.max_image_width = DEFAULT_TEXT_WIDTH
+        else:
+            self.max_image_width = page_width - left - right
+
+    # --- 문단 ---------------------------------------------------------------
+
+    def _end_paragraph(self) -> None:
+        self.paragraph = None
+
+    def _new_paragraph(self, style: Optional[str] = None) -> "Paragraph":
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+        if style is None and self.quote:
+            style = "Quote"
+        self.paragraph = self.document.add_paragraph()
+        if style in self.style_ids:
+            self.paragraph._p.style = self.style_ids[style]
+        align = next((value for value in reversed(self.aligns) if value), None)
+        if align:
+            self.paragraph.alignment = getattr(WD_ALIGN_PARAGRAPH, align.upper())
+        return self.paragraph
+
+    def _current_paragraph(self) -> "Paragraph":
+        return self.paragraph if self.paragraph is not None else self._new_paragraph()
+
+    def _add_run(self, text: str) -> None:
+        from docx.shared import Pt
+
+        run = self._current_paragraph().add_run(text)
+        # 서식이 없는 run은 속성 요소(w:rPr)를 만들지 않도록 켜진 서식만 지정
+        if self.formats["bold"]:
+            run.bold = True
+        if self.formats["italic"]:
+            run.italic = True
+        if self.formats["underline"]:
+            run.underline = True
+        if self.formats["strike"]:
+            run.font.strike = True
+        if self.formats["subscript"]:
+            run.font.subscript = True
+        if self.formats["superscript"]:
+            run.font.superscript = True
+        if self.formats["code"] or self.pre:
+            run.font.name = CODE_FONT
+            run.font.size = Pt(10)
+
+    def _add_image(
+        self,
+        attrs: Dict[str, Optional[str]],
+        paragraph: Optional["Paragraph"] = None,
+        max_width: Optional[int] = None,
+    ) -> None:
+        """이미지 run 추가 (읽을 수 없으면 alt 텍스트, paragraph가 없으면 현재 문단)"""
+        from docx.image.image import Image
+        from docx.shared import Emu, Inches
+
+        alt = attrs.get("alt") or ""
+        blob = _read_image_source(attrs.get("src") or "", self.resource_dir)
+        image = None
+        if blob is not None:
+            try:
+                image = Image.from_blob(blob)
+            except Exception as e:
+                logging.warning(f"이미지 삽입 실패 ({alt or '이미지'}): {e}")
+        if blob is None or image is None:
+            if alt and paragraph is not None:
+                paragraph.add_run(alt)
+            elif alt:
+                self._add_run(alt)
+            return
+
+        # 해상도 정보가 없으면 python-docx는 72 DPI로 간주하므로 Pandoc과 같은 96 DPI 적용
+        dpi = _image_dpi(image, blob)
+        width = int(Inches(image.px_width / dpi))
+        height = int(Inches(image.px_height / dpi))
+        max_width = max_width or self.max_image_width
+        if width > max_width:
+            height = height * max_width // width
+            width = max_width
+        run = (paragraph or self._current_paragraph()).add_run()
+        run.add_picture(io.BytesIO(blob), width=Emu(width), height=Emu(height))
+
+    # --- 표 -----------------------------------------------------------------
+
+    def _flush_table(self) -> None:
+        rows = [row for row in self.table or [] if row]
+        self.table = None
+        if not rows:
+            return
+        columns = max(len(row) for row in rows)
+        table = self.document.add_table(rows=len(rows), cols=columns)
+        table._tbl.tblStyle_val = self.style_ids.get("Table Grid")
+        # 셀 안의 이미지(렌더링된 수식 등)는 열 너비에 맞춰 축소
+        max_width = self.max_image_width // columns
+        for row, cells in zip(table.rows, rows):
+            for cell, (parts, header) in zip(row.cells, cells):
+                paragraph = cell.paragraphs[0]
+                for part in parts:
+                    if isinstance(part, str):
+                        run = paragraph.add_run(part)
+                        if header:
+                            run.bold = True
+                    else:
+                        self._add_image(part, paragraph, max_width)
+        self._end_paragraph()
+
+    # --- HTMLParser 콜백 ------------------------------------------------------
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in _SKIPPED:
+            self.skip += 1
+            self.in_title = tag == "title"
+            return
+        if self.skip:
+            return
+
+        if self.table is not None:
+            if tag == "tr":
+                self.table.append([])
+            elif tag in ("td", "th"):
+                self.cell, self.cell_header = [], tag == "th"
+            elif tag == "img" and self.cell is not None:
+                self.cell.append(attrs)
+            return
+
+        if tag in _INLINE_FORMATS:
+            self.formats[_INLINE_FORMATS[tag]] += 1
+        elif tag in _HEADINGS:
+            self._new_paragraph(f"Heading {_HEADINGS[tag]}")
+        elif tag in ("p", "div"):
+            match = _ALIGN_RE.search(attrs.get("style") or "")
+            self.aligns.append(match.group(1).lower() if match else attrs.get("align"))
+            # 느슨한 목록(<li><p>)의 첫 문단은 <li>가 연 목록 문단에 그대로 기록
+            paragraph = self.paragraph
+            if paragraph is None or paragraph is not self.list_paragraph or paragraph.runs:
+                self._end_paragraph()
+        elif tag in ("ul", "ol"):
+            self.lists.append(tag)
+            self._end_paragraph()
+        elif tag == "li":
+            style = "List Number" if self.lists and self.lists[-1] == "ol" else "List Bullet"
+            depth = min(len(self.lists), 3)
+            self.list_paragraph = self._new_paragraph(style if depth <= 1 else f"{style} {depth}")
+        elif tag == "pre":
+            self.pre += 1
+            self._new_paragraph()
+        elif tag == "blockquote":
+            self.quote += 1
+            self._end_paragraph()
+        elif tag == "table":
+            self._end_paragraph()
+            self.table = []
+        elif tag == "br":
+            self._current_paragraph().add_run().add_break()
+        elif tag == "hr":
+            self._end_paragraph()
+        elif tag == "img":
+            self._add_image(attrs)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in ("br", "hr", "img"):
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED:
+            self.skip = max(0, self.skip - 1)
+            self.in_title = False
+            return
+        if self.skip:
+            return
+
+        if self.table is not None:
+            if tag in ("td", "th") and self.cell is not None:
+                if self.table:
+                    self.table[-1].append((_cell_parts(self.cell), self.cell_header))
+                self.cell = None
+            elif tag == "table":
+                self._flush_table()
+            return
+
+        if tag in _INLINE_FORMATS:
+            key = _INLINE_FORMATS[tag]
+            self.formats[key] = max(0, self.formats[key] - 1)
+        elif tag in ("p", "div"):
+            if self.aligns:
+                self.aligns.pop()
+            self._end_paragraph()
+        elif tag in ("ul", "ol"):
+            if self.lists:
+                self.lists.pop()
+            self._end_paragraph()
+        elif tag == "pre":
+            self.pre = max(0, self.pre - 1)
+            self._end_paragraph()
+        elif tag == "blockquote":
+            self.quote = max(0, self.quote - 1)
+            self._end_paragraph()
+        elif tag in _HEADINGS or tag == "li":
+            self._end_paragraph()
+
+    def handle_data(self, data):
+        if self.skip:
+            if self.in_title:
+                self.title.append(data)
+            return
+        if self.table is not None:
+            if self.cell is not None:
+                self.cell.append(data)
+            return
+
+        if self.pre:
+            lines = data.split("\n")
+            for index, line in enumerate(lines):
+                if index:
+                    # 코드 블록 끝의 줄바꿈은 문단 경계로 처리
+                    if index == len(lines) - 1 and not line:
+                        break
+                    self._current_paragraph().add_run().add_break()
+                if line:
+                    self._add_run(line)
+            return
+
+        text = _WHITESPACE_RE.sub(" ", data)
+        if self.paragraph is None or not self.paragraph.runs:
+            text = text.lstrip()
+        if text:
+            self._add_run(text)
+
+    def close(self):
+        super().close()
+        if self.table is not None:
+            self._flush_table()
+
+
+def _cell_parts(parts: List[_CellPart]) -> List[_CellPart]:
+    """셀 내용 조각에서 이어지는 텍스트를 합치고 공백 정리 (셀 앞뒤 공백 제거)"""
+    merged: List[_CellPart] = []
+    for part in parts:
+        if isinstance(part, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += part
+        else:
+            merged.append(part)
+    merged = [_WHITESPACE_RE.sub(" ", part) if isinstance(part, str) else part for part in merged]
+    if merged and isinstance(merged[0], str):
+        merged[0] = merged[0].lstrip()
+    if merged and isinstance(merged[-1], str):
+        merged[-1] = merged[-1].rstrip()
+    return [part for part in merged if part]
+
+
+def html_to_docx_native(
+    html_text: str, output_path: str, resource_dir: Optional[str] = None
+) -> None:
+    """python-docx로 HTML 문자열을 DOCX 파일로 변환 (Pandoc 프로세스 없음)
+
+    md_to_html(use_base64=True)이 만드는 HTML 구조(제목, 문단, 목록, 코드 블록, 인용,
+    표, data URI 이미지)를 대상으로 하며, 그 밖의 태그는 텍스트만 옮긴다.
+
+    Args:
+        html_text: 입력 HTML 문자열
+        output_path: 출력 DOCX 파일 경로
+        resource_dir: 상대 경로 이미지의 기준 디렉토리 (None이면 현재 디렉토리)
+
+    Raises:
+        ImportError: python-docx가 설치되지 않은 경우
+    """
+    try:
+        import docx
+    except ImportError as e:
+        raise ImportError(
+            "native DOCX 백엔드에는 python-docx가 필요합니다: pip install helper-md-doc[native]"
+        ) from e
+
+    document = docx.Document()
+    writer = _DocxHtmlWriter(document, resource_dir)
+    writer.feed(html_text)
+    writer.close()
+
+    title = "".join(writer.title).strip()
+    if title:
+        document.core_properties.title = title
+    document.save(output_path)
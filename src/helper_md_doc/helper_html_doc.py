@@ -7,81 +7,187 @@ import os
 import re
 import sys
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 # 패키지 루트를 sys.path에 추가하여 절대 임포트 통일
 _project_root = Path(__file__).resolve().parents[1]
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-# 의존성 확인 및 설치
-import importlib.util
-
-spec = importlib.util.spec_from_file_location(
-    "requirements_rnac", os.path.join(os.path.dirname(__file__), "requirements_rnac.py")
+from helper_md_doc.helper_docx_backend import (
+    DOCX_BACKENDS,
+    DOCX_IMAGE_MODES,
+    check_docx_image_mode,
+    get_docx_backend,
+)
+from helper_md_doc.helper_profile import (
+    ConversionProfile,
+    add_profile_argument,
+    profile_from_args,
+    profile_stage,
+    profiling,
 )
-requirements_rnac = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(requirements_rnac)
-requirements_rnac.check_and_install_dependencies()
-
-import pypandoc
-
-logging.basicConfig(level=logging.INFO, format="%(message)s")
-
 
-def embed_images_as_base64(html_text: str, base_dir: str) -> str:
+# 확장자별 MIME 타입 (알 수 없는 확장자는 image/png)
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+    ".bmp": "image/bmp",
+}
+
+# 호출 간 공유하는 Base64 인코딩 결과 캐시 최대 용량 (인코딩된 문자열 기준, 바이트)
+EMBED_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 이미지 파일을 동시에 읽는 기본 스레드 수 (페이지 캐시에 있는 파일은 스레드 이점이 없어 1,
+# 네트워크 드라이브 등 느린 저장소에서는 늘리면 읽기 대기 시간이 겹쳐짐)
+EMBED_WORKERS = 1
+
+_IMG_SRC_RE = re.compile(r'<img src="([^"]+)"')
+
+# (절대 경로, mtime_ns, 크기) -> data URI를 담은 태그 앞부분, 최근 사용 순서 유지
+_embed_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_embed_cache_bytes = 0
+_embed_cache_lock = threading.Lock()
+
+
+def clear_embed_cache() -> None:
+    """embed_images_as_base64의 호출 간 캐시 비우기"""
+    global _embed_cache_bytes
+    with _embed_cache_lock:
+        _embed_cache.clear()
+        _embed_cache_bytes = 0
+
+
+def _embed_cache_get(key: Tuple[str, int, int]) -> Optional[str]:
+    with _embed_cache_lock:
+        tag = _embed_cache.get(key)
+        if tag is not None:
+            _embed_cache.move_to_end(key)
+        return tag
+
+
+def _embed_cache_put(key: Tuple[str, int, int], tag: str) -> None:
+    """캐시에 저장하고 최대 용량을 넘으면 가장 오래 사용되지 않은 항목부터 삭제"""
+    global _embed_cache_bytes
+    if len(tag) > EMBED_CACHE_MAX_BYTES:
+        return
+    with _embed_cache_lock:
+        previous = _embed_cache.pop(key, None)
+        if previous is not None:
+            _embed_cache_bytes -= len(previous)
+        _embed_cache[key] = tag
+        _embed_cache_bytes += len(tag)
+        while _embed_cache_bytes > EMBED_CACHE_MAX_BYTES:
+            _, evicted = _embed_cache.popitem(last=False)
+            _embed_cache_bytes -= len(evicted)
+
+
+def _resolve_image_path(img_path: str, base_dir: str) -> str:
+    """img src를 base_dir 기준 정규화된 파일 경로로 변환"""
+    img_path = img_path.replace("/", os.sep).replace("\\", os.sep)
+    if not os.path.isabs(img_path):
+        img_path = os.path.join(base_dir, img_path)
+    return os.path.normpath(img_path)
+
+
+def _read_image(full_path: str) -> bytes:
+    """이미지 파일 내용 읽기"""
+    with open(full_path, "rb") as f:
+        return f.read()
+
+
+def _encode_image(full_path: str, img_bytes: bytes) -> str:
+    """이미지 파일 내용을 data URI로 인코딩한 태그 앞부분(<img src="data:...") 생성
+
+    치환 시 큰 문자열을 참조마다 다시 조립하지 않도록 태그 앞부분 전체를 만들어 둔다.
+    """
+    mime_type = _MIME_TYPES.get(os.path.splitext(full_path)[1].lower(), "image/png")
+    img_data = base64.b64encode(img_bytes).decode("ascii")
+    logging.info(f"이미지 임베딩: {os.path.basename(full_path)}")
+    return f'<img src="data:{mime_type};base64,{img_data}"'
+
+
+def embed_images_as_base64(
+    html_text: str,
+    base_dir: Optional[str] = None,
+    cache: bool = True,
+    workers: int = EMBED_WORKERS,
+) -> str:
     """
     HTML의 로컬 이미지 경로를 base64 인코딩하여 임베딩.
     Base64로 이미 인코딩된 이미지(data:image/...)는 건드리지 않음.
 
+    같은 파일을 여러 번 참조해도 한 번만 읽고 인코딩하며, 고유 파일은 workers개의
+    스레드에서 동시에 읽는다. cache=True면 (경로, 수정 시각, 크기)를 키로 인코딩 결과를
+    호출 간에 재사용한다 (EMBED_CACHE_MAX_BYTES 이내, LRU).
+
     Args:
         html_text: 원본 HTML 텍스트
-        base_dir: 이미지 파일 기준 디렉토리
+        base_dir: 이미지 파일 기준 디렉토리 (None이면 현재 디렉토리)
+        cache: True면 호출 간 인코딩 결과 캐시 사용
+        workers: 이미지 파일을 동시에 읽는 스레드 수 (EMBED_WORKERS 참고)
 
     Returns:
         이미지가 base64로 임베딩된 HTML 텍스트
     """
+    base_dir = base_dir if base_dir is not None else os.getcwd()
 
-    def replace_img(match):
-        img_path = match.group(1)
-
+    # 1단계: 참조된 로컬 이미지를 고유 경로로 정리하고 캐시에 없는 파일만 수집
+    tags: Dict[str, Optional[str]] = {}
+    keys: Dict[str, Tuple[str, int, int]] = {}
+    for img_path in dict.fromkeys(match.group(1) for match in _IMG_SRC_RE.finditer(html_text)):
         # 이미 Base64로 인코딩된 이미지는 건드리지 않음
         if img_path.startswith("data:"):
-            return match.group(0)
-
-        img_path = img_path.replace("/", os.sep).replace("\\", os.sep)
-
-        if os.path.isabs(img_path):
-            full_path = img_path
-        else:
-            full_path = os.path.join(base_dir, img_path)
-
-        full_path = os.path.normpath(full_path)
-
+            continue
+        full_path = _resolve_image_path(img_path, base_dir)
+        if full_path in tags or full_path in keys:
+            continue
         if not os.path.isfile(full_path):
             logging.warning(f"이미지 파일 없음: {full_path}")
+            tags[full_path] = None
+            continue
+        file_stat = os.stat(full_path)
+        key = (full_path, file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _embed_cache_get(key) if cache else None
+        if cached is not None:
+            tags[full_path] = cached
+        else:
+            keys[full_path] = key
+
+    # 2단계: 남은 파일을 한 번씩 읽고 인코딩
+    # 파일 읽기는 GIL을 놓으므로 스레드 풀에서 동시에 수행 (느린 디스크/네트워크 드라이브),
+    # Base64 인코딩은 GIL을 잡고 있어 스레드 이점이 없으므로 순서대로 수행
+    missing = list(keys)
+    encoded: Dict[str, str] = {}
+    if len(missing) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            contents = executor.map(_read_image, missing)
+            for full_path, img_bytes in zip(missing, contents):
+                encoded[full_path] = _encode_image(full_path, img_bytes)
+    else:
+        for full_path in missing:
+            encoded[full_path] = _encode_image(full_path, _read_image(full_path))
+    tags.update(encoded)
+    if cache:
+        for full_path, tag in encoded.items():
+            _embed_cache_put(keys[full_path], tag)
+
+    # 3단계: 같은 경로는 같은 태그 문자열로 치환
+    def replace_img(match):
+        img_path = match.group(1)
+        if img_path.startswith("data:"):
             return match.group(0)
+        tag = tags.get(_resolve_image_path(img_path, base_dir))
+        return match.group(0) if tag is None else tag
 
-        ext = os.path.splitext(full_path)[1].lower()
-        mime_map = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".svg": "image/svg+xml",
-            ".bmp": "image/bmp",
-        }
-        mime_type = mime_map.get(ext, "image/png")
-
-        with open(full_path, "rb") as f:
-            img_data = base64.b64encode(f.read()).decode("utf-8")
-
-        logging.info(f"이미지 임베딩: {os.path.basename(full_path)}")
-        return f'<img src="data:{mime_type};base64,{img_data}"'
-
-    pattern = r'<img src="([^"]+)"'
-    return re.sub(pattern, replace_img, html_text)
+    return _IMG_SRC_RE.sub(replace_img, html_text)
 
 
 def clean_html_for_pandoc(html_text: str) -> str:
@@ -105,40 +211,72 @@ def clean_html_for_pandoc(html_text: str) -> str:
     return html_text
 
 
-def html_to_doc(html_path: str, output_path: str) -> None:
+def html_to_doc(
+    html_path: str,
+    output_path: str,
+    backend: str = "pandoc",
+    images: str = "base64",
+    profile: Optional[ConversionProfile] = None,
+) -> None:
     """
     HTML 파일을 DOCX로 변환 (이미지/수식 임베딩).
 
     Args:
         html_path: 입력 HTML 파일 경로
         output_path: 출력 DOCX 파일 경로
+        backend: DOCX 변환 백엔드 ("pandoc", "pandoc-server", "native")
+        images: "base64"(기본값)면 먼저 HTML에 Base64로 임베딩, "files"면 로컬 이미지를
+            HTML 파일 디렉토리 기준 경로로 백엔드에 전달 (Pandoc --resource-path)
+        profile: 단계별 소요 시간/바이트를 기록할 ConversionProfile (None이면 기록하지 않음)
     """
-    logging.info(f"HTML 읽기: {html_path}")
-    with open(html_path, "r", encoding="utf-8") as f:
-        html_text = f.read()
-
-    base_dir = os.path.dirname(os.path.abspath(html_path))
-
-    logging.debug("이미지 임베딩 중...")
-    html_text = embed_images_as_base64(html_text, base_dir)
-
-    logging.debug("HTML 정리 중...")
-    html_text = clean_html_for_pandoc(html_text)
-
-    logging.debug("DOCX 변환 중...")
-    pypandoc.convert_text(
-        html_text, "docx", format="html", outputfile=output_path, extra_args=["--standalone"]
-    )
+    check_docx_image_mode(images)
+    docx_backend = get_docx_backend(backend)
+    with profiling(profile), profile_stage("html_to_doc"):
+        logging.info(f"HTML 읽기: {html_path}")
+        with profile_stage("read", nbytes=os.path.getsize(html_path)):
+            with open(html_path, "r", encoding="utf-8") as f:
+                html_text = f.read()
+
+        base_dir = os.path.dirname(os.path.abspath(html_path))
+
+        if images == "base64":
+            logging.debug("이미지 임베딩 중...")
+            with profile_stage("embed_images"):
+                html_text = embed_images_as_base64(html_text, base_dir)
+
+        logging.debug("HTML 정리 중...")
+        with profile_stage("clean_html"):
+            html_text = clean_html_for_pandoc(html_text)
+
+        logging.debug(f"DOCX 변환 중 ({backend})...")
+        with profile_stage("docx") as stage:
+            docx_backend.convert(html_text, output_path, resource_dir=base_dir)
+            if stage.profile is not None:
+                stage.bytes = os.path.getsize(output_path)
 
     logging.info(f"변환 완료: {output_path}")
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = argparse.ArgumentParser(
         description="HTML(.html)을 DOCX로 변환합니다 (이미지/수식 임베딩)."
     )
     parser.add_argument("input", help="입력 HTML 파일 경로 (.html)")
     parser.add_argument("-o", "--output", help="출력 DOCX 파일 경로 (.docx)")
+    parser.add_argument(
+        "--backend",
+        choices=DOCX_BACKENDS,
+        default="pandoc",
+        help="DOCX 변환 백엔드 (기본값 pandoc)",
+    )
+    parser.add_argument(
+        "--images",
+        choices=DOCX_IMAGE_MODES,
+        default="base64",
+        help="이미지 전달 방식: base64(HTML 임베딩) 또는 files(경로 참조, 기본값 base64)",
+    )
+    add_profile_argument(parser)
     args = parser.parse_args()
 
     in_path = args.input
@@ -147,7 +285,10 @@ def main():
         sys.exit(1)
 
     out_path = args.output or os.path.splitext(in_path)[0] + ".docx"
-    html_to_doc(in_path, out_path)
+    profile = profile_from_args(args)
+    html_to_doc(in_path, out_path, backend=args.backend, images=args.images, profile=profile)
+    if profile is not None:
+        profile.write_json(args.profile)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import importlib.util
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+# Pillow는 최적화 사용 시점에 임포트 (선택 의존성: pip install helper-md-doc[image])
+
+# 색상 축소 방식: auto(무채색이면 grayscale, 아니면 palette), palette, grayscale, none
+IMAGE_QUANTIZE_MODES = ("auto", "palette", "grayscale", "none")
+
+# 해상도 정보가 없는 스크린샷의 기준 DPI (CSS 1px = 1/96 inch, Pandoc --dpi 기본값)
+SOURCE_DPI = 96
+
+# 동시 최적화 스레드 수 (Pillow는 리샘플링/양자화/압축 중 GIL을 해제)
+OPTIMIZE_WORKERS = min(4, os.cpu_count() or 1)
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class ImageOptimizeOptions(NamedTuple):
+    """렌더링된 PNG 후처리 옵션
+
+    Attributes:
+        crop: 가장자리 배경(왼쪽 위 픽셀 색) 여백 제거
+        margin: 여백 제거 후 남길 테두리 (px)
+        quantize: 색상 축소 방식 (IMAGE_QUANTIZE_MODES)
+        colors: palette 양자화 색상 수 (2~256)
+        max_dpi: 지정 시 이 DPI를 넘는 이미지를 축소 (표시 크기는 DPI 정보로 유지)
+    """
+
+    crop: bool = True
+    margin: int = 2
+    quantize: str = "auto"
+    colors: int = 256
+    max_dpi: Optional[int] = None
+
+    def cache_tag(self) -> str:
+        """렌더 캐시 키에 포함할 옵션 문자열"""
+        return f"opt-{int(self.crop)}-{self.margin}-{self.quantize}-{self.colors}-{self.max_dpi}"
+
+
+class ImageOptimizeStats(NamedTuple):
+    """최적화 결과 통계"""
+
+    images: int
+    original_bytes: int
+    optimized_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.optimized_bytes
+
+
+def check_image_optimize_options(options: ImageOptimizeOptions) -> None:
+    """잘못된 최적화 옵션이면 ValueError"""
+    if options.quantize not in IMAGE_QUANTIZE_MODES:
+        raise ValueError(
+            f"지원하지 않는 색상 축소 방식: {options.quantize} "
+            f"(가능: {', '.join(IMAGE_QUANTIZE_MODES)})"
+        )
+    if not 2 <= options.colors <= 256:
+        raise ValueError(f"palette 색상 수는 2~256이어야 합니다: {options.colors}")
+    if options.margin < 0:
+        raise ValueError(f"여백은 0 이상이어야 합니다: {options.margin}")
+    if options.max_dpi is not None and options.max_dpi <= 0:
+        raise ValueError(f"최대 DPI는 양수여야 합니다: {options.max_dpi}")
+
+
+def _import_pil():
+    """Pillow 모듈 임포트 (미설치 시 설치 안내와 함께 ImportError)"""
+    try:
+        from PIL import Image, ImageChops
+    except ImportError as e:
+        raise ImportError(
+            "이미지 최적화에는 Pillow가 필요합니다: pip install helper-md-doc[image]"
+        ) from e
+    return Image, ImageChops
+
+
+@lru_cache(maxsize=None)
+def pillow_available() -> bool:
+    """Pillow 설치 여부 (임포트하지 않고 확인)"""
+    return importlib.util.find_spec("PIL") is not None
+
+
+def crop_png(png_bytes: bytes, boxes: List[Tuple[int, int, int, int]]) -> List[bytes]:
+    """PNG 한 장에서 여러 영역을 잘라 각각 PNG로 저장 (스프라이트 분할)
+
+    Args:
+        png_bytes: 원본 PNG 바이트
+        boxes: 원본 이미지 기준 (left, top, right, bottom) 픽셀 영역 목록
+
+    Returns:
+        boxes 순서와 동일한 PNG 바이트 목록
+
+    Raises:
+        ImportError: Pillow가 설치되지 않은 경우
+    """
+    Image, _ = _import_pil()
+    sheet = Image.open(io.BytesIO(png_bytes))
+    sheet.load()
+    results = []
+    for box in boxes:
+        buffer = io.BytesIO()
+        sheet.crop(box).save(buffer, "PNG")
+        results.append(buffer.getvalue())
+    return results
+
+
+def _crop_background(image, margin: int, Image, ImageChops):
+    """가장자리 배경 여백을 margin px만 남기고 제거"""
+    background = Image.new(image.mode, image.size, image.getpixel((0, 0)))
+    diff = ImageChops.difference(image, background)
+    if image.mode == "RGBA":
+        # RGBA의 getbbox는 알파 채널만 보므로 모든 채널의 차이를 하나로 합침
+        mask = diff.getchannel(0)
+        for band in range(1, 4):
+            mask = ImageChops.lighter(mask, diff.getchannel(band))
+        diff = mask
+    bbox = diff.getbbox()
+    if bbox is None:
+        return image
+    left, top, right, bottom = bbox
+    box = (
+        max(0, left - margin),
+        max(0, top - margin),
+        min(image.width, right + margin),
+        min(image.height, bottom + margin),
+    )
+    return image if box == (0, 0, image.width, image.height) else image.crop(box)
+
+
+def _is_grayscale(image, ImageChops) -> bool:
+    """RGB 채널 값이 모든 픽셀에서 같은지 여부"""
+    red, green, blue = image.getchannel(0), image.getchannel(1), image.getchannel(2)
+    return (
+        ImageChops.difference(red, green).getbbox() is None
+        and ImageChops.difference(green, blue).getbbox() is None
+    )
+
+
+def optimize_png(png_bytes: bytes, options: Optional[ImageOptimizeOptions] = None) -> bytes:
+    """렌더링된 PNG의 여백 제거, 해상도 제한, 색상 축소 후 최대 압축으로 재저장
+
+    PNG가 아니거나(SVG/MathML 마크업, 빈 결과) 최적화 결과가 더 크면 원본을 그대로 반환한다.
+
+    Args:
+        png_bytes: PNG 바이트
+        options: 최적화 옵션 (None이면 기본값)
+
+    Returns:
+        최적화된 PNG 바이트
+    """
+    if not png_bytes.startswith(_PNG_SIGNATURE):
+        return png_bytes
+    if options is None:
+        options = ImageOptimizeOptions()
+    Image, ImageChops = _import_pil()
+
+    image = Image.open(io.BytesIO(png_bytes))
+    dpi = image.info.get("dpi")
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    # 스크린샷은 대부분 불투명하므로 알파 채널을 제거하여 채널 수 축소
+    if image.mode == "RGBA" and image.getchannel("A").getextrema()[0] == 255:
+        image = image.convert("RGB")
+
+    if options.crop:
+        image = _crop_background(image, options.margin, Image, ImageChops)
+
+    source_dpi = round(dpi[0]) if dpi and dpi[0] else SOURCE_DPI
+    if options.max_dpi is not None and source_dpi > options.max_dpi:
+        scale = options.max_dpi / source_dpi
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.Resampling.LANCZOS)
+        dpi = (options.max_dpi, options.max_dpi)
+
+    quantize = options.quantize
+    if quantize == "auto":
+        quantize = "grayscale" if _is_grayscale(image, ImageChops) else "palette"
+    if quantize == "grayscale":
+        image = image.convert("LA" if image.mode == "RGBA" else "L")
+    elif quantize == "palette":
+        # 알파 채널이 있으면 FASTOCTREE만 지원, 디더링은 압축률을 떨어뜨리므로 사용 안 함
+        method = Image.Quantize.FASTOCTREE if image.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        image = image.quantize(options.colors, method=method, dither=Image.Dither.NONE)
+
+    buffer = io.BytesIO()
+    save_options = {"optimize": True}
+    if dpi:
+        save_options["dpi"] = dpi
+    image.save(buffer, "PNG", **save_options)
+    optimized = buffer.getvalue()
+    return optimized if len(optimized) < len(png_bytes) else png_bytes
+
+
+def optimize_png_list(
+    png_list: List[bytes],
+    options: Optional[ImageOptimizeOptions] = None,
+    workers: int = OPTIMIZE_WORKERS,
+) -> Tuple[List[bytes], ImageOptimizeStats]:
+    """렌더링 결과 목록을 스레드 풀에서 최적화 (순서 유지)
+
+    Args:
+        png_list: 렌더링 결과 목록 (PNG가 아닌 항목은 그대로 유지)
+        options: 최적화 옵션 (None이면 기본값)
+        workers: 동시 최적화 스레드 수
+
+    Returns:
+        (최적화된 결과 목록, 통계)
+
+    Raises:
+        ImportError: Pillow가 설치되지 않은 경우
+        ValueError: 잘못된 옵션
+    """
+    if options is None:
+        options = ImageOptimizeOptions()
+    check_image_optimize_options(options)
+    indices = [index for index, data in enumerate(png_list) if data.startswith(_PNG_SIGNATURE)]
+    if not indices:
+        return list(png_list), ImageOptimizeStats(0, 0, 0)
+    _import_pil()
+
+    sources = [png_list[index] for index in indices]
+    workers = max(1, min(workers, len(sources)))
+    if workers == 1:
+        optimized = [optimize_png(data, options) for data in sources]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            optimized = list(executor.map(optimize_png, sources, [options] * len(sources)))
+
+    results = list(png_list)
+    for index, data in zip(indices, optimized):
+        results[index] = data
+    stats = ImageOptimizeStats(
+        len(sources), sum(len(data) for data in sources), sum(len(data) for data in optimized)
+    )
+    logging.info(
+        f"이미지 최적화: {stats.images}개, {stats.original_bytes:,} → "
+        f"{stats.optimized_bytes:,} 바이트 ({stats.saved_bytes:,} 바이트 절감)"
+    )
+    return results, stats
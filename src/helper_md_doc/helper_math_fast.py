@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+from functools import lru_cache
+from html import escape
+from typing import List, Optional, Tuple
+
+# 브라우저 없이 Unicode + <sub>/<sup> HTML로 변환하는 LaTeX 부분집합
+#   - 라틴 문자(기울임), 숫자, 연산자/괄호/구두점
+#   - x_i, x^2, x_{i+1}^{n}처럼 아래/위 첨자 (중첩 가능)
+#   - 그리스 문자, 이항 연산자/관계 기호, 일부 기호(\infty, \partial 등), 함수 이름(\sin 등)
+#   - 간격(\, \; \quad 등), 이스케이프(\{ \} \% 등), \text/\mathrm/\mathbf/\mathit
+#   - 인라인 수식에 한해 \sum, \int 등 큰 연산자와 \lim (첨자는 아래/위 첨자로 표시)
+# 그 밖의 명령(\frac, \sqrt, \begin, \left 등)이 있으면 None을 반환하여 브라우저 렌더링으로 넘긴다.
+
+GREEK = {
+    "alpha": "α",
+    "beta": "β",
+    "gamma": "γ",
+    "delta": "δ",
+    "epsilon": "ϵ",
+    "varepsilon": "ε",
+    "zeta": "ζ",
+    "eta": "η",
+    "theta": "θ",
+    "vartheta": "ϑ",
+    "iota": "ι",
+    "kappa": "κ",
+    "lambda": "λ",
+    "mu": "μ",
+    "nu": "ν",
+    "xi": "ξ",
+    "pi": "π",
+    "varpi": "ϖ",
+    "rho": "ρ",
+    "varrho": "ϱ",
+    "sigma": "σ",
+    "varsigma": "ς",
+    "tau": "τ",
+    "upsilon": "υ",
+    "phi": "ϕ",
+    "varphi": "φ",
+    "chi": "χ",
+    "psi": "ψ",
+    "omega": "ω",
+    "Gamma": "Γ",
+    "Delta": "Δ",
+    "Theta": "Θ",
+    "Lambda": "Λ",
+    "Xi": "Ξ",
+    "Pi": "Π",
+    "Sigma": "Σ",
+    "Upsilon": "Υ",
+    "Phi": "Φ",
+    "Psi": "Ψ",
+    "Omega": "Ω",
+}
+
+# 앞뒤 간격 없이 표시하는 기호
+SYMBOLS = {
+    "infty": "∞",
+    "partial": "∂",
+    "nabla": "∇",
+    "ldots": "…",
+    "dots": "…",
+    "cdots": "⋯",
+    "prime": "′",
+    "hbar": "ℏ",
+    "ell": "ℓ",
+    "emptyset": "∅",
+    "forall": "∀",
+    "exists": "∃",
+    "neg": "¬",
+    "angle": "∠",
+    "degree": "°",
+}
+
+# 앞뒤에 공백을 두는 이항 연산자/관계 기호 (+, -, = 등 ASCII 연산자 포함)
+OPERATORS = {
+    "pm": "±",
+    "mp": "∓",
+    "times": "×",
+    "cdot": "⋅",
+    "div": "÷",
+    "ast": "∗",
+    "circ": "∘",
+    "cup": "∪",
+    "cap": "∩",
+    "setminus": "∖",
+    "oplus": "⊕",
+    "otimes": "⊗",
+    "wedge": "∧",
+    "land": "∧",
+    "vee": "∨",
+    "lor": "∨",
+    "leq": "≤",
+    "le": "≤",
+    "geq": "≥",
+    "ge": "≥",
+    "neq": "≠",
+    "ne": "≠",
+    "approx": "≈",
+    "equiv": "≡",
+    "sim": "∼",
+    "simeq": "≃",
+    "propto": "∝",
+    "in": "∈",
+    "notin": "∉",
+    "ni": "∋",
+    "subset": "⊂",
+    "subseteq": "⊆",
+    "supset": "⊃",
+    "supseteq": "⊇",
+    "to": "→",
+    "rightarrow": "→",
+    "leftarrow": "←",
+    "gets": "←",
+    "Rightarrow": "⇒",
+    "Leftarrow": "⇐",
+    "leftrightarrow": "↔",
+    "Leftrightarrow": "⇔",
+    "implies": "⟹",
+    "iff": "⟺",
+    "mapsto": "↦",
+    "ll": "≪",
+    "gg": "≫",
+    "mid": "∣",
+    "parallel": "∥",
+    "perp": "⊥",
+}
+_ASCII_OPERATORS = {"+": "+", "-": "−", "=": "=", "<": "&lt;", ">": "&gt;"}
+
+# 인라인 수식에서만 처리하는 큰 연산자 (블록 수식은 첨자를 위/아래에 배치해야 하므로 브라우저)
+LARGE_OPERATORS = {
+    "sum": "∑",
+    "prod": "∏",
+    "coprod": "∐",
+    "int": "∫",
+    "iint": "∬",
+    "oint": "∮",
+    "bigcup": "⋃",
+    "bigcap": "⋂",
+}
+
+# 똑바로 쓰는 함수 이름 (\lim은 큰 연산자와 같이 인라인에서만 처리)
+FUNCTIONS = (
+    "sin cos tan sec csc cot arcsin arccos arctan sinh cosh tanh log ln lg exp "
+    "max min sup inf det dim ker deg gcd arg Pr lim"
+).split()
+
+SPACES = {",": " ", ":": " ", ";": " ", " ": " ", "!": "", "quad": " ", "qquad": "  "}
+ESCAPES = {"{": "{", "}": "}", "%": "%", "#": "#", "&": "&amp;", "_": "_", "$": "$", "|": "‖"}
+
+# 명령 인자를 해석 없이 그대로 쓰는 텍스트 명령과 인자를 해석하여 감싸는 글꼴 명령
+TEXT_COMMANDS = ("text", "textrm", "mathrm", "operatorname")
+FONT_COMMANDS = {"mathbf": "b", "textbf": "b", "mathit": "i", "textit": "i"}
+
+_PUNCTUATION = set("()[],.;:!/|*?'")
+_COMMAND_RE = re.compile(r"\\([A-Za-z]+|.)")
+
+
+class _Unsupported(Exception):
+    """빠른 경로에서 처리하지 않는 입력 (브라우저 렌더링으로 전환)"""
+
+
+class _Parser:
+    """LaTeX 부분집합 재귀 하강 파서 (결과는 HTML 조각 목록)"""
+
+    def __init__(self, code: str, display_mode: bool):
+        self.code = code
+        self.pos = 0
+        self.display_mode = display_mode
+
+    def parse(self) -> str:
+        html = self._expression(top=True)
+        if self.pos != len(self.code):
+            raise _Unsupported(self.code[self.pos :])
+        return html
+
+    def _expression(self, top: bool = False, in_script: bool = False) -> str:
+        """닫는 중괄호(또는 끝)까지의 원자 나열"""
+        pieces: List[Tuple[str, str]] = []  # (종류, HTML): 종류는 "op" 또는 "atom"
+        while self.pos < len(self.code):
+            char = self.code[self.pos]
+            if char == "}":
+                if top:
+                    raise _Unsupported("}")
+                break
+            if char.isspace():
+                self.pos += 1
+                continue
+            kind, html = self._atom()
+            if kind != "op":
+                html += self._scripts()
+            elif self._peek_script():
+                raise _Unsupported("연산자 첨자")
+            pieces.append((kind, html))
+        return self._join(pieces, in_script)
+
+    @staticmethod
+    def _join(pieces: List[Tuple[str, str]], in_script: bool) -> str:
+        """연산자 앞뒤 공백 배치 (첨자 안, 맨 앞, 연산자 뒤의 부호는 공백 없음)"""
+        result = []
+        previous = None
+        for index, (kind, html) in enumerate(pieces):
+            if kind == "op" and not in_script and previous not in (None, "op", "open"):
+                result.append(f" {html} " if index < len(pieces) - 1 else f" {html}")
+            else:
+                result.append(html)
+            previous = "open" if html in ("(", "[") else kind
+        return "".join(result).replace("  ", " ")
+
+    def _peek_script(self) -> bool:
+        rest = self.code[self.pos :].lstrip()
+        return rest[:1] in ("_", "^")
+
+    def _scripts(self) -> str:
+        """원자 뒤의 아래/위 첨자 (각각 최대 한 번)"""
+        html = ""
+        seen = set()
+        while self._peek_script():
+            while self.code[self.pos].isspace():
+                self.pos += 1
+            mark = self.code[self.pos]
+            if mark in seen:
+                raise _Unsupported("중복 첨자")
+            seen.add(mark)
+            self.pos += 1
+            tag = "sub" if mark == "_" else "sup"
+            html += f"<{tag}>{self._script_argument()}</{tag}>"
+        return html
+
+    def _script_argument(self) -> str:
+        """첨자 인자: {..} 그룹, 명령 하나 또는 문자 하나"""
+        while self.pos < len(self.code) and self.code[self.pos].isspace():
+            self.pos += 1
+        if self.pos >= len(self.code):
+            raise _Unsupported("첨자 인자 없음")
+        char = self.code[self.pos]
+        if char == "{":
+            return self._group(in_script=True)
+        if char in "_^}":
+            raise _Unsupported(char)
+        if char.isdigit():
+            self.pos += 1
+            return char
+        kind, html = self._atom()
+        return html
+
+    def _group(self, in_script: bool = False) -> str:
+        self.pos += 1
+        html = self._expression(in_script=in_script)
+        if self.pos >= len(self.code) or self.code[self.pos] != "}":
+            raise _Unsupported("닫는 중괄호 없음")
+        self.pos += 1
+        return html
+
+    def _braced_text(self) -> str:
+        """\\text{..} 인자: 중첩 없는 중괄호 안의 문자열"""
+        while self.pos < len(self.code) and self.code[self.pos].isspace():
+            self.pos += 1
+        if self.code[self.pos : self.pos + 1] != "{":
+            raise _Unsupported("텍스트 인자 없음")
+        close = self.code.find("}", self.pos)
+        text = self.code[self.pos + 1 : close] if close >= 0 else "{"
+        if close < 0 or "{" in text or "\\" in text or "$" in text:
+            raise _Unsupported("텍스트 인자")
+        self.pos = close + 1
+        return escape(text, quote=False)
+
+    def _atom(self) -> Tuple[str, str]:
+        """원자 하나 (종류, HTML): 종류는 "op"(공백을 두는 연산자) 또는 "atom" """
+        code = self.code
+        char = code[self.pos]
+        if char == "{":
+            return "atom", self._group()
+        if char == "\\":
+            return self._command()
+        if char in _ASCII_OPERATORS:
+            self.pos += 1
+            return "op", _ASCII_OPERATORS[char]
+        if char.isascii() and char.isalpha():
+            end = self.pos
+            while end < len(code) and code[end].isascii() and code[end].isalpha():
+                end += 1
+            letters, self.pos = code[self.pos : end], end
+            return "atom", f"<i>{letters}</i>"
+        if char.isdigit():
+            end = self.pos
+            while end < len(code) and (code[end].isdigit() or code[end] == "."):
+                end += 1
+            number, self.pos = code[self.pos : end], end
+            return "atom", number
+        if char in _PUNCTUATION:
+            self.pos += 1
+            return "atom", "′" if char == "'" else char
+        raise _Unsupported(char)
+
+    def _command(self) -> Tuple[str, str]:
+        match = _COMMAND_RE.match(self.code, self.pos)
+        if match is None:
+            raise _Unsupported("\\")
+        name = match.group(1)
+        self.pos = match.end()
+        if name in GREEK:
+            return "atom", GREEK[name]
+        if name in SYMBOLS:
+            return "atom", SYMBOLS[name]
+        if name in OPERATORS:
+            return "op", OPERATORS[name]
+        if name in SPACES:
+            return "atom", SPACES[name]
+        if name in ESCAPES:
+            return "atom", ESCAPES[name]
+        if name in TEXT_COMMANDS:
+            return "atom", self._braced_text()
+        if name in FONT_COMMANDS:
+            tag = FONT_COMMANDS[name]
+            while self.pos < len(self.code) and self.code[self.pos].isspace():
+                self.pos += 1
+            if self.code[self.pos : self.pos + 1] != "{":
+                raise _Unsupported(name)
+            # 기울임 태그 안의 라틴 문자는 중복 <i> 없이 그대로 표시
+            return "atom", f"<{tag}>{self._group().replace('<i>', '').replace('</i>', '')}</{tag}>"
+        if self.display_mode:
+            raise _Unsupported(name)
+        if name in LARGE_OPERATORS:
+            return "atom", LARGE_OPERATORS[name]
+        if name in FUNCTIONS:
+            return "atom", name
+        raise _Unsupported(name)
+
+
+@lru_cache(maxsize=4096)
+def latex_to_html(latex_code: str, display_mode: bool = False) -> Optional[str]:
+    """단순한 LaTeX 수식을 브라우저 없이 Unicode + <sub>/<sup> HTML로 변환
+
+    지원 범위는 모듈 상단 주석 참고. 블록 수식은 같은 부분집합에서 큰 연산자/함수
+    첨자를 제외하며, 결과는 가운데 정렬 블록으로 감싼다.
+
+    Args:
+        latex_code: LaTeX 수식 코드 ($ 구분자 제외)
+        display_mode: True면 블록 수식
+
+    Returns:
+        <span class="math"> HTML 조각, 지원하지 않는 입력이면 None
+    """
+    if not latex_code.strip():
+        return None
+    try:
+        body = _Parser(latex_code, display_mode).parse()
+    except (_Unsupported, IndexError):
+        return None
+    # 함수 이름 뒤에 바로 변수가 오면 한 칸 띄움 (\sin x → sin x)
+    body = re.sub(r"\b(" + "|".join(FUNCTIONS) + r")(?=<i>|[α-ωΑ-Ω])", r"\1 ", body)
+    html = f'<span class="math" style="font-family: \'Times New Roman\', serif;">{body}</span>'
+    if display_mode:
+        return f'<div style="text-align: center; margin: 1rem 0;">{html}</div>'
+    return html
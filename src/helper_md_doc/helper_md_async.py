@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import TYPE_CHECKING, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple, cast
+
+from helper_md_doc.helper_html_doc import clean_html_for_pandoc, html_to_doc
+from helper_md_doc.helper_md_doc import (
+    _check_doc_options,
+    _html_math_mode,
+    _html_to_docx,
+    _make_media_dir,
+    _remove_media_dir,
+)
+from helper_md_doc.helper_md_html import (
+    MERMAID_THEME,
+    RenderJob,
+    _KATEX_BATCH_JS,
+    _KATEX_MATHML_JS,
+    _KATEX_SPRITE_JS,
+    _MERMAID_BATCH_JS,
+    _cache_lookup,
+    _cache_store,
+    _check_image_format,
+    _clip_rect,
+    _jobs_to_render,
+    _katex_document,
+    _merge_rendered,
+    _mermaid_document,
+    _optimize_rendered,
+    _pixel_box,
+    _raise_mermaid_error,
+    _read_asset,
+    _slice_band,
+    _sprite_bands,
+    _svg_with_intrinsic_size,
+    build_html,
+    extract_render_jobs,
+    latex_capture_mode,
+    sanitize_mermaid_code,
+)
+from helper_md_doc.helper_image_optimize import ImageOptimizeOptions, check_image_optimize_options
+from helper_md_doc.helper_render_cache import RenderCache, get_render_cache
+
+# playwright, pypandoc은 첫 사용 시점에 임포트 (패키지 임포트 비용 최소화)
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright
+
+# 이벤트 루프별 비동기 브라우저 기본 페이지 풀 크기
+DEFAULT_POOL_SIZE = 4
+
+
+class _AsyncBrowserState:
+    """이벤트 루프에 묶인 비동기 Playwright 브라우저와 페이지 풀"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, pool_size: int):
+        self.loop = loop
+        self.pool_size = pool_size
+        self.lock = asyncio.Lock()
+        self.playwright: Optional["Playwright"] = None
+        self.browser: Optional["Browser"] = None
+        self.pages: List["Page"] = []
+        # None은 생성 실패로 빈 자리를 대기 중인 작업에 알리는 표시
+        self.idle: Dict[str, "asyncio.Queue[Optional[Page]]"] = {
+            "mermaid": asyncio.Queue(),
+            "latex": asyncio.Queue(),
+        }
+        self.created = {"mermaid": 0, "latex": 0}
+        # 루프 종료 시 브라우저를 정리하는 비동기 제너레이터 (_close_on_shutdown)
+        self.closer: Optional[AsyncGenerator[None, None]] = None
+
+
+# 이벤트 루프별 브라우저 상태 (루프 객체가 사라지면 항목도 제거)
+_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncBrowserState]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _get_state(pool_size: int = DEFAULT_POOL_SIZE) -> _AsyncBrowserState:
+    """현재 이벤트 루프의 브라우저 상태 반환 (없으면 생성, pool_size가 더 크면 풀 확장)
+
+    루프마다 별도 상태를 두므로 다른 스레드의 루프와 브라우저를 공유하지 않으며,
+    asyncio.run 종료 시(shutdown_asyncgens) 해당 루프의 브라우저를 닫는다.
+    """
+    loop = asyncio.get_running_loop()
+    state = _states.get(loop)
+    if state is None:
+        state = _states[loop] = _AsyncBrowserState(loop, pool_size)
+        state.closer = _close_on_shutdown(state)
+        await state.closer.__anext__()
+    else:
+        # 페이지는 필요할 때 생성하므로 상한만 올리면 풀이 커짐
+        state.pool_size = max(state.pool_size, pool_size)
+    return state
+
+
+async def _close_on_shutdown(state: _AsyncBrowserState) -> AsyncGenerator[None, None]:
+    """루프가 비동기 제너레이터를 정리할 때(또는 aclose 호출 시) 상태의 브라우저 정리"""
+    try:
+        yield
+    finally:
+        await _close_state(state)
+
+
+async def _close_state(state: _AsyncBrowserState) -> None:
+    """상태의 페이지, 브라우저, Playwright 종료 (여러 번 호출해도 안전)"""
+    pages, state.pages = state.pages, []
+    browser, state.browser = state.browser, None
+    playwright, state.playwright = state.playwright, None
+    for page in pages:
+        await page.close()
+    if browser:
+        await browser.close()
+    if playwright:
+        await playwright.stop()
+
+
+async def _new_page(state: _AsyncBrowserState, kind: str) -> "Page":
+    """Mermaid 또는 KaTeX가 사전 로드된 새 페이지 생성"""
+    async with state.lock:
+        browser = state.browser
+        if browser is None:
+            from playwright.async_api import async_playwright
+
+            playwright = state.playwright = await async_playwright().start()
+            browser = state.browser = await playwright.chromium.launch(headless=True)
+
+    page = await browser.new_page()
+    if kind == "mermaid":
+        await page.set_content(_mermaid_document())
+        await page.add_script_tag(content=_read_asset("mermaid", "mermaid.min.js"))
+        await page.evaluate(
+            "(theme) => mermaid.initialize({ startOnLoad: false, theme: theme })", MERMAID_THEME
+        )
+    else:
+        await page.set_content(_katex_document())
+        await page.add_script_tag(content=_read_asset("katex", "katex.js"))
+    state.pages.append(page)
+    return page
+
+
+@asynccontextmanager
+async def _acquire_page(state: _AsyncBrowserState, kind: str) -> AsyncIterator["Page"]:
+    """페이지 풀에서 페이지를 빌려오고 사용 후 반납 (풀이 비면 최대 크기까지 생성)"""
+    queue = state.idle[kind]
+    page: Optional["Page"] = None
+    while page is None:
+        if queue.empty() and state.created[kind] < state.pool_size:
+            state.created[kind] += 1
+            try:
+                page = await _new_page(state, kind)
+            except BaseException:
+                # 생성 실패한 자리는 반환하여 풀 크기가 줄어들지 않게 하고,
+                # 이 자리를 기다리던 작업이 다시 생성을 시도하도록 깨움
+                state.created[kind] -= 1
+                queue.put_nowait(None)
+                raise
+        else:
+            page = await queue.get()
+    try:
+        yield page
+    finally:
+        queue.put_nowait(page)
+
+
+async def _render_mermaid(
+    state: _AsyncBrowserState, mermaid_code: str, image_format: str = "png"
+) -> bytes:
+    """비동기 페이지에서 Mermaid 다이어그램 하나를 PNG 또는 SVG로 렌더링
+
+    동기 render_mermaid_batch와 같은 스크립트와 clip 촬영을 사용하므로 같은 캐시 키에
+    같은 결과를 저장한다.
+    """
+    async with _acquire_page(state, "mermaid") as page:
+        results = await page.evaluate(_MERMAID_BATCH_JS, [sanitize_mermaid_code(mermaid_code)])
+        result = results[0]
+        if result["error"]:
+            _raise_mermaid_error(mermaid_code, result["error"])
+        if image_format == "svg":
+            return _svg_with_intrinsic_size(result["svg"]).encode("utf-8")
+        if result["box"] is None:
+            return b""
+        return await page.screenshot(clip=_clip_rect(_pixel_box(*result["box"])), full_page=True)
+
+
+async def _render_latex(
+    state: _AsyncBrowserState, items: List[Tuple[str, bool]], image_format: str = "png"
+) -> List[bytes]:
+    """비동기 페이지에서 여러 수식을 한 번의 evaluate로 일괄 렌더링 (svg면 MathML)
+
+    PNG 촬영 방식은 묶음 크기와 무관하게 latex_capture_mode로 정한다.
+    """
+    async with _acquire_page(state, "latex") as page:
+        if image_format == "svg":
+            results = await page.evaluate(_KATEX_MATHML_JS, [list(item) for item in items])
+            for (code, _), (_, message) in zip(items, results):
+                if message:
+                    logging.warning(f"LaTeX 렌더링 실패: {code[:50]}... ({message})")
+            return [markup.encode("utf-8") for markup, _ in results]
+        if latex_capture_mode() == "sprite":
+            return await _render_latex_sprite(page, items)
+        errors = await page.evaluate(_KATEX_BATCH_JS, [[code, display] for code, display in items])
+        for index, message in errors:
+            logging.warning(f"LaTeX 렌더링 실패: {items[index][0][:50]}... ({message})")
+        handles = await page.query_selector_all("#latex-root .latex-container")
+        return [await handle.screenshot() for handle in handles]
+
+
+async def _render_latex_sprite(page: "Page", items: List[Tuple[str, bool]]) -> List[bytes]:
+    """render_latex_sprite의 비동기 버전 (띠 스크린샷 분할은 스레드 풀에서 실행)"""
+    rects, errors = await page.evaluate(
+        _KATEX_SPRITE_JS, [[code, display] for code, display in items]
+    )
+    for index, message in errors:
+        logging.warning(f"LaTeX 렌더링 실패: {items[index][0][:50]}... ({message})")
+
+    boxes = [_pixel_box(*rect) for rect in rects]
+    results: List[bytes] = [b""] * len(items)
+    for band, indices in _sprite_bands(boxes):
+        png_bytes = await page.screenshot(clip=_clip_rect(band), full_page=True)
+        pieces = await _run_blocking(_slice_band, band, png_bytes, [boxes[i] for i in indices])
+        for index, piece in zip(indices, pieces):
+            results[index] = piece
+    return results
+
+
+async def arender_jobs(
+    jobs: List[RenderJob],
+    cache: Optional[RenderCache] = None,
+    workers: int = DEFAULT_POOL_SIZE,
+    image_format: str = "png",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+) -> List[bytes]:
+    """렌더링 작업을 비동기 페이지 풀에서 asyncio.gather로 동시에 렌더링
+
+    Args:
+        jobs: 중복이 제거된 렌더링 작업 목록
+        cache: 렌더 캐시 (None이면 매번 렌더링)
+        workers: 종류(Mermaid/KaTeX)별 최대 동시 페이지 수
+        image_format: "png" 또는 "svg" (render_jobs 참고)
+        optimize_images: PNG 최적화 옵션 (render_jobs 참고, 최적화는 스레드 풀에서 실행)
+
+    Returns:
+        jobs 순서와 동일한 렌더링 결과 목록
+    """
+    _check_image_format(image_format)
+    if optimize_images is not None:
+        check_image_optimize_options(optimize_images)
+    keys, png_list = _cache_lookup(jobs, cache, image_format, optimize_images)
+    missing = [index for index, png_bytes in enumerate(png_list) if png_bytes is None]
+    if not missing:
+        return _cache_store(keys, png_list, [], [], cache)
+
+    state = await _get_state(max(1, workers))
+    mermaid_indices = [index for index in missing if jobs[index].kind == "mermaid"]
+    latex_indices = [index for index in missing if jobs[index].kind == "latex"]
+
+    # 수식은 페이지 수만큼 나누어 각 묶음을 한 번의 evaluate로 렌더링
+    chunk_count = max(1, min(state.pool_size, len(latex_indices)))
+    latex_chunks = [latex_indices[offset::chunk_count] for offset in range(chunk_count)]
+    latex_chunks = [chunk for chunk in latex_chunks if chunk]
+
+    results = await asyncio.gather(
+        *[_render_mermaid(state, jobs[index].code, image_format) for index in mermaid_indices],
+        *[
+            _render_latex(
+                state,
+                [(jobs[index].code, jobs[index].display_mode) for index in chunk],
+                image_format,
+            )
+            for chunk in latex_chunks
+        ],
+    )
+
+    mermaid_results = cast(List[bytes], results[: len(mermaid_indices)])
+    latex_results = cast(List[List[bytes]], results[len(mermaid_indices) :])
+    rendered_by_index = dict(zip(mermaid_indices, mermaid_results))
+    for chunk, chunk_result in zip(latex_chunks, latex_results):
+        rendered_by_index.update(zip(chunk, chunk_result))
+
+    rendered = [rendered_by_index[index] for index in missing]
+    rendered = await _run_blocking(_optimize_rendered, rendered, image_format, optimize_images)
+    return _cache_store(keys, png_list, missing, rendered, cache)
+
+
+async def acleanup_browser() -> None:
+    """현재 이벤트 루프의 비동기 브라우저 리소스 정리 (asyncio.run은 종료 시 자동 정리)"""
+    state = _states.pop(asyncio.get_running_loop(), None)
+    if state is None:
+        return
+    if state.closer is not None:
+        await state.closer.aclose()
+    else:
+        await _close_state(state)
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """블로킹 함수를 기본 스레드 풀에서 실행 (이벤트 루프 차단 방지)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+def _read_text(path: str) -> str:
+    """UTF-8 텍스트 파일 읽기"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+async def amd_to_html(
+    md_text: str,
+    title: Optional[str] = None,
+    use_base64: bool = False,
+    cache: Optional[RenderCache] = None,
+    workers: int = DEFAULT_POOL_SIZE,
+    image_format: str = "png",
+    math: str = "image",
+    media_dir: Optional[str] = None,
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+) -> str:
+    """md_to_html의 비동기 버전 (playwright.async_api 기반 동시 렌더링)
+
+    Args:
+        md_text: Markdown 텍스트
+        title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        use_base64: True면 이미지를 Base64로 인코딩하여 HTML에 임베드
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        workers: 종류(Mermaid/KaTeX)별 최대 동시 페이지 수
+        image_format: "png" 또는 "svg" (md_to_html 참고)
+        math: "image", "tex" 또는 "fast" (md_to_html 참고)
+        media_dir: use_base64=False일 때 이미지 파일 저장 디렉토리 (md_to_html 참고)
+        optimize_images: PNG 최적화 옵션 (md_to_html 참고)
+
+    Returns:
+        완성된 HTML 문자열
+    """
+    if cache is None:
+        cache = get_render_cache()
+
+    body_text, job_list = extract_render_jobs(md_text)
+    rendered = await arender_jobs(
+        _jobs_to_render(job_list, math), cache, workers, image_format, optimize_images
+    )
+    png_list = _merge_rendered(job_list, math, rendered)
+    return await _run_blocking(
+        build_html,
+        md_text,
+        body_text,
+        job_list,
+        png_list,
+        title,
+        use_base64,
+        image_format,
+        math,
+        media_dir,
+    )
+
+
+async def amd_to_doc(
+    md_path: str,
+    output_path: str,
+    title: Optional[str] = None,
+    cache: Optional[RenderCache] = None,
+    workers: int = DEFAULT_POOL_SIZE,
+    math: str = "image",
+    backend: str = "pandoc",
+    images: str = "files",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+) -> None:
+    """md_to_doc의 비동기 버전 (DOCX 변환은 스레드 풀에서 실행)
+
+    Args:
+        md_path: 입력 Markdown 파일 경로
+        output_path: 출력 DOCX 파일 경로
+        title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        workers: 종류(Mermaid/KaTeX)별 최대 동시 페이지 수
+        math: "image", "omml" 또는 "fast" (md_to_doc 참고)
+        backend: DOCX 변환 백엔드 (md_to_doc 참고)
+        images: "files" 또는 "base64" (md_to_doc 참고)
+        optimize_images: 렌더링 PNG 최적화 옵션 (md_to_doc 참고)
+    """
+    _check_doc_options(math, backend, images)
+    logging.info(f"Markdown 읽기: {md_path}")
+    md_text = await _run_blocking(_read_text, md_path)
+
+    media_dir = _make_media_dir() if images == "files" else None
+    try:
+        html_text = await amd_to_html(
+            md_text,
+            title=title,
+            use_base64=media_dir is None,
+            cache=cache,
+            workers=workers,
+            math=_html_math_mode(math),
+            media_dir=media_dir,
+            optimize_images=optimize_images,
+        )
+        html_text = clean_html_for_pandoc(html_text)
+        await _run_blocking(_html_to_docx, html_text, output_path, math, backend, media_dir)
+    finally:
+        _remove_media_dir(media_dir)
+    logging.info(f"변환 완료: {output_path}")
+
+
+async def ahtml_to_doc(
+    html_path: str, output_path: str, backend: str = "pandoc", images: str = "base64"
+) -> None:
+    """html_to_doc의 비동기 버전 (이미지 임베딩과 DOCX 변환을 스레드 풀에서 실행)
+
+    Args:
+        html_path: 입력 HTML 파일 경로
+        output_path: 출력 DOCX 파일 경로
+        backend: DOCX 변환 백엔드 (html_to_doc 참고)
+        images: "base64" 또는 "files" (html_to_doc 참고)
+    """
+    await _run_blocking(html_to_doc, html_path, output_path, backend, images)
@@ -2,80 +2,689 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import io
 import os
+import shutil
 import sys
 import logging
-import subprocess
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 # 패키지 루트를 sys.path에 추가하여 절대 임포트 통일
 _project_root = Path(__file__).resolve().parents[1]
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-# 의존성 확인 및 설치
-import importlib.util
-
-spec = importlib.util.spec_from_file_location(
-    "requirements_rnac", os.path.join(os.path.dirname(__file__), "requirements_rnac.py")
+from helper_md_doc.helper_md_html import (
+    RenderSession,
+    _jobs_to_render,
+    _merge_rendered,
+    _release_browser,
+    _using_session,
+    add_daemon_argument,
+    add_optimize_arguments,
+    extract_render_jobs,
+    markdown_body,
+    md_to_html,
+    optimize_options_from_args,
+    render_jobs,
+    use_daemon_from_args,
+    write_html_body,
 )
-requirements_rnac = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(requirements_rnac)
-requirements_rnac.check_and_install_dependencies()
-
-import pypandoc
-from helper_md_doc.helper_md_html import md_to_html, _cleanup_browser
+from helper_md_doc.helper_image_optimize import ImageOptimizeOptions
 from helper_md_doc.helper_html_doc import clean_html_for_pandoc
+from helper_md_doc.helper_profile import (
+    ConversionProfile,
+    add_profile_argument,
+    in_context,
+    profile_from_args,
+    profile_stage,
+    profiling,
+)
+from helper_md_doc.helper_render_cache import RenderCache, get_render_cache
+from helper_md_doc.helper_build_manifest import BuildManifest
+from helper_md_doc.helper_docx_backend import (
+    DOCX_BACKENDS,
+    DOCX_IMAGE_MODES,
+    check_docx_backend,
+    check_docx_image_mode,
+    close_docx_backends,
+    get_docx_backend,
+)
+
+# DOCX 수식 출력 방식: "image"는 KaTeX PNG 임베딩, "omml"은 Pandoc이 TeX를 Word 수식(OMML)으로 변환,
+# "fast"는 단순한 수식을 브라우저 없이 텍스트(아래/위 첨자)로 출력하고 나머지는 PNG 임베딩
+DOC_MATH_MODES = ("image", "omml", "fast")
+
+
+class BatchResult(NamedTuple):
+    """일괄 변환 파일별 결과"""
+
+    input_path: str
+    output_path: str
+    seconds: float
+    error: Optional[str] = None
+    skipped: bool = False
+
+
+def _doc_options(
+    title: Optional[str],
+    math: str = "image",
+    backend: str = "pandoc",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+) -> dict:
+    """DOCX 출력 결과에 영향을 주는 변환 옵션 (증분 빌드 비교용)"""
+    options = {"target": "docx", "title": title, "math": math, "backend": backend}
+    if optimize_images is not None:
+        options["optimize_images"] = optimize_images.cache_tag()
+    return options
+
+
+def _check_doc_options(math: str, backend: str = "pandoc", images: str = "files") -> None:
+    """지원하지 않는 DOCX 수식 출력 방식, 백엔드, 이미지 전달 방식 조합이면 ValueError"""
+    if math not in DOC_MATH_MODES:
+        raise ValueError(
+            f"지원하지 않는 수식 출력 방식: {math} (가능: {', '.join(DOC_MATH_MODES)})"
+        )
+    check_docx_backend(backend)
+    check_docx_image_mode(images)
+    if math == "omml" and backend == "native":
+        raise ValueError("omml 수식 출력은 pandoc 또는 pandoc-server 백엔드가 필요합니다")
 
-logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+def _html_math_mode(math: str) -> str:
+    """DOCX 수식 출력 방식에 대응하는 md_to_html 수식 출력 방식"""
+    return "tex" if math == "omml" else math
 
-def md_to_doc(md_path: str, output_path: str, title: Optional[str] = None) -> None:
-    """Markdown 파일을 DOCX로 변환 (Mermaid/LaTeX를 Base64 PNG로 임베딩)
+
+def _make_media_dir() -> str:
+    """렌더링 이미지를 DOCX 변환 전까지 보관할 임시 디렉토리 (가능하면 tmpfs /dev/shm)"""
+    root = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+    return tempfile.mkdtemp(prefix="helper_md_doc_media_", dir=root)
+
+
+def _remove_media_dir(media_dir: Optional[str]) -> None:
+    """_make_media_dir로 만든 임시 디렉토리 삭제"""
+    if media_dir is not None:
+        shutil.rmtree(media_dir, ignore_errors=True)
+
+
+def _render_doc_html(
+    md_path: str,
+    title: Optional[str] = None,
+    cache: Optional[RenderCache] = None,
+    workers: int = 1,
+    math: str = "image",
+    media_dir: Optional[str] = None,
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+) -> str:
+    """Markdown 파일을 Pandoc 입력용 HTML로 변환
+
+    media_dir이 주어지면 Mermaid/LaTeX PNG를 media_dir에 저장하고 상대 경로로 참조하며,
+    None이면 Base64로 HTML에 임베딩한다.
+    """
+    logging.info(f"Markdown 읽기: {md_path}")
+    with profile_stage("read", nbytes=os.path.getsize(md_path)):
+        with open(md_path, "r", encoding="utf-8") as f:
+            md_text = f.read()
+
+    logging.debug("Markdown -> HTML 변환 중 (Mermaid/LaTeX -> PNG)...")
+    html_text = md_to_html(
+        md_text,
+        title=title,
+        use_base64=media_dir is None,
+        cache=cache,
+        workers=workers,
+        math=_html_math_mode(math),
+        media_dir=media_dir,
+        optimize_images=optimize_images,
+    )
+
+    logging.debug("HTML 정리 중 (스크립트 태그 제거)...")
+    with profile_stage("clean_html"):
+        return clean_html_for_pandoc(html_text)
+
+
+def _html_to_docx(
+    html_text: str,
+    output_path: str,
+    math: str = "image",
+    backend: str = "pandoc",
+    media_dir: Optional[str] = None,
+) -> None:
+    """DOCX 백엔드로 HTML을 DOCX 파일로 변환 (omml이면 \\(..\\) 구분자를 TeX 수식으로 읽음)"""
+    logging.debug(f"HTML -> DOCX 변환 중 ({backend})...")
+    input_format = "html+tex_math_single_backslash" if math == "omml" else "html"
+    with profile_stage("docx") as stage:
+        get_docx_backend(backend).convert(html_text, output_path, input_format, media_dir)
+        if stage.profile is not None:
+            stage.bytes = os.path.getsize(output_path)
+
+
+def md_to_doc(
+    md_path: str,
+    output_path: str,
+    title: Optional[str] = None,
+    cache: Optional[RenderCache] = None,
+    workers: int = 1,
+    incremental: bool = False,
+    math: str = "image",
+    backend: str = "pandoc",
+    images: str = "files",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+    profile: Optional[ConversionProfile] = None,
+    session: Optional[RenderSession] = None,
+) -> None:
+    """Markdown 파일을 DOCX로 변환 (Mermaid/LaTeX를 PNG로 임베딩)
 
     Args:
         md_path: 입력 Markdown 파일 경로
         output_path: 출력 DOCX 파일 경로
         title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        workers: 동시 렌더링 브라우저 수 (1이면 순차 렌더링)
+        incremental: True면 출력 디렉토리의 빌드 매니페스트를 확인하여
+            입력(참조 로컬 이미지 포함)/옵션/패키지 버전이 그대로인 경우 변환을 건너뜀
+        math: "image"면 수식을 PNG로 렌더링하여 임베딩, "omml"이면 브라우저 렌더링 없이
+            Pandoc이 편집 가능한 Word 수식(OMML)으로 변환, "fast"면 단순한 수식은 브라우저
+            없이 텍스트(아래/위 첨자)로, 나머지는 PNG로 임베딩
+        backend: DOCX 변환 백엔드 ("pandoc", "pandoc-server", "native", DOCX_BACKENDS 참고)
+        images: "files"면 렌더링 PNG를 임시 미디어 디렉토리에 저장하여 경로로 전달
+            (Pandoc --resource-path), "base64"면 HTML에 Base64로 임베딩
+        optimize_images: 렌더링 PNG 여백 제거/색상 축소/재압축 옵션 (None이면 원본
+            스크린샷 사용, Pillow 필요, helper_image_optimize.ImageOptimizeOptions 참고)
+        profile: 단계별 소요 시간/바이트와 렌더링 항목을 기록할 ConversionProfile
+            (None이면 기록하지 않음, helper_profile 참고)
+        session: 브라우저를 소유하고 호출 간에 재사용할 RenderSession (None이면 활성
+            세션이 없는 한 변환 후 브라우저를 닫음, helper_md_html.RenderSession 참고)
     """
-    logging.info(f"Markdown 읽기: {md_path}")
-    with open(md_path, "r", encoding="utf-8") as f:
-        md_text = f.read()
+    _check_doc_options(math, backend, images)
+    manifest = BuildManifest.for_output(output_path) if incremental else None
+    options = _doc_options(title, math, backend, optimize_images)
+    if manifest is not None and manifest.is_up_to_date(md_path, output_path, options):
+        logging.info(f"변경 없음, 변환 생략: {output_path}")
+        return
 
-    logging.debug("Markdown -> HTML 변환 중 (Mermaid/LaTeX -> Base64 PNG)...")
-    html_text = md_to_html(md_text, title=title, use_base64=True)
+    media_dir = _make_media_dir() if images == "files" else None
+    with _using_session(session):
+        try:
+            with profiling(profile), profile_stage("md_to_doc"):
+                html_text = _render_doc_html(
+                    md_path, title, cache, workers, math, media_dir, optimize_images
+                )
+                _html_to_docx(html_text, output_path, math, backend, media_dir)
+        finally:
+            _remove_media_dir(media_dir)
+            _release_browser()
+    if manifest is not None:
+        manifest.record(md_path, output_path, options)
+        manifest.save()
+    logging.info(f"변환 완료: {output_path}")
 
-    logging.debug("HTML 정리 중 (스크립트 태그 제거)...")
-    html_text = clean_html_for_pandoc(html_text)
 
-    logging.debug("HTML -> DOCX 변환 중...")
-    pypandoc.convert_text(
-        html_text, "docx", format="html", outputfile=output_path, extra_args=["--standalone"]
-    )
+def md_to_targets(
+    md_path: str,
+    html_path: Optional[str] = None,
+    docx_path: Optional[str] = None,
+    title: Optional[str] = None,
+    cache: Optional[RenderCache] = None,
+    workers: int = 1,
+    math: str = "image",
+    backend: str = "pandoc",
+    images: str = "files",
+    html_base64: bool = True,
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+    profile: Optional[ConversionProfile] = None,
+    session: Optional[RenderSession] = None,
+) -> None:
+    """Markdown 파일 하나를 HTML과 DOCX로 함께 변환 (렌더링/Markdown 파싱은 한 번)
+
+    Mermaid/LaTeX 렌더링과 Markdown 파싱 결과를 두 출력이 공유하고,
+    HTML 기록과 DOCX 변환은 별도 스레드에서 동시에 수행한다.
+    math="omml"이어도 HTML 출력의 수식은 이미지로 렌더링한다.
+
+    Args:
+        md_path: 입력 Markdown 파일 경로
+        html_path: 출력 HTML 파일 경로 (None이면 HTML 출력 안 함)
+        docx_path: 출력 DOCX 파일 경로 (None이면 DOCX 출력 안 함)
+        title: 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        workers: 동시 렌더링 브라우저 수 (1이면 순차 렌더링)
+        math: "image", "omml" 또는 "fast" (md_to_doc 참고)
+        backend: DOCX 변환 백엔드 (md_to_doc 참고)
+        images: DOCX 백엔드에 이미지 전달 방식 "files" 또는 "base64" (md_to_doc 참고)
+        html_base64: True면 HTML에 이미지를 Base64로 임베딩, False면 HTML 파일 옆의
+            mermaid_diagrams/latex_equations 디렉토리에 이미지 파일로 저장
+        optimize_images: 렌더링 PNG 최적화 옵션 (md_to_doc 참고)
+        profile: 단계별 기록용 ConversionProfile (md_to_doc 참고)
+        session: 재사용할 RenderSession (md_to_doc 참고)
+    """
+    if html_path is None and docx_path is None:
+        raise ValueError("출력 경로가 없습니다 (html_path 또는 docx_path 필요)")
+    _check_doc_options(math, backend, images)
+    if cache is None:
+        cache = get_render_cache()
+
+    # HTML 출력이 있으면 omml이어도 수식 이미지가 필요하므로 HTML 기준으로 렌더링
+    html_math = "fast" if math == "fast" else "image"
+    render_math = html_math if html_path is not None else _html_math_mode(math)
+
+    with _using_session(session):
+        try:
+            with profiling(profile), profile_stage("md_to_targets"):
+                with profile_stage("read", nbytes=os.path.getsize(md_path)):
+                    with open(md_path, "r", encoding="utf-8") as f:
+                        md_text = f.read()
+
+                body_text, job_list = extract_render_jobs(md_text)
+                rendered = render_jobs(
+                    _jobs_to_render(job_list, render_math), cache, workers, "png", optimize_images
+                )
+                png_list = _merge_rendered(job_list, render_math, rendered)
+                html_body = markdown_body(body_text, job_list)
+
+                def write_html_target(html_path: str) -> None:
+                    media_dir = None if html_base64 else os.path.dirname(os.path.abspath(html_path))
+                    # 임시 파일에 기록한 뒤 교체 (실패 시 기존 출력 유지)
+                    tmp_path = f"{html_path}.{os.getpid()}.tmp"
+                    try:
+                        with open(tmp_path, "w", encoding="utf-8") as f:
+                            write_html_body(
+                                f,
+                                md_text,
+                                html_body,
+                                job_list,
+                                png_list,
+                                title,
+                                html_base64,
+                                math=html_math,
+                                media_dir=media_dir,
+                            )
+                        os.replace(tmp_path, html_path)
+                    finally:
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
+                    logging.info(f"변환 완료: {html_path}")
+
+                def write_docx_target(docx_path: str) -> None:
+                    media_dir = _make_media_dir() if images == "files" else None
+                    try:
+                        out = io.StringIO()
+                        write_html_body(
+                            out,
+                            md_text,
+                            html_body,
+                            job_list,
+                            png_list,
+                            title,
+                            media_dir is None,
+                            math=_html_math_mode(math),
+                            media_dir=media_dir,
+                        )
+                        with profile_stage("clean_html"):
+                            html_text = clean_html_for_pandoc(out.getvalue())
+                        _html_to_docx(html_text, docx_path, math, backend, media_dir)
+                    finally:
+                        _remove_media_dir(media_dir)
+                    logging.info(f"변환 완료: {docx_path}")
+
+                writers: List[Tuple[Callable[[str], None], str]] = []
+                if html_path is not None:
+                    writers.append((write_html_target, html_path))
+                if docx_path is not None:
+                    writers.append((write_docx_target, docx_path))
+                with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+                    futures = [
+                        executor.submit(in_context(writer), path) for writer, path in writers
+                    ]
+                    for future in futures:
+                        future.result()
+
+        finally:
+            _release_browser()
 
-    _cleanup_browser()
-    logging.info(f"변환 완료: {output_path}")
+
+def find_markdown_files(input_dir: str, recursive: bool = False) -> List[str]:
+    """디렉토리에서 Markdown 파일 목록 검색 (정렬된 경로)
+
+    Args:
+        input_dir: 검색할 디렉토리
+        recursive: True면 하위 디렉토리까지 검색
+
+    Returns:
+        .md 파일 경로 목록
+    """
+    pattern = "**/*.md" if recursive else "*.md"
+    return sorted(str(path) for path in Path(input_dir).glob(pattern) if path.is_file())
+
+
+def md_dir_to_doc(
+    input_dir: str,
+    output_dir: Optional[str] = None,
+    recursive: bool = False,
+    cache: Optional[RenderCache] = None,
+    jobs: int = 1,
+    incremental: bool = False,
+    math: str = "image",
+    backend: str = "pandoc",
+    images: str = "files",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+    profile: Optional[ConversionProfile] = None,
+    session: Optional[RenderSession] = None,
+) -> List[BatchResult]:
+    """디렉토리의 Markdown 파일을 일괄 DOCX 변환
+
+    렌더링은 하나의 브라우저를 파일 간에 재사용하여 순차 수행하고,
+    Pandoc 변환은 jobs개의 스레드에서 병렬로 수행한다.
+    한 파일이 실패해도 나머지 파일은 계속 변환하며 결과에 오류를 기록한다.
+
+    Args:
+        input_dir: 입력 디렉토리
+        output_dir: 출력 디렉토리 (None이면 입력 파일 옆에 생성, 하위 경로 구조 유지)
+        recursive: True면 하위 디렉토리까지 변환
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        jobs: 동시 Pandoc 변환 수
+        incremental: True면 출력 파일 디렉토리별 빌드 매니페스트(md_to_doc과 공유)를
+            기준으로 변경되지 않은 파일의 변환을 건너뜀
+        math: "image", "omml" 또는 "fast" (md_to_doc 참고)
+        backend: DOCX 변환 백엔드 (md_to_doc 참고, pandoc-server는 파일 간에 서버를 재사용)
+        images: "files" 또는 "base64" (md_to_doc 참고, 미디어 디렉토리는 파일별로 생성)
+        optimize_images: 렌더링 PNG 최적화 옵션 (md_to_doc 참고)
+        profile: 모든 파일의 단계를 합산하여 기록할 ConversionProfile (md_to_doc 참고)
+        session: 재사용할 RenderSession (md_to_doc 참고)
+
+    Returns:
+        입력 파일 순서의 BatchResult 목록
+    """
+    _check_doc_options(math, backend, images)
+    with _using_session(session), profiling(profile):
+        return _md_dir_to_doc(
+            input_dir,
+            output_dir,
+            recursive,
+            cache,
+            jobs,
+            incremental,
+            math,
+            backend,
+            images,
+            optimize_images,
+        )
+
+
+def _md_dir_to_doc(
+    input_dir: str,
+    output_dir: Optional[str],
+    recursive: bool,
+    cache: Optional[RenderCache],
+    jobs: int,
+    incremental: bool,
+    math: str,
+    backend: str,
+    images: str,
+    optimize_images: Optional[ImageOptimizeOptions],
+) -> List[BatchResult]:
+    """md_dir_to_doc 본문 (프로파일 활성화 이후 실행)"""
+    md_paths = find_markdown_files(input_dir, recursive)
+    output_dir = output_dir or input_dir
+    logging.info(f"일괄 변환 대상: {len(md_paths)}개 파일")
+    # md_to_doc과 같이 출력 파일 디렉토리별 매니페스트 사용 (두 방식의 증분 기록 공유)
+    manifests: Dict[str, BuildManifest] = {}
+
+    def manifest_for(output_path: str) -> Optional[BuildManifest]:
+        if not incremental:
+            return None
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        if output_dir not in manifests:
+            manifests[output_dir] = BuildManifest.for_output(output_path)
+        return manifests[output_dir]
+
+    results: List[Optional[BatchResult]] = [None] * len(md_paths)
+    pending: Dict[Future, Tuple[int, str, str, float, dict]] = {}
+
+    def convert(
+        html_text: str, output_path: str, render_seconds: float, media_dir: Optional[str]
+    ) -> float:
+        start = time.perf_counter()
+        try:
+            _html_to_docx(html_text, output_path, math, backend, media_dir)
+        finally:
+            _remove_media_dir(media_dir)
+        return render_seconds + time.perf_counter() - start
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            for index, md_path in enumerate(md_paths):
+                relative = os.path.relpath(md_path, input_dir)
+                output_path = os.path.join(output_dir, os.path.splitext(relative)[0] + ".docx")
+                os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+                title = os.path.splitext(os.path.basename(md_path))[0]
+                options = _doc_options(title, math, backend, optimize_images)
+                manifest = manifest_for(output_path)
+                if manifest is not None and manifest.is_up_to_date(md_path, output_path, options):
+                    results[index] = BatchResult(md_path, output_path, 0.0, skipped=True)
+                    continue
+
+                start = time.perf_counter()
+                media_dir = _make_media_dir() if images == "files" else None
+                try:
+                    html_text = _render_doc_html(
+                        md_path,
+                        title,
+                        cache,
+                        math=math,
+                        media_dir=media_dir,
+                        optimize_images=optimize_images,
+                    )
+                except Exception as e:
+                    _remove_media_dir(media_dir)
+                    elapsed = time.perf_counter() - start
+                    results[index] = BatchResult(md_path, output_path, elapsed, repr(e))
+                    continue
+                elapsed = time.perf_counter() - start
+                future = executor.submit(
+                    in_context(convert), html_text, output_path, elapsed, media_dir
+                )
+                pending[future] = (index, md_path, output_path, elapsed, options)
+
+            for future in as_completed(pending):
+                index, md_path, output_path, elapsed, options = pending[future]
+                error = future.exception()
+                if error is None:
+                    results[index] = BatchResult(md_path, output_path, future.result())
+                    manifest = manifest_for(output_path)
+                    if manifest is not None:
+                        manifest.record(md_path, output_path, options)
+                else:
+                    results[index] = BatchResult(md_path, output_path, elapsed, repr(error))
+    finally:
+        _release_browser()
+    for manifest in manifests.values():
+        manifest.save()
+    return [result for result in results if result is not None]
+
+
+def log_batch_summary(results: List[BatchResult]) -> None:
+    """일괄 변환 결과 요약 (파일별 소요 시간 및 실패 목록) 출력"""
+    for result in results:
+        status = "실패" if result.error else "생략" if result.skipped else "완료"
+        logging.info(f"  [{status}] {result.seconds:7.2f}s  {result.input_path}")
+
+    failures = [result for result in results if result.error]
+    skipped = [result for result in results if result.skipped]
+    total = sum(result.seconds for result in results)
+    logging.info(
+        f"일괄 변환 요약: 성공 {len(results) - len(failures) - len(skipped)}개, "
+        f"생략 {len(skipped)}개, 실패 {len(failures)}개, 파일별 합계 {total:.2f}s"
+    )
+    for result in failures:
+        logging.warning(f"  실패: {result.input_path}: {result.error}")
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if sys.argv[1:2] == ["check"]:
+        from helper_md_doc import check
+
+        check(install=True)
+        logging.info("의존성 확인 완료")
+        return
+
+    if sys.argv[1:2] == ["serve"]:
+        from helper_md_doc.helper_serve import main as serve_main
+
+        serve_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Markdown(.md)을 DOCX로 변환합니다 (Mermaid/LaTeX 이미지 임베딩)."
     )
-    parser.add_argument("input", help="입력 Markdown 파일 경로 (.md)")
-    parser.add_argument("-o", "--output", help="출력 DOCX 파일 경로 (.docx)")
+    parser.add_argument("input", help="입력 Markdown 파일 경로 (.md) 또는 디렉토리 (일괄 변환)")
+    parser.add_argument(
+        "-o", "--output", help="출력 DOCX 파일 경로 (.docx), 일괄 변환 시 출력 디렉토리"
+    )
+    parser.add_argument(
+        "--html",
+        metavar="PATH",
+        help="HTML 출력 경로 (--docx/-o와 함께 쓰면 렌더링 한 번으로 두 형식을 동시에 출력)",
+    )
+    parser.add_argument("--docx", metavar="PATH", help="DOCX 출력 경로 (-o와 같음)")
+    parser.add_argument(
+        "--html-assets",
+        action="store_true",
+        help="HTML 이미지를 Base64 대신 HTML 파일 옆 디렉토리에 파일로 저장",
+    )
     parser.add_argument("--title", default=None, help="문서 제목")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="동시 렌더링 브라우저 수, 일괄 변환 시 동시 DOCX 변환 수 (기본값 1)",
+    )
+    parser.add_argument(
+        "-r", "--recursive", action="store_true", help="일괄 변환 시 하위 디렉토리 포함"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="입력(참조 로컬 이미지 포함)/옵션/버전이 이전 변환과 같으면 변환 생략 (매니페스트)",
+    )
+    parser.add_argument(
+        "--math",
+        choices=DOC_MATH_MODES,
+        default="image",
+        help="수식 출력 방식: image(PNG 임베딩), omml(편집 가능한 Word 수식) 또는 "
+        "fast(단순한 수식은 브라우저 없이 텍스트로, 기본값 image)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=DOCX_BACKENDS,
+        default="pandoc",
+        help="DOCX 변환 백엔드: pandoc(문서별 프로세스), pandoc-server(상주 서버), "
+        "native(python-docx, 기본값 pandoc)",
+    )
+    parser.add_argument(
+        "--images",
+        choices=DOCX_IMAGE_MODES,
+        default="files",
+        help="DOCX 백엔드에 이미지 전달 방식: files(임시 미디어 디렉토리) 또는 "
+        "base64(HTML 임베딩, 기본값 files)",
+    )
+    add_optimize_arguments(parser)
+    add_daemon_argument(parser)
+    add_profile_argument(parser)
+    parser.add_argument("--cache-dir", default=None, help="렌더링 결과 디스크 캐시 디렉토리")
+    parser.add_argument(
+        "--cache-max-mb", type=int, default=256, help="렌더 캐시 최대 용량 (MB, 기본값 256)"
+    )
     args = parser.parse_args()
 
+    use_daemon_from_args(args)
     in_path = args.input
+    optimize_images = optimize_options_from_args(args)
+    profile = profile_from_args(args)
+    cache = None
+    if args.cache_dir:
+        cache = RenderCache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+
+    if os.path.isdir(in_path):
+        if args.html or args.docx:
+            parser.error("--html/--docx는 단일 파일 변환에서만 사용할 수 있습니다")
+        results = md_dir_to_doc(
+            in_path,
+            args.output,
+            args.recursive,
+            cache,
+            args.jobs,
+            args.incremental,
+            math=args.math,
+            backend=args.backend,
+            images=args.images,
+            optimize_images=optimize_images,
+            profile=profile,
+        )
+        close_docx_backends()
+        log_batch_summary(results)
+        if cache is not None:
+            logging.info(f"렌더 캐시: {cache.stats()}")
+        if profile is not None:
+            profile.write_json(args.profile)
+        if any(result.error for result in results):
+            sys.exit(1)
+        return
+
     if not os.path.isfile(in_path):
         print(f"파일을 찾을 수 없습니다: {in_path}", file=sys.stderr)
         sys.exit(1)
 
-    out_path = args.output or os.path.splitext(in_path)[0] + ".docx"
     title = args.title or os.path.splitext(os.path.basename(in_path))[0]
 
-    md_to_doc(in_path, out_path, title)
+    if args.html or args.docx:
+        if args.incremental:
+            logging.warning("--incremental은 --html/--docx 동시 출력에서 지원하지 않아 무시합니다")
+        md_to_targets(
+            in_path,
+            args.html,
+            args.docx or args.output,
+            title,
+            cache=cache,
+            workers=args.jobs,
+            math=args.math,
+            backend=args.backend,
+            images=args.images,
+            html_base64=not args.html_assets,
+            optimize_images=optimize_images,
+            profile=profile,
+        )
+        close_docx_backends()
+        if profile is not None:
+            profile.write_json(args.profile)
+        return
+
+    out_path = args.output or os.path.splitext(in_path)[0] + ".docx"
+    md_to_doc(
+        in_path,
+        out_path,
+        title,
+        cache=cache,
+        workers=args.jobs,
+        incremental=args.incremental,
+        math=args.math,
+        backend=args.backend,
+        images=args.images,
+        optimize_images=optimize_images,
+        profile=profile,
+    )
+    close_docx_backends()
+    if cache is not None:
+        logging.info(f"렌더 캐시: {cache.stats()}")
+    if profile is not None:
+        profile.write_json(args.profile)
 
 
 if __name__ == "__main__":
@@ -3,32 +3,71 @@
 
 import argparse
 import base64
+import io
 import os
 import re
+import shutil
 import sys
 import logging
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from html import escape
+from math import ceil, floor
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 # 패키지 루트를 sys.path에 추가하여 절대 임포트 통일
 _project_root = Path(__file__).resolve().parents[1]
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-# 의존성 확인 및 설치
-import importlib.util
-
-spec = importlib.util.spec_from_file_location(
-    "requirements_rnac", os.path.join(os.path.dirname(__file__), "requirements_rnac.py")
+from helper_md_doc.helper_profile import (
+    ConversionProfile,
+    add_profile_argument,
+    current_profile,
+    in_context,
+    profile_from_args,
+    profile_stage,
+    profiling,
+)
+from helper_md_doc.helper_render_cache import RenderCache, get_render_cache
+from helper_md_doc.helper_render_daemon import (
+    RenderDaemonClient,
+    get_render_daemon,
+    set_render_daemon,
+)
+from helper_md_doc.helper_build_manifest import BuildManifest
+from helper_md_doc.helper_math_fast import latex_to_html
+from helper_md_doc.helper_image_optimize import (
+    IMAGE_QUANTIZE_MODES,
+    ImageOptimizeOptions,
+    check_image_optimize_options,
+    crop_png,
+    optimize_png_list,
+    pillow_available,
 )
-requirements_rnac = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(requirements_rnac)
-requirements_rnac.check_and_install_dependencies()
 
-import markdown
-from playwright.sync_api import sync_playwright, Browser, Page
+# playwright, markdown은 첫 사용 시점에 임포트 (패키지 임포트 비용 최소화)
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, FloatRect, Page
 
-logging.basicConfig(level=logging.INFO, format="%(message)s")
 # body {{{{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Noto Sans KR", Arial, "Apple SD Gothic Neo", "Malgun Gothic", sans-serif; line-height: 1.6; padding: 2rem; max-width: 900px; margin: auto; }}}}
 # pre {{{{ background: #f6f8fa; padding: 1rem; overflow: auto; border-radius: 6px; }}}}
 # code {{{{ font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, "Liberation Mono", monospace; font-size: 8px; }}}}
@@ -56,49 +95,194 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
-# 전역 Playwright 브라우저 (다이어그램 렌더링 성능 최적화)
-_playwright = None
-_browser: Optional[Browser] = None
-_page: Optional[Page] = None
+
+class _BrowserState(threading.local):
+    """스레드별 Playwright 브라우저 상태 (sync API는 스레드 간 공유 불가)"""
+
+    playwright = None
+    browser: Optional["Browser"] = None
+    page: Optional["Page"] = None
+    katex_page: Optional["Page"] = None
+
+
+# 전역 Playwright 브라우저 (다이어그램 렌더링 성능 최적화, 스레드별로 분리)
+_state = _BrowserState()
+
+# 현재 컨텍스트에서 사용 중인 RenderSession (없으면 전역 _state 사용)
+_current_session: ContextVar[Optional["RenderSession"]] = ContextVar(
+    "helper_md_doc_render_session", default=None
+)
+
+_ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+MERMAID_THEME = "default"
+
+# 렌더링 결과 형식: "png"는 스크린샷(DOCX 호환), "svg"는 Mermaid SVG + KaTeX MathML
+IMAGE_FORMATS = ("png", "svg")
+
+# 수식 출력 방식: "image"는 image_format으로 렌더링, "tex"는 \(..\)/\[..\] TeX 그대로 출력,
+# "fast"는 단순한 수식을 브라우저 없이 Unicode + <sub>/<sup> HTML로 출력 (나머지는 image)
+MATH_MODES = ("image", "tex", "fast")
+
+
+@lru_cache(maxsize=None)
+def _read_asset(*parts: str) -> str:
+    """패키지 내장 JS/CSS 자산을 한 번만 읽어 캐싱
+
+    Args:
+        *parts: 패키지 디렉토리 기준 상대 경로 조각
+
+    Returns:
+        파일 내용 문자열
+    """
+    with open(os.path.join(_ASSET_DIR, *parts), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class RenderSession:
+    """Playwright 인스턴스, 브라우저, 미리 로드한 렌더링 페이지를 소유하는 렌더링 세션
+
+    md_to_html, md_to_doc 등에 session=으로 전달하거나 with 블록으로 활성화하면
+    변환이 끝나도 브라우저를 닫지 않고 다음 호출에서 재사용한다. 브라우저는 사용한
+    스레드별로 따로 띄우며 (Playwright sync API는 스레드 간 공유 불가), close()는
+    호출한 스레드의 브라우저를 정리한다. 세션 없이 호출하면 기존처럼 모듈 전역
+    상태를 사용하고 md_to_doc은 변환 후 브라우저를 닫는다.
+
+    사용 예:
+        with RenderSession() as session:
+            for md_path in md_paths:
+                md_to_doc(md_path, md_path[:-3] + ".docx", session=session)
+    """
+
+    def __init__(self):
+        self._state = _BrowserState()
+
+    @contextmanager
+    def activate(self) -> Iterator["RenderSession"]:
+        """with 블록 동안 현재 컨텍스트의 렌더링 세션으로 설정 (닫지 않음)"""
+        token = _current_session.set(self)
+        try:
+            yield self
+        finally:
+            _current_session.reset(token)
+
+    def warm(self) -> "RenderSession":
+        """브라우저를 띄우고 Mermaid/KaTeX 페이지를 미리 로드 (첫 변환 지연 제거)"""
+        with self.activate():
+            _get_browser_page()
+            _get_katex_page()
+        return self
+
+    def close(self) -> None:
+        """현재 스레드에서 띄운 브라우저 리소스 정리 (이후 사용 시 다시 기동)"""
+        with self.activate():
+            _cleanup_browser()
+
+    def __enter__(self) -> "RenderSession":
+        self._token = _current_session.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current_session.reset(self._token)
+        self.close()
+
+
+def current_session() -> Optional[RenderSession]:
+    """현재 컨텍스트에서 활성화된 RenderSession (없으면 None)"""
+    return _current_session.get()
+
+
+@contextmanager
+def _using_session(session: Optional[RenderSession]) -> Iterator[None]:
+    """session이 주어지면 활성화, None이면 현재 컨텍스트의 세션(또는 전역 상태) 유지"""
+    if session is None:
+        yield
+        return
+    with session.activate():
+        yield
+
+
+def _browser_state() -> _BrowserState:
+    """현재 컨텍스트의 브라우저 상태 (활성 세션의 상태 또는 전역 _state)"""
+    session = _current_session.get()
+    return _state if session is None else session._state
+
+
+def _release_browser() -> None:
+    """변환 종료 시 브라우저 정리 (활성 세션이 있으면 세션이 닫힐 때까지 유지)"""
+    if _current_session.get() is None:
+        _cleanup_browser()
+
+
+def _get_browser():
+    """Playwright 브라우저를 현재 세션(없으면 전역) 상태에 캐싱하여 반환"""
+    state = _browser_state()
+    if state.browser is None:
+        from playwright.sync_api import sync_playwright
+
+        if state.playwright is None:
+            state.playwright = sync_playwright().start()
+        state.browser = state.playwright.chromium.launch(headless=True)
+    return state.browser
 
 
 def _get_browser_page():
-    """Playwright 브라우저 페이지를 전역 캐싱으로 반환 (성능 최적화)"""
-    global _playwright, _browser, _page
-    if _page is None:
-        _playwright = sync_playwright().start()
-        _browser = _playwright.chromium.launch(headless=True)
-        _page = _browser.new_page()
-
-        # mermaid.min.js 사전 로드
-        mermaid_js_path = os.path.join(os.path.dirname(__file__), "mermaid/mermaid.js")
-        with open(mermaid_js_path, "r", encoding="utf-8") as f:
-            mermaid_js = f.read()
-        _page.add_script_tag(content=mermaid_js)
-        _page.evaluate("mermaid.initialize({ startOnLoad: false, theme: 'default' })")
-
-        # katex.min.js 및 CSS 사전 로드
-        katex_js_path = os.path.join(os.path.dirname(__file__), "katex", "katex.js")
-        katex_css_path = os.path.join(os.path.dirname(__file__), "katex", "katex.css")
-        with open(katex_js_path, "r", encoding="utf-8") as f:
-            katex_js = f.read()
-        with open(katex_css_path, "r", encoding="utf-8") as f:
-            katex_css = f.read()
-        _page.add_script_tag(content=katex_js)
-        _page.add_style_tag(content=katex_css)
-    return _page
+    """Playwright 브라우저 페이지를 현재 세션(없으면 전역) 상태에 캐싱하여 반환"""
+    state = _browser_state()
+    if state.page is None:
+        page = _get_browser().new_page()
+
+        # 렌더링 컨테이너 문서 구성 후 mermaid.min.js 사전 로드 (페이지는 이후 교체하지 않음)
+        page.set_content(_mermaid_document())
+        page.add_script_tag(content=_read_asset("mermaid", "mermaid.min.js"))
+        page.evaluate(
+            "(theme) => mermaid.initialize({ startOnLoad: false, theme: theme })", MERMAID_THEME
+        )
+        state.page = page
+    return state.page
+
+
+def _katex_document() -> str:
+    """KaTeX CSS가 포함된 수식 렌더링용 빈 HTML 문서 생성
+
+    latex-root는 수식별 요소 스크린샷용, latex-sprite는 스프라이트 렌더링용 격자다.
+    """
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        f"<style>{_read_asset('katex', 'katex.css')}"
+        "#latex-sprite { display: flex; flex-wrap: wrap; align-items: flex-start; "
+        f"gap: 2px; width: {SPRITE_WIDTH}px; }}"
+        "#latex-sprite > div { flex: none; box-sizing: border-box; }</style>"
+        '</head><body><div id="latex-root"></div><div id="latex-sprite"></div></body></html>'
+    )
+
+
+def _get_katex_page():
+    """KaTeX JS/CSS가 한 번만 로드된 수식 전용 페이지를 현재 세션(없으면 전역) 상태에 캐싱하여 반환
+
+    Mermaid 페이지는 _MERMAID_BATCH_JS가 일괄 렌더링마다 컨테이너를 비우고
+    다이어그램 블록을 다시 채우므로, 수식은 KaTeX 스타일만 로드된 별도 페이지에서 렌더링한다.
+    """
+    state = _browser_state()
+    if state.katex_page is None:
+        page = _get_browser().new_page()
+        page.set_content(_katex_document())
+        page.add_script_tag(content=_read_asset("katex", "katex.js"))
+        state.katex_page = page
+    return state.katex_page
 
 
 def _cleanup_browser():
-    """브라우저 리소스 정리"""
-    global _playwright, _browser, _page
-    if _page:
-        _page.close()
-    if _browser:
-        _browser.close()
-    if _playwright:
-        _playwright.stop()
-    _page = _browser = _playwright = None
+    """현재 스레드의 브라우저 리소스 정리 (활성 세션이 있으면 세션의 브라우저)"""
+    state = _browser_state()
+    if state.page:
+        state.page.close()
+    if state.katex_page:
+        state.katex_page.close()
+    if state.browser:
+        state.browser.close()
+    if state.playwright:
+        state.playwright.stop()
+    state.page = state.katex_page = state.browser = state.playwright = None
 
 
 def sanitize_mermaid_code(mermaid_code: str) -> str:
@@ -158,38 +342,173 @@ def png_to_base64(png_path: str) -> str:
     return f"data:image/png;base64,{b64_data}"
 
 
-def render_mermaid_to_png(mermaid_code: str, output_path: str) -> str:
-    """Playwright로 Mermaid 다이어그램을 PNG로 렌더링 (최적화: 브라우저 재사용)
+def _mermaid_document() -> str:
+    """Mermaid 렌더링용 컨테이너를 담은 빈 HTML 문서 생성"""
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>'
+        '<div id="mermaid-container" style="background: white; padding: 20px;"></div>'
+        "</body></html>"
+    )
+
+
+def _raise_mermaid_error(mermaid_code: str, message: str) -> None:
+    """Mermaid 구문/렌더링 오류를 원본 코드 일부와 함께 예외로 전달"""
+    raise RuntimeError(f"Mermaid 렌더링 실패: {message}\n다이어그램: {mermaid_code[:80]}...")
+
+
+# Mermaid 일괄 렌더링 스크립트: 모든 다이어그램을 한 번의 evaluate 안에서 순차 mermaid.render로
+# 렌더링하여 다이어그램별 블록에 세로로 배치하고, SVG 문자열과 페이지 좌표 경계 상자를 반환
+_MERMAID_BATCH_JS = """
+async (codes) => {
+    const container = document.getElementById('mermaid-container');
+    container.textContent = '';
+    const decoder = document.createElement('textarea');
+    const blocks = [];
+    const results = [];
+    for (let index = 0; index < codes.length; index++) {
+        const block = document.createElement('div');
+        container.appendChild(block);
+        blocks.push(block);
+        // <div class="mermaid"> innerHTML 방식과 동일하게 HTML 엔티티 복원
+        decoder.innerHTML = codes[index];
+        try {
+            // 다이어그램별 id로 SVG 내부 스타일이 서로 적용되지 않게 함
+            const { svg } = await mermaid.render('mermaid-svg-' + index, decoder.value);
+            block.innerHTML = svg;
+            results.push({ svg: svg, error: null, box: null });
+        } catch (e) {
+            results.push({ svg: null, error: String((e && e.message) || e), box: null });
+        }
+    }
+    // 블록 높이를 정수 px로 고정하여 모든 다이어그램이 정수 좌표에서 시작하도록 함 (측정 후 일괄 기록)
+    const heights = blocks.map((block) => Math.ceil(block.getBoundingClientRect().height));
+    blocks.forEach((block, index) => { block.style.height = heights[index] + 'px'; });
+    blocks.forEach((block, index) => {
+        const svg = block.querySelector('svg');
+        if (svg) {
+            const rect = svg.getBoundingClientRect();
+            results[index].box = [
+                rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height
+            ];
+        }
+    });
+    return results;
+}
+"""
+
+
+def _evaluate_mermaid_batch(page: "Page", codes: List[str]) -> List[dict]:
+    """Mermaid 페이지에서 여러 다이어그램을 한 번의 evaluate로 렌더링
+
+    Returns:
+        codes 순서의 {"svg", "box", "error"} 목록 (box는 [x, y, width, height] 또는 None)
+
+    Raises:
+        RuntimeError: 구문/렌더링 오류가 있는 첫 번째 다이어그램
+    """
+    # HTML 특수문자 전처리 (파싱 오류 방지) 후 모든 Mermaid 렌더링 완료까지 대기
+    results = page.evaluate(_MERMAID_BATCH_JS, [sanitize_mermaid_code(code) for code in codes])
+    for code, result in zip(codes, results):
+        if result["error"]:
+            _raise_mermaid_error(code, result["error"])
+    return results
+
+
+def render_mermaid_svg_batch(codes: List[str]) -> List[str]:
+    """Mermaid 다이어그램 여러 개를 한 번의 page.evaluate로 SVG 문자열로 렌더링 (스크린샷 없음)
+
+    Args:
+        codes: Mermaid 다이어그램 코드 목록
+
+    Returns:
+        codes 순서의 SVG 마크업 목록
+    """
+    if not codes:
+        return []
+    results = _evaluate_mermaid_batch(_get_browser_page(), codes)
+    return [_svg_with_intrinsic_size(result["svg"]) for result in results]
+
+
+def render_mermaid_svg(mermaid_code: str) -> str:
+    """Playwright로 Mermaid 다이어그램을 SVG 문자열로 렌더링 (스크린샷 없음)
 
     Args:
         mermaid_code: Mermaid 다이어그램 코드
-        output_path: PNG 파일 저장 경로
 
     Returns:
-        PNG 파일 경로
+        mermaid.render()가 생성한 SVG 마크업
+    """
+    return render_mermaid_svg_batch([mermaid_code])[0]
+
+
+def _svg_with_intrinsic_size(svg: str) -> str:
+    """루트 <svg>의 width="100%"를 viewBox 크기로 바꿔 <img>에서도 원래 크기로 표시되게 함"""
+    root = re.match(r"\s*<svg\b[^>]*>", svg)
+    if root is None:
+        return svg
+    view_box = re.search(r'viewBox="[-\d.]+ [-\d.]+ ([\d.]+) ([\d.]+)"', root.group(0))
+    if view_box is None:
+        return svg
+
+    width, height = view_box.groups()
+    tag = re.sub(r'\s(?:width|height)="[^"]*"', "", root.group(0))
+    tag = tag.replace("<svg", f'<svg width="{width}" height="{height}"', 1)
+    return tag + svg[root.end() :]
+
+
+def render_mermaid_batch(codes: List[str]) -> List[bytes]:
+    """Mermaid 다이어그램 여러 개를 한 번의 page.evaluate로 렌더링하고 각각 PNG로 촬영
+
+    다이어그램마다 evaluate, query_selector, 요소 스크린샷을 호출하는 대신 모든
+    다이어그램을 한 페이지에 배치한 뒤 반환된 경계 상자 영역만 clip 스크린샷하므로
+    Chromium 왕복은 다이어그램당 한 번이다. 구문 오류는 대기 없이 RuntimeError로 보고한다.
+
+    Args:
+        codes: Mermaid 다이어그램 코드 목록
+
+    Returns:
+        codes 순서의 PNG 바이트 목록 (SVG 요소를 찾지 못한 다이어그램은 빈 바이트)
     """
-    # HTML 특수문자 전처리 (파싱 오류 방지)
-    mermaid_code = sanitize_mermaid_code(mermaid_code)
+    if not codes:
+        return []
 
     page = _get_browser_page()
+    png_list: List[bytes] = []
+    for result in _evaluate_mermaid_batch(page, codes):
+        if result["box"] is None:
+            png_list.append(b"")
+            continue
+        clip = _clip_rect(_pixel_box(*result["box"]))
+        png_list.append(page.screenshot(clip=clip, full_page=True))
+    return png_list
+
+
+def render_mermaid_png(mermaid_code: str) -> bytes:
+    """Playwright로 Mermaid 다이어그램을 PNG 바이트로 렌더링 (최적화: 브라우저 재사용)
+
+    Args:
+        mermaid_code: Mermaid 다이어그램 코드
 
-    # HTML 컨테이너 생성 및 Mermaid 렌더링
-    html_content = f"""
-    <div id="mermaid-container" style="background: white; padding: 20px;">
-        <div class="mermaid">{mermaid_code}</div>
-    </div>
+    Returns:
+        PNG 바이트 (SVG 요소를 찾지 못하면 빈 바이트)
     """
-    page.set_content(f"<!DOCTYPE html><html><body>{html_content}</body></html>")
-    # page.evaluate("""async () => {
-    #     await mermaid.run({ querySelector: '.mermaid' });
-    # }""")
-    page.evaluate("void mermaid.run({ querySelector: '.mermaid' })")
-    page.wait_for_selector(".mermaid svg", timeout=5000)
+    return render_mermaid_batch([mermaid_code])[0]
+
+
+def render_mermaid_to_png(mermaid_code: str, output_path: str) -> str:
+    """Playwright로 Mermaid 다이어그램을 PNG로 렌더링 (최적화: 브라우저 재사용)
+
+    Args:
+        mermaid_code: Mermaid 다이어그램 코드
+        output_path: PNG 파일 저장 경로
 
-    # SVG 요소 스크린샷
-    svg_element = page.query_selector(".mermaid svg")
-    if svg_element:
-        svg_element.screenshot(path=output_path)
+    Returns:
+        PNG 파일 경로
+    """
+    png_bytes = render_mermaid_png(mermaid_code)
+    if png_bytes:
+        with open(output_path, "wb") as f:
+            f.write(png_bytes)
 
     return output_path
 
@@ -203,109 +522,277 @@ def render_mermaid_base64(mermaid_code: str) -> str:
     Returns:
         data:image/png;base64,... 형식의 Base64 문자열
     """
-    # HTML 특수문자 전처리 (파싱 오류 방지)
-    mermaid_code = sanitize_mermaid_code(mermaid_code)
-
-    page = _get_browser_page()
-
-    html_content = f"""
-    <div id="mermaid-container" style="background: white; padding: 20px;">
-        <div class="mermaid">{mermaid_code}</div>
-    </div>
-    """
-    page.set_content(f"<!DOCTYPE html><html><body>{html_content}</body></html>")
-    # page.evaluate("""async () => {
-    #     await mermaid.run({ querySelector: '.mermaid' });
-    # }""")
-    page.evaluate("void mermaid.run({ querySelector: '.mermaid' })")
-    page.wait_for_selector(".mermaid svg", timeout=5000)
-
-    svg_element = page.query_selector(".mermaid svg")
-    if svg_element:
-        png_bytes = svg_element.screenshot()
+    png_bytes = render_mermaid_png(mermaid_code)
+    if png_bytes:
         b64_data = base64.b64encode(png_bytes).decode("utf-8")
         return f"data:image/png;base64,{b64_data}"
 
     return ""
 
 
-def render_latex_to_png(latex_code: str, output_path: str, display_mode: bool = False) -> str:
-    """Playwright로 KaTeX 수식을 PNG로 렌더링
+# 수식 일괄 렌더링 스크립트: 모든 수식을 한 번의 evaluate로 DOM에 배치
+_KATEX_BATCH_JS = """
+(items) => {
+    const root = document.getElementById('latex-root');
+    root.textContent = '';
+    document.getElementById('latex-sprite').textContent = '';
+    const errors = [];
+    items.forEach(([latex, displayMode], index) => {
+        const row = document.createElement('div');
+        const container = document.createElement('div');
+        container.className = 'latex-container';
+        container.style.cssText = 'background: white; padding: 10px; display: inline-block;';
+        const output = document.createElement('span');
+        container.appendChild(output);
+        row.appendChild(container);
+        root.appendChild(row);
+        try {
+            katex.render(latex, output, { displayMode: displayMode, throwOnError: false });
+        } catch (e) {
+            output.textContent = 'Error rendering equation';
+            errors.push([index, String(e)]);
+        }
+    });
+    return document.fonts.ready.then(() => errors);
+}
+"""
+
+
+# 스프라이트 렌더링 스크립트: 모든 수식을 격자로 배치하고 페이지 좌표 경계 상자를 반환
+_KATEX_SPRITE_JS = """
+(items) => {
+    document.getElementById('latex-root').textContent = '';
+    const root = document.getElementById('latex-sprite');
+    root.textContent = '';
+    const errors = [];
+    const containers = items.map(([latex, displayMode], index) => {
+        const container = document.createElement('div');
+        container.style.cssText = 'background: white; padding: 10px; display: inline-block;';
+        const output = document.createElement('span');
+        container.appendChild(output);
+        root.appendChild(container);
+        try {
+            katex.render(latex, output, { displayMode: displayMode, throwOnError: false });
+        } catch (e) {
+            output.textContent = 'Error rendering equation';
+            errors.push([index, String(e)]);
+        }
+        return container;
+    });
+    return document.fonts.ready.then(() => {
+        // 크기를 정수 px로 고정하여 모든 수식이 정수 좌표에 놓이도록 함 (측정 후 일괄 기록)
+        const sizes = containers.map((container) => container.getBoundingClientRect());
+        containers.forEach((container, index) => {
+            container.style.width = Math.ceil(sizes[index].width) + 'px';
+            container.style.height = Math.ceil(sizes[index].height) + 'px';
+        });
+        const boxes = containers.map((container) => {
+            const rect = container.getBoundingClientRect();
+            return [rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height];
+        });
+        return [boxes, errors];
+    });
+}
+"""
+
+# 스프라이트 격자 폭 (px, 기본 뷰포트 1280px 안에 들어가도록)
+SPRITE_WIDTH = 1200
+
+# 스크린샷 한 장의 최대 높이 (px, 넘으면 행 단위 띠로 나누어 촬영)
+SPRITE_BAND_HEIGHT = 4096
+
+# 수식 PNG 촬영 방식: "sprite"는 격자 스크린샷을 Pillow로 분할, "element"는 수식별 요소 스크린샷
+LATEX_CAPTURE_MODES = ("sprite", "element")
+
+# 촬영 방식 환경 변수 (미설정 시 Pillow가 설치되어 있으면 "sprite")
+LATEX_CAPTURE_ENV = "HELPER_MD_DOC_LATEX_CAPTURE"
+
+PixelBox = Tuple[int, int, int, int]
+
+
+def _pixel_box(x: float, y: float, width: float, height: float) -> PixelBox:
+    """페이지 좌표 사각형을 포함하는 정수 (left, top, right, bottom) 픽셀 영역"""
+    return (
+        floor(x),
+        floor(y),
+        ceil(round(x + width, 3)),
+        ceil(round(y + height, 3)),
+    )
+
+
+def _clip_rect(box: PixelBox) -> "FloatRect":
+    """정수 픽셀 영역을 Playwright screenshot(clip=...) 사각형으로 변환"""
+    left, top, right, bottom = box
+    return {"x": left, "y": top, "width": right - left, "height": bottom - top}
+
+
+def _sprite_bands(
+    boxes: List[PixelBox], max_height: int = SPRITE_BAND_HEIGHT
+) -> List[Tuple[PixelBox, List[int]]]:
+    """경계 상자를 세로 max_height 이하의 띠로 묶음 (max_height보다 큰 상자는 단독 띠)
+
+    Returns:
+        (띠 전체를 덮는 촬영 영역, 띠에 속한 boxes 인덱스 목록) 목록
+    """
+    bands: List[Tuple[PixelBox, List[int]]] = []
+    indices: List[int] = []
+    left = top = right = bottom = 0
+    for index in sorted(range(len(boxes)), key=lambda i: (boxes[i][1], boxes[i][0])):
+        box_left, box_top, box_right, box_bottom = boxes[index]
+        if indices and max(bottom, box_bottom) - top > max_height:
+            bands.append(((left, top, right, bottom), indices))
+            indices = []
+        if not indices:
+            left, top, right, bottom = boxes[index]
+        else:
+            left, right = min(left, box_left), max(right, box_right)
+            bottom = max(bottom, box_bottom)
+        indices.append(index)
+    if indices:
+        bands.append(((left, top, right, bottom), indices))
+    return bands
+
+
+def _slice_band(band: PixelBox, png_bytes: bytes, boxes: List[PixelBox]) -> List[bytes]:
+    """띠 스크린샷을 띠 기준 좌표로 옮긴 경계 상자별 PNG로 분할"""
+    left, top = band[0], band[1]
+    return crop_png(
+        png_bytes,
+        [(x0 - left, y0 - top, x1 - left, y1 - top) for x0, y0, x1, y1 in boxes],
+    )
+
+
+def render_latex_sprite(items: List[Tuple[str, bool]]) -> List[bytes]:
+    """여러 수식을 한 페이지에 격자로 배치하고 한 번에 촬영한 뒤 수식별 PNG로 분할
+
+    요소마다 screenshot()을 호출하는 대신 띠(SPRITE_BAND_HEIGHT) 단위 스크린샷
+    몇 장만 촬영하므로 작은 인라인 수식이 많을수록 Chromium 왕복 비용이 줄어든다.
+    분할에는 Pillow가 필요하다 (pip install helper-md-doc[image]).
 
     Args:
-        latex_code: LaTeX 수식 코드 ($ 기호 제외)
-        output_path: PNG 파일 저장 경로
-        display_mode: True면 블록 수식, False면 인라인 수식
+        items: (LaTeX 수식 코드, display_mode) 목록
 
     Returns:
-        PNG 파일 경로
+        items 순서와 동일한 PNG 바이트 목록
     """
-    # 새 페이지 생성 (이전 상태 영향 방지)
-    global _playwright, _browser
-    if _browser is None:
-        if _playwright is None:
-            _playwright = sync_playwright().start()
-        _browser = _playwright.chromium.launch(headless=True)
+    if not items:
+        return []
 
-    page = _browser.new_page()
+    page = _get_katex_page()
+    rects, errors = page.evaluate(_KATEX_SPRITE_JS, [[code, display] for code, display in items])
+    for index, message in errors:
+        logging.warning(f"LaTeX 렌더링 실패: {items[index][0][:50]}... ({message})")
 
-    try:
-        # LaTeX 코드의 백슬래시 이스케이프 처리 (JSON 문자열로 전달하기 위해)
-        import json
+    boxes = [_pixel_box(*rect) for rect in rects]
+    results: List[bytes] = [b""] * len(items)
+    for band, indices in _sprite_bands(boxes):
+        png_bytes = page.screenshot(clip=_clip_rect(band), full_page=True)
+        for index, piece in zip(indices, _slice_band(band, png_bytes, [boxes[i] for i in indices])):
+            results[index] = piece
+    return results
 
-        latex_json = json.dumps(latex_code)
 
-        # HTML 컨테이너 생성
-        container_style = "background: white; padding: 10px; display: inline-block;"
+def latex_capture_mode() -> str:
+    """수식 PNG 촬영 방식 반환 (HELPER_MD_DOC_LATEX_CAPTURE, 미설정 시 Pillow 설치 여부로 결정)
 
-        # KaTeX CSS 읽기
-        katex_css_path = os.path.join(os.path.dirname(__file__), "katex", "katex.css")
-        with open(katex_css_path, "r", encoding="utf-8") as f:
-            katex_css = f.read()
+    두 방식은 같은 수식도 서로 다른 PNG 바이트를 만들므로(스프라이트는 Pillow로 다시 인코딩)
+    작업 수나 작업자 분배와 무관하게 실행 환경으로만 정하고, 렌더 캐시 키에도 포함한다.
 
-        # KaTeX JS 읽기
-        katex_js_path = os.path.join(os.path.dirname(__file__), "katex", "katex.js")
-        with open(katex_js_path, "r", encoding="utf-8") as f:
-            katex_js = f.read()
+    Raises:
+        ValueError: 알 수 없는 방식이거나 Pillow 없이 "sprite"를 지정한 경우
+    """
+    mode = os.environ.get(LATEX_CAPTURE_ENV)
+    if not mode:
+        return "sprite" if pillow_available() else "element"
+    if mode not in LATEX_CAPTURE_MODES:
+        raise ValueError(
+            f"{LATEX_CAPTURE_ENV}는 {', '.join(LATEX_CAPTURE_MODES)} 중 하나여야 합니다: {mode}"
+        )
+    if mode == "sprite" and not pillow_available():
+        raise ValueError("sprite 촬영에는 Pillow가 필요합니다 (pip install helper-md-doc[image])")
+    return mode
 
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>{katex_css}</style>
-</head>
-<body>
-    <div id="latex-container" style="{container_style}">
-        <span id="latex-output"></span>
-    </div>
-    <script>{katex_js}</script>
-    <script>
-        const latex = {latex_json};
-        const outputElement = document.getElementById('latex-output');
-        try {{
-            katex.render(latex, outputElement, {{
-                displayMode: {str(display_mode).lower()},
-                throwOnError: false
-            }});
-        }} catch (e) {{
-            console.error('KaTeX error:', e);
-            outputElement.textContent = 'Error rendering equation';
-        }}
-    </script>
-</body>
-</html>"""
-        page.set_content(html_content)
-        page.wait_for_load_state("networkidle")
-
-        # 렌더링된 요소 스크린샷 (흰색 배경)
-        latex_element = page.query_selector("#latex-container")
-        if latex_element:
-            latex_element.screenshot(path=output_path)
-        else:
-            logging.warning(f"LaTeX 렌더링 실패: {latex_code[:50]}...")
-    finally:
-        page.close()
 
+def render_latex_batch(items: List[Tuple[str, bool]], sprite: Optional[bool] = None) -> List[bytes]:
+    """KaTeX가 사전 로드된 페이지에서 여러 수식을 한 번에 PNG로 렌더링
+
+    모든 수식을 단일 page.evaluate로 배치한 뒤 요소 핸들별로 스크린샷한다.
+    촬영 방식이 "sprite"면 render_latex_sprite를 사용한다 (latex_capture_mode 참고).
+
+    Args:
+        items: (LaTeX 수식 코드, display_mode) 목록
+        sprite: True/False면 스프라이트 렌더링 사용/미사용 (None이면 latex_capture_mode)
+
+    Returns:
+        items 순서와 동일한 PNG 바이트 목록
+    """
+    if not items:
+        return []
+    if sprite is None:
+        sprite = latex_capture_mode() == "sprite"
+    if sprite:
+        return render_latex_sprite(items)
+
+    page = _get_katex_page()
+    errors = page.evaluate(_KATEX_BATCH_JS, [[code, display] for code, display in items])
+    for index, message in errors:
+        logging.warning(f"LaTeX 렌더링 실패: {items[index][0][:50]}... ({message})")
+
+    handles = page.query_selector_all("#latex-root .latex-container")
+    return [handle.screenshot() for handle in handles]
+
+
+# 수식 MathML 일괄 변환 스크립트: 화면 배치/스크린샷 없이 문자열로 반환
+_KATEX_MATHML_JS = """
+(items) => items.map(([latex, displayMode]) => {
+    try {
+        return [katex.renderToString(latex, {
+            displayMode: displayMode, output: 'mathml', throwOnError: false
+        }), null];
+    } catch (e) {
+        return ['', String(e)];
+    }
+})
+"""
+
+
+def render_latex_mathml_batch(items: List[Tuple[str, bool]]) -> List[str]:
+    """KaTeX로 여러 수식을 한 번의 evaluate로 MathML 마크업으로 변환
+
+    브라우저가 네이티브로 표시하는 MathML을 생성하므로 스크린샷과 KaTeX CSS/폰트가
+    필요 없다.
+
+    Args:
+        items: (LaTeX 수식 코드, display_mode) 목록
+
+    Returns:
+        items 순서와 동일한 MathML 마크업 목록
+    """
+    if not items:
+        return []
+
+    page = _get_katex_page()
+    results = page.evaluate(_KATEX_MATHML_JS, [[code, display] for code, display in items])
+    for (code, _), (_, message) in zip(items, results):
+        if message:
+            logging.warning(f"LaTeX 렌더링 실패: {code[:50]}... ({message})")
+    return [markup for markup, _ in results]
+
+
+def render_latex_to_png(latex_code: str, output_path: str, display_mode: bool = False) -> str:
+    """Playwright로 KaTeX 수식을 PNG로 렌더링
+
+    Args:
+        latex_code: LaTeX 수식 코드 ($ 기호 제외)
+        output_path: PNG 파일 저장 경로
+        display_mode: True면 블록 수식, False면 인라인 수식
+
+    Returns:
+        PNG 파일 경로
+    """
+    png_bytes = render_latex_batch([(latex_code, display_mode)])[0]
+    with open(output_path, "wb") as f:
+        f.write(png_bytes)
     return output_path
 
 
@@ -319,186 +806,709 @@ def render_latex_base64(latex_code: str, display_mode: bool = False) -> str:
     Returns:
         data:image/png;base64,... 형식의 Base64 문자열
     """
-    global _playwright, _browser
-    if _browser is None:
-        if _playwright is None:
-            _playwright = sync_playwright().start()
-        _browser = _playwright.chromium.launch(headless=True)
+    png_bytes = render_latex_batch([(latex_code, display_mode)])[0]
+    b64_data = base64.b64encode(png_bytes).decode("utf-8")
+    return f"data:image/png;base64,{b64_data}"
 
-    page = _browser.new_page()
 
-    try:
-        import json
+class RenderJob(NamedTuple):
+    """렌더링 대상 단위 (동일한 작업은 문서 내에서 한 번만 렌더링)"""
 
-        latex_json = json.dumps(latex_code)
-        container_style = "background: white; padding: 10px; display: inline-block;"
+    kind: str  # "mermaid" 또는 "latex"
+    code: str
+    display_mode: bool = False
 
-        katex_css_path = os.path.join(os.path.dirname(__file__), "katex", "katex.css")
-        with open(katex_css_path, "r", encoding="utf-8") as f:
-            katex_css = f.read()
 
-        katex_js_path = os.path.join(os.path.dirname(__file__), "katex", "katex.js")
-        with open(katex_js_path, "r", encoding="utf-8") as f:
-            katex_js = f.read()
+# 렌더링 결과: 메모리의 바이트 또는 결과가 저장된 파일 경로 (스트리밍 변환)
+Rendered = Union[bytes, str]
 
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>{katex_css}</style>
-</head>
-<body>
-    <div id="latex-container" style="{container_style}">
-        <span id="latex-output"></span>
-    </div>
-    <script>{katex_js}</script>
-    <script>
-        const latex = {latex_json};
-        const outputElement = document.getElementById('latex-output');
-        try {{
-            katex.render(latex, outputElement, {{
-                displayMode: {str(display_mode).lower()},
-                throwOnError: false
-            }});
-        }} catch (e) {{
-            console.error('KaTeX error:', e);
-            outputElement.textContent = 'Error rendering equation';
-        }}
-    </script>
-</body>
-</html>"""
-        page.set_content(html_content)
-        page.wait_for_load_state("networkidle")
-
-        latex_element = page.query_selector("#latex-container")
-        if latex_element:
-            png_bytes = latex_element.screenshot()
-            b64_data = base64.b64encode(png_bytes).decode("utf-8")
-            return f"data:image/png;base64,{b64_data}"
-        else:
-            logging.warning(f"LaTeX 렌더링 실패: {latex_code[:50]}...")
-            return ""
-    finally:
-        page.close()
 
+def _add_job(jobs: Dict[RenderJob, int], job: RenderJob) -> str:
+    """렌더링 작업을 중복 없이 등록하고 플레이스홀더 반환"""
+    index = jobs.setdefault(job, len(jobs))
+    return f"\x00R{index}\x00"
 
-def replace_mermaid_with_images(
-    md_text: str, output_dir: str = "mermaid_diagrams", use_base64: bool = False
+
+# 단일 패스 스캐너 토큰: 이스케이프, 펜스 후보(줄 맨 앞일 때만 펜스), 코드 스팬, 블록/인라인 수식
+# 선두 문자 전방 탐색으로 \, `, ~, $ 이외의 위치는 분기 시도 없이 건너뜀
+_TOKEN_RE = re.compile(
+    r"(?=[\\`~$])"
+    r"(?:(?P<escape>\\[`$])"
+    r"|(?P<fence>`{3,}|~{3,})"
+    r"|(?P<code>`+)"
+    r"|(?P<display>\$\$)"
+    r"|\$(?P<inline>[^\n]+?)(?<!\$)\$(?!\$))"
+)
+
+
+@lru_cache(maxsize=None)
+def _fence_closing_re(mark: str) -> "re.Pattern[str]":
+    """여는 펜스(``` 또는 ~~~)와 같은 문자, 같거나 긴 길이의 닫는 펜스 줄 패턴"""
+    return re.compile(rf"^[ \t]*{re.escape(mark[0])}{{{len(mark)},}}[ \t]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def _code_span_closing_re(run: str) -> "re.Pattern[str]":
+    """여는 백틱 열과 길이가 정확히 같은 닫는 백틱 열 패턴"""
+    return re.compile(rf"(?<!`){run}(?!`)")
+
+
+def _scan_markdown(
+    md_text: str, jobs: Dict[RenderJob, int], mermaid: bool = True, latex: bool = True
 ) -> str:
-    """Markdown의 Mermaid 코드 블록을 이미지로 변환
+    """Markdown을 한 번 훑으며 Mermaid 블록과 LaTeX 수식을 플레이스홀더로 치환
+
+    펜스 코드 블록(```, ~~~)과 코드 스팬(`...`)은 그대로 복사하므로 코드 안의 $는
+    수식으로 처리하지 않으며, \\$는 수식 구분자가 아닌 $ 문자로 출력한다.
+    닫히지 않는 구분자는 다시 검색하지 않아 문서 길이에 선형으로 동작한다.
 
     Args:
         md_text: Markdown 텍스트
-        output_dir: PNG 파일 저장 디렉토리 (use_base64=True일 때 미사용)
-        use_base64: True면 Base64로 인코딩, False면 파일 경로 사용
+        jobs: 렌더링 작업 → 인덱스 (등록 순서 유지, 결과가 여기에 추가됨)
+        mermaid: True면 ```mermaid 블록을 렌더링 작업으로 수집
+        latex: True면 $$...$$ / $...$ 수식을 렌더링 작업으로 수집
 
     Returns:
-        Mermaid 블록이 이미지로 치환된 Markdown
+        플레이스홀더로 치환된 Markdown
     """
-    if not use_base64:
-        os.makedirs(output_dir, exist_ok=True)
+    pieces: List[str] = []
+    position = 0  # 아직 출력하지 않은 원문 시작 위치
+    scan_from = 0
+    display_closed = True  # False면 이후에 닫는 $$가 없음 (재검색 생략)
+    paragraph_end = -1  # 현재 문단 끝 (코드 스팬은 빈 줄을 넘지 않음)
+    unclosed_runs: Dict[str, int] = {}  # 백틱 열 → 닫는 열이 없는 문단의 끝 위치
+    simple_count = 0  # 렌더링 없이 텍스트로 치환한 수식 수
+
+    while True:
+        match = _TOKEN_RE.search(md_text, scan_from)
+        if match is None:
+            break
+        start, end = match.span()
+        token = match.lastgroup
+
+        if token == "escape":
+            if latex and md_text[end - 1] == "$":
+                pieces.append(md_text[position:start])
+                pieces.append("$")
+                position = end
+            scan_from = end
+            continue
+
+        if token == "fence":
+            line_start = md_text.rfind("\n", 0, start) + 1
+            mark = match.group("fence")
+            if md_text[line_start:start].strip(" \t"):
+                # 줄 중간의 ``` 는 코드 스팬, ~~~ 는 일반 텍스트
+                if mark[0] == "~":
+                    scan_from = end
+                    continue
+                token = "code"
+            else:
+                line_end = md_text.find("\n", end)
+                body_start = len(md_text) if line_end < 0 else line_end + 1
+                closing_match = _fence_closing_re(mark).search(md_text, body_start)
+                block_end = closing_match.end() if closing_match else len(md_text)
+                info = md_text[end:body_start].split()
+                if mermaid and closing_match and info and info[0] == "mermaid":
+                    code = md_text[body_start : closing_match.start()].strip()
+                    pieces.append(md_text[position:start])
+                    pieces.append(_add_job(jobs, RenderJob("mermaid", code)))
+                    position = block_end
+                scan_from = block_end
+                continue
 
-    pattern = r"```mermaid\n(.*?)```"
-    diagram_count = [0]
+        if token == "code":
+            # 같은 길이의 백틱 열로 닫히는 코드 스팬
+            run = match.group()
+            if paragraph_end < end:
+                paragraph_end = md_text.find("\n\n", end)
+                paragraph_end = len(md_text) if paragraph_end < 0 else paragraph_end
+            closing_match = None
+            if unclosed_runs.get(run) != paragraph_end:
+                closing_match = _code_span_closing_re(run).search(md_text, end, paragraph_end)
+            if closing_match is None:
+                unclosed_runs[run] = paragraph_end
+            scan_from = closing_match.end() if closing_match else end
+
+        elif not latex:
+            scan_from = end
+
+        elif token == "display":
+            close = md_text.find("$$", end) if display_closed else -1
+            if close < 0:
+                display_closed = False
+                scan_from = end
+                continue
+            latex_code = md_text[end:close].strip()
+            pieces.append(md_text[position:start])
+            if is_simple_text(latex_code):
+                simple_count += 1
+                pieces.append(
+                    f'<div style="text-align: center; margin: 1rem 0; font-weight: bold;">{latex_code}</div>'
+                )
+            else:
+                pieces.append(_add_job(jobs, RenderJob("latex", latex_code, True)))
+            position = scan_from = close + 2
 
-    def replace_block(match):
-        mermaid_code = match.group(1).strip()
-        diagram_count[0] += 1
+        else:
+            latex_code = match.group("inline").strip()
+            pieces.append(md_text[position:start])
+            if is_simple_text(latex_code):
+                simple_count += 1
+                pieces.append(f"<code>{latex_code}</code>")
+            else:
+                pieces.append(_add_job(jobs, RenderJob("latex", latex_code, False)))
+            position = scan_from = end
 
-        logging.debug(f"Mermaid 다이어그램 {diagram_count[0]} 렌더링 중...")
+    pieces.append(md_text[position:])
+    profile = current_profile()
+    if profile is not None and simple_count:
+        profile.record("math.text", 0.0, simple_count)
+    return "".join(pieces)
 
-        if use_base64:
-            img_src = render_mermaid_base64(mermaid_code)
-        else:
-            png_filename = f"diagram_{diagram_count[0]:03d}.png"
-            png_path = os.path.join(output_dir, png_filename)
-            render_mermaid_to_png(mermaid_code, png_path)
-            img_src = f"{output_dir}/{png_filename}"
 
-        return f'<img src="{img_src}" alt="Mermaid Diagram {diagram_count[0]}" style="max-width: 100%;" />'
+def extract_mermaid_jobs(md_text: str, jobs: Dict[RenderJob, int]) -> str:
+    """Mermaid 코드 블록을 플레이스홀더로 치환하며 렌더링 작업 수집
+
+    Args:
+        md_text: Markdown 텍스트
+        jobs: 렌더링 작업 → 인덱스 (등록 순서 유지, 결과가 여기에 추가됨)
+
+    Returns:
+        Mermaid 블록이 플레이스홀더로 치환된 Markdown
+    """
+    return _scan_markdown(md_text, jobs, mermaid=True, latex=False)
 
-    return re.sub(pattern, replace_block, md_text, flags=re.DOTALL)
 
+def extract_latex_jobs(md_text: str, jobs: Dict[RenderJob, int]) -> str:
+    """LaTeX 수식을 플레이스홀더로 치환하며 렌더링 작업 수집
 
-def is_simple_text(text: str) -> bool:
-    """LaTeX 명령어가 없는 단순 텍스트인지 판별
+    LaTeX 명령어가 없는 단순 텍스트는 렌더링하지 않고 바로 HTML로 치환한다.
+    코드 블록과 코드 스팬 안의 $는 수식으로 처리하지 않는다.
 
     Args:
-        text: 검사할 텍스트
+        md_text: Markdown 텍스트
+        jobs: 렌더링 작업 → 인덱스 (등록 순서 유지, 결과가 여기에 추가됨)
 
     Returns:
-        True면 단순 텍스트, False면 LaTeX 수식
+        수식이 플레이스홀더로 치환된 Markdown
     """
-    # LaTeX 명령어 패턴: \command, {}, ^, _, 등
-    latex_patterns = [r"\\[a-zA-Z]+", r"[_^{}]", r"\\[^a-zA-Z]"]
-    for pattern in latex_patterns:
-        if re.search(pattern, text):
-            return False
-    return True
+    return _scan_markdown(md_text, jobs, mermaid=False, latex=True)
 
 
-def replace_latex_with_images(
-    md_text: str, output_dir: str = "latex_equations", use_base64: bool = False
+def _check_image_format(image_format: str) -> None:
+    """지원하지 않는 렌더링 결과 형식이면 ValueError"""
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(
+            f"지원하지 않는 이미지 형식: {image_format} (가능: {', '.join(IMAGE_FORMATS)})"
+        )
+
+
+def _check_math_mode(math: str) -> None:
+    """지원하지 않는 수식 출력 방식이면 ValueError"""
+    if math not in MATH_MODES:
+        raise ValueError(f"지원하지 않는 수식 출력 방식: {math} (가능: {', '.join(MATH_MODES)})")
+
+
+def _is_fast_math(job: RenderJob, math: str) -> bool:
+    """math="fast"에서 브라우저 없이 HTML로 출력하는 수식인지 판별"""
+    return (
+        math == "fast"
+        and job.kind == "latex"
+        and latex_to_html(job.code, job.display_mode) is not None
+    )
+
+
+def _skips_render(job: RenderJob, math: str) -> bool:
+    """브라우저 렌더링을 생략하는 작업인지 판별 (tex 수식 또는 빠른 경로 수식)"""
+    return (math == "tex" and job.kind == "latex") or _is_fast_math(job, math)
+
+
+def _jobs_to_render(jobs: List[RenderJob], math: str) -> List[RenderJob]:
+    """브라우저 렌더링이 필요한 작업만 반환 (math="tex"면 수식, "fast"면 단순 수식 제외)
+
+    math="fast"면 빠른 경로("math.fast")와 브라우저("math.browser")로 처리한
+    수식 수를 프로파일에 기록한다.
+    """
+    _check_math_mode(math)
+    if math == "image":
+        return jobs
+    if math == "tex":
+        return [job for job in jobs if job.kind != "latex"]
+
+    with profile_stage("math.fast") as stage:
+        render_list = [job for job in jobs if not _is_fast_math(job, math)]
+        fallback = sum(job.kind == "latex" for job in render_list)
+        stage.count = sum(job.kind == "latex" for job in jobs) - fallback
+    logging.debug(f"수식 {stage.count}개 빠른 경로, {fallback}개 브라우저 렌더링")
+    if stage.profile is not None and fallback:
+        stage.profile.record("math.browser", 0.0, fallback)
+    return render_list
+
+
+def _merge_rendered(
+    jobs: List[RenderJob], math: str, rendered: Sequence[Rendered]
+) -> List[Rendered]:
+    """_jobs_to_render 순서의 렌더링 결과를 전체 jobs 순서로 확장 (생략한 수식은 빈 바이트)"""
+    if math == "image":
+        return list(rendered)
+    results = iter(rendered)
+    return [b"" if _skips_render(job, math) else next(results) for job in jobs]
+
+
+def _cache_lookup(
+    jobs: List[RenderJob],
+    cache: Optional[RenderCache],
+    image_format: str = "png",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+    capture: Optional[str] = None,
+) -> Tuple[List[Optional[str]], List[Optional[bytes]]]:
+    """렌더링 작업별 캐시 키와 캐시 조회 결과 반환 (미스는 None)
+
+    PNG 최적화 옵션이 있으면 최적화된 결과를 별도 키로 캐시하고, 수식 PNG는
+    촬영 방식(capture, None이면 latex_capture_mode)별로 별도 키를 사용한다.
+    """
+    if cache is None:
+        return [None] * len(jobs), [None] * len(jobs)
+
+    result_format = _result_format(image_format, optimize_images)
+    if image_format == "png" and capture is None:
+        capture = latex_capture_mode()
+    keys = [
+        RenderCache.make_key(
+            job.kind,
+            job.code,
+            job.display_mode,
+            MERMAID_THEME,
+            result_format,
+            capture if job.kind == "latex" and image_format == "png" else None,
+        )
+        for job in jobs
+    ]
+    return list(keys), [_cache_get(cache, key) for key in keys]
+
+
+def _cache_get(cache: RenderCache, key: str) -> Optional[bytes]:
+    """캐시 조회 (캐시 오류는 렌더링을 실패시키지 않고 미스로 처리)"""
+    try:
+        return cache.get(key)
+    except OSError as e:
+        logging.warning(f"렌더 캐시 조회 실패, 다시 렌더링: {e}")
+        return None
+
+
+def _result_format(image_format: str, optimize_images: Optional[ImageOptimizeOptions]) -> str:
+    """캐시 키용 결과 형식 (PNG 최적화 옵션 포함)"""
+    if optimize_images is None or image_format != "png":
+        return image_format
+    return f"{image_format}:{optimize_images.cache_tag()}"
+
+
+def _optimize_rendered(
+    rendered: List[bytes],
+    image_format: str,
+    optimize_images: Optional[ImageOptimizeOptions],
+) -> List[bytes]:
+    """새로 렌더링한 PNG를 최적화 (옵션이 없거나 SVG 출력이면 그대로 반환)"""
+    if optimize_images is None or image_format != "png" or not rendered:
+        return rendered
+    with profile_stage("optimize", len(rendered)) as stage:
+        rendered, stats = optimize_png_list(rendered, optimize_images)
+        stage.bytes = stats.saved_bytes
+    return rendered
+
+
+def _cache_store(
+    keys: List[Optional[str]],
+    png_list: List[Optional[bytes]],
+    missing: List[int],
+    rendered: List[bytes],
+    cache: Optional[RenderCache],
+) -> List[bytes]:
+    """새로 렌더링한 결과를 채우고 캐시에 저장한 뒤 전체 결과 목록 반환"""
+    for index, png_bytes in zip(missing, rendered):
+        png_list[index] = png_bytes
+        key = keys[index]
+        if cache is not None and key is not None and png_bytes:
+            try:
+                cache.put(key, png_bytes)
+            except OSError as e:
+                # 캐시 저장 실패는 렌더링 결과에 영향이 없으므로 경고만 남김
+                logging.warning(f"렌더 캐시 저장 실패: {e}")
+
+    return [png_bytes or b"" for png_bytes in png_list]
+
+
+def _profile_rendered(
+    stage: str, start: float, jobs: List[RenderJob], rendered: List[bytes], **fields
+) -> None:
+    """렌더링 묶음의 소요 시간을 render.<stage> 단계와 항목별로 기록 (프로파일이 없으면 무시)
+
+    여러 항목을 한 번에 렌더링한 경우 항목별 시간은 묶음 시간을 균등 분배한 값이다.
+    """
+    profile = current_profile()
+    if profile is None or not jobs:
+        return
+    seconds = time.perf_counter() - start
+    profile.record(f"render.{stage}", seconds, len(jobs), sum(len(data) for data in rendered))
+    share = seconds / len(jobs)
+    for job, data in zip(jobs, rendered):
+        profile.record_item(
+            job.kind, share, len(data), code=job.code[:80], batched=len(jobs) > 1, **fields
+        )
+
+
+def _render_uncached(
+    jobs: List[RenderJob], image_format: str = "png", capture: Optional[str] = None
+) -> List[bytes]:
+    """렌더링 작업을 현재 스레드의 브라우저로 렌더링 (수식은 일괄 렌더링)
+
+    Args:
+        jobs: 렌더링 작업 목록
+        image_format: "png" 또는 "svg"
+        capture: 수식 PNG 촬영 방식 (None이면 latex_capture_mode, 데몬은 호출자가
+            캐시 키에 사용한 방식을 전달받음)
+
+    Returns:
+        jobs 순서와 동일한 렌더링 결과 목록 (PNG 바이트 또는 UTF-8 SVG/MathML 마크업)
+    """
+    png_list: List[bytes] = [b""] * len(jobs)
+
+    mermaid_indices = [index for index, job in enumerate(jobs) if job.kind == "mermaid"]
+    if mermaid_indices:
+        logging.debug(f"Mermaid 다이어그램 {len(mermaid_indices)}개 일괄 렌더링 중...")
+        start = time.perf_counter()
+        codes = [jobs[index].code for index in mermaid_indices]
+        if image_format == "svg":
+            rendered = [svg.encode("utf-8") for svg in render_mermaid_svg_batch(codes)]
+        else:
+            rendered = render_mermaid_batch(codes)
+        for index, png_bytes in zip(mermaid_indices, rendered):
+            png_list[index] = png_bytes
+        _profile_rendered("mermaid", start, [jobs[index] for index in mermaid_indices], rendered)
+
+    latex_indices = [index for index, job in enumerate(jobs) if job.kind == "latex"]
+    if latex_indices:
+        logging.debug(f"수식 {len(latex_indices)}개 일괄 렌더링 중...")
+        start = time.perf_counter()
+        items = [(jobs[index].code, jobs[index].display_mode) for index in latex_indices]
+        if image_format == "svg":
+            rendered = [markup.encode("utf-8") for markup in render_latex_mathml_batch(items)]
+        elif capture is None:
+            rendered = render_latex_batch(items)
+        else:
+            rendered = render_latex_batch(items, sprite=capture == "sprite")
+        for index, png_bytes in zip(latex_indices, rendered):
+            png_list[index] = png_bytes
+        _profile_rendered("latex", start, [jobs[index] for index in latex_indices], rendered)
+
+    return png_list
+
+
+def _render_in_worker(jobs: List[RenderJob], image_format: str = "png") -> List[bytes]:
+    """작업자 스레드 전용 브라우저로 렌더링하고 종료 시 브라우저 정리"""
+    try:
+        return _render_uncached(jobs, image_format)
+    finally:
+        _cleanup_browser()
+
+
+def _render_with_daemon(
+    jobs: List[RenderJob], image_format: str, capture: Optional[str] = None
+) -> Optional[List[bytes]]:
+    """설정된 렌더링 데몬으로 렌더링 (데몬 미설정, 작업 없음, 연결 실패 시 None)"""
+    daemon = get_render_daemon()
+    if daemon is None or not jobs:
+        return None
+    try:
+        start = time.perf_counter()
+        rendered = daemon.render(jobs, image_format, capture)
+        _profile_rendered("daemon", start, jobs, rendered)
+        return rendered
+    except OSError as e:
+        logging.warning(f"렌더링 데몬 사용 불가, 직접 렌더링: {e}")
+        return None
+
+
+def render_jobs(
+    jobs: List[RenderJob],
+    cache: Optional[RenderCache] = None,
+    workers: int = 1,
+    image_format: str = "png",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+) -> List[bytes]:
+    """수집된 렌더링 작업을 렌더링 (캐시 우선 조회, 선택적 병렬 렌더링)
+
+    workers가 2 이상이면 캐시에 없는 작업을 작업자 수만큼 나누어 각자 별도의
+    Chromium 브라우저에서 동시에 렌더링한다. 수식 촬영 방식은 묶음 크기와 무관하게
+    정해지므로(latex_capture_mode) 결과는 순차 렌더링과 순서와 바이트 모두 동일하다.
+    optimize_images가 주어지면 새로 렌더링한 PNG를 스레드 풀에서 최적화한 뒤
+    캐시에 저장하므로 캐시 적중 시에는 최적화 비용이 들지 않는다.
+    렌더링 데몬이 설정되어 있으면(get_render_daemon) 캐시에 없는 작업을 데몬의 상주
+    브라우저로 렌더링하며, 데몬에 연결할 수 없으면 현재 프로세스에서 렌더링한다.
+
+    Args:
+        jobs: 중복이 제거된 렌더링 작업 목록
+        cache: 렌더 캐시 (None이면 매번 렌더링)
+        workers: 동시 렌더링 브라우저 수
+        image_format: "png"면 스크린샷 PNG 바이트, "svg"면 Mermaid SVG와
+            KaTeX MathML 마크업(UTF-8 바이트)
+        optimize_images: PNG 최적화 옵션 (None이면 최적화하지 않음,
+            helper_image_optimize.ImageOptimizeOptions 참고)
+
+    Returns:
+        jobs 순서와 동일한 렌더링 결과 목록
+    """
+    _check_image_format(image_format)
+    if optimize_images is not None:
+        check_image_optimize_options(optimize_images)
+    capture = latex_capture_mode() if image_format == "png" else None
+    with profile_stage("cache") as stage:
+        keys, png_list = _cache_lookup(jobs, cache, image_format, optimize_images, capture)
+        missing = [index for index, png_bytes in enumerate(png_list) if png_bytes is None]
+        stage.count = len(jobs) - len(missing)
+    _profile_cache_hits(jobs, png_list)
+    workers = max(1, min(workers, len(missing)))
+    rendered = _render_with_daemon([jobs[index] for index in missing], image_format, capture)
+
+    if rendered is None and workers == 1:
+        rendered = _render_uncached([jobs[index] for index in missing], image_format)
+    elif rendered is None:
+        # 라운드 로빈 분배로 작업자별 부하 균형 유지
+        chunks = [missing[offset::workers] for offset in range(workers)]
+        rendered = [b""] * len(missing)
+        position = {index: pos for pos, index in enumerate(missing)}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                in_context(_render_in_worker),
+                [[jobs[index] for index in chunk] for chunk in chunks],
+                [image_format] * workers,
+            )
+            for chunk, chunk_result in zip(chunks, results):
+                for index, png_bytes in zip(chunk, chunk_result):
+                    rendered[position[index]] = png_bytes
+
+    rendered = _optimize_rendered(rendered, image_format, optimize_images)
+    return _cache_store(keys, png_list, missing, rendered, cache)
+
+
+def _profile_cache_hits(jobs: List[RenderJob], png_list: List[Optional[bytes]]) -> None:
+    """캐시에서 찾은 렌더링 결과를 항목별로 기록 (프로파일이 없으면 무시)"""
+    profile = current_profile()
+    if profile is None:
+        return
+    for job, data in zip(jobs, png_list):
+        if data is not None:
+            profile.record_item(job.kind, 0.0, len(data), code=job.code[:80], cached=True)
+
+
+# 스트리밍 Base64 인코딩 청크 크기 (3의 배수라 청크별 인코딩 결과를 이어 붙여도 유효함)
+BASE64_CHUNK_SIZE = 3 * 64 * 1024
+
+# 스트리밍 변환 시 한 번에 렌더링하여 임시 파일로 내보내는 작업 수 (메모리 상한)
+STREAM_RENDER_BATCH = 256
+
+_SRC_MARKER = "\x00SRC\x00"
+
+
+def _open_rendered(rendered: Rendered) -> BinaryIO:
+    """렌더링 결과를 읽기용 바이너리 파일 객체로 반환"""
+    if isinstance(rendered, bytes):
+        return io.BytesIO(rendered)
+    return open(rendered, "rb")
+
+
+def _rendered_size(rendered: Rendered) -> int:
+    """렌더링 결과 크기 (바이트)"""
+    if isinstance(rendered, bytes):
+        return len(rendered)
+    return os.path.getsize(rendered)
+
+
+def _image_tag(job: RenderJob, number: int, img_src: str) -> str:
+    """렌더링 작업 종류에 맞는 이미지 태그 생성"""
+    if job.kind == "mermaid":
+        return f'<img src="{img_src}" alt="Mermaid Diagram {number}" style="max-width: 100%;" />'
+    if job.display_mode:
+        return f'<div style="text-align: center; margin: 1rem 0;"><img src="{img_src}" alt="Equation {number}" style="display: block; margin: 0 auto;" /></div>'
+    return f'<img src="{img_src}" alt="Equation {number}" style="display: inline-block; vertical-align: middle;" />'
+
+
+def _rendered_tags(
+    jobs: List[RenderJob],
+    png_list: Sequence[Rendered],
+    use_base64: bool,
+    mermaid_dir: str,
+    latex_dir: str,
+    image_format: str,
+    math: str,
+    media_dir: Optional[str] = None,
+) -> List[Tuple[str, Optional[Rendered], str]]:
+    """작업별 (태그 앞부분, 사이에 Base64로 삽입할 렌더링 결과 또는 None, 태그 뒷부분) 목록
+
+    use_base64=False면 이미지 파일을 저장하고 완성된 태그를 앞부분에 담는다.
+    media_dir이 주어지면 mermaid_dir/latex_dir은 media_dir 기준 상대 경로로 취급한다.
+    Base64 인코딩은 호출자가 수행하므로 스트리밍 출력 시 청크 단위로 기록할 수 있다.
+    """
+    tags: List[Tuple[str, Optional[Rendered], str]] = []
+    diagram_count = equation_count = 0
+    extension = image_format
+    mime_type = "image/svg+xml" if image_format == "svg" else "image/png"
+
+    for job, rendered in zip(jobs, png_list):
+        if job.kind == "mermaid":
+            diagram_count += 1
+            number = diagram_count
+            output_dir = mermaid_dir
+            png_filename = f"diagram_{number:03d}.{extension}"
+        else:
+            equation_count += 1
+            number = equation_count
+            if math == "tex":
+                # Pandoc tex_math_single_backslash 확장이 TeX 수식으로 읽는 구분자
+                opening, closing = (r"\[", r"\]") if job.display_mode else (r"\(", r"\)")
+                tags.append((f"{opening}{escape(job.code, quote=False)}{closing}", None, ""))
+                continue
+            fast_markup = latex_to_html(job.code, job.display_mode) if math == "fast" else None
+            if fast_markup is not None:
+                tags.append((fast_markup, None, ""))
+                continue
+            if image_format == "svg":
+                # MathML은 브라우저가 직접 표시하므로 파일/Base64 없이 인라인 삽입
+                with _open_rendered(rendered) as f:
+                    markup = f.read().decode("utf-8")
+                if job.display_mode:
+                    markup = f'<div style="text-align: center; margin: 1rem 0;">{markup}</div>'
+                tags.append((markup, None, ""))
+                continue
+            output_dir = latex_dir
+            kind = "display" if job.display_mode else "inline"
+            png_filename = f"eq_{kind}_{number:03d}.png"
+
+        if use_base64:
+            prefix, suffix = _image_tag(job, number, _SRC_MARKER).split(_SRC_MARKER)
+            if _rendered_size(rendered):
+                tags.append((f"{prefix}data:{mime_type};base64,", rendered, suffix))
+            else:
+                tags.append((prefix + suffix, None, ""))
+            continue
+
+        file_dir = output_dir if media_dir is None else os.path.join(media_dir, output_dir)
+        os.makedirs(file_dir, exist_ok=True)
+        if _rendered_size(rendered):
+            with _open_rendered(rendered) as src, open(
+                os.path.join(file_dir, png_filename), "wb"
+            ) as dst:
+                shutil.copyfileobj(src, dst)
+        tags.append((_image_tag(job, number, f"{output_dir}/{png_filename}"), None, ""))
+
+    return tags
+
+
+def restore_rendered_images(
+    md_text: str,
+    jobs: List[RenderJob],
+    png_list: Sequence[Rendered],
+    use_base64: bool = False,
+    mermaid_dir: str = "mermaid_diagrams",
+    latex_dir: str = "latex_equations",
+    image_format: str = "png",
+    math: str = "image",
 ) -> str:
-    """Markdown의 LaTeX 수식을 PNG 이미지로 변환
+    """플레이스홀더를 렌더링된 이미지 태그로 복원
+
+    동일한 작업은 같은 이미지 소스(Base64 문자열 또는 이미지 파일)를 공유한다.
+    image_format="svg"면 Mermaid는 SVG 이미지로, 수식은 MathML 마크업을 그대로 삽입한다.
+    math="tex"면 수식은 렌더링 결과 대신 HTML 이스케이프된 \\(..\\) / \\[..\\]로 복원한다.
+    math="fast"면 빠른 경로로 처리한 수식은 Unicode + <sub>/<sup> HTML로 복원한다.
 
     Args:
-        md_text: Markdown 텍스트
-        output_dir: PNG 파일 저장 디렉토리 (use_base64=True일 때 미사용)
+        md_text: 플레이스홀더가 포함된 Markdown 또는 HTML
+        jobs: 중복이 제거된 렌더링 작업 목록
+        png_list: jobs 순서와 동일한 렌더링 결과 목록 (render_jobs 반환값 또는 파일 경로)
         use_base64: True면 Base64로 인코딩, False면 파일 경로 사용
+        mermaid_dir: Mermaid 이미지 저장 디렉토리 (use_base64=True일 때 미사용)
+        latex_dir: 수식 PNG 저장 디렉토리 (use_base64=True 또는 svg일 때 미사용)
+        image_format: render_jobs에 전달한 결과 형식 ("png" 또는 "svg")
+        math: 수식 출력 방식 ("image", "tex" 또는 "fast")
 
     Returns:
-        LaTeX 수식이 이미지로 치환된 Markdown
+        플레이스홀더가 이미지 태그로 치환된 텍스트
     """
-    if not use_base64:
-        os.makedirs(output_dir, exist_ok=True)
+    tags = []
+    for prefix, rendered, suffix in _rendered_tags(
+        jobs, png_list, use_base64, mermaid_dir, latex_dir, image_format, math
+    ):
+        if rendered is not None:
+            with _open_rendered(rendered) as f:
+                prefix += base64.b64encode(f.read()).decode("utf-8")
+        tags.append(prefix + suffix)
 
-    equation_count = [0]
+    return re.sub(r"\x00R(\d+)\x00", lambda match: tags[int(match.group(1))], md_text)
 
-    def replace_display_math(match):
-        """블록 수식 $$...$$ 치환"""
-        latex_code = match.group(1).strip()
 
-        if is_simple_text(latex_code):
-            return f'<div style="text-align: center; margin: 1rem 0; font-weight: bold;">{latex_code}</div>'
+def replace_mermaid_with_images(
+    md_text: str,
+    output_dir: str = "mermaid_diagrams",
+    use_base64: bool = False,
+    cache: Optional[RenderCache] = None,
+) -> str:
+    """Markdown의 Mermaid 코드 블록을 이미지로 변환
 
-        equation_count[0] += 1
-        logging.debug(f"블록 수식 {equation_count[0]} 렌더링 중...")
+    Args:
+        md_text: Markdown 텍스트
+        output_dir: PNG 파일 저장 디렉토리 (use_base64=True일 때 미사용)
+        use_base64: True면 Base64로 인코딩, False면 파일 경로 사용
+        cache: 렌더 캐시 (None이면 매번 렌더링)
 
-        if use_base64:
-            img_src = render_latex_base64(latex_code, display_mode=True)
-        else:
-            png_filename = f"eq_display_{equation_count[0]:03d}.png"
-            png_path = os.path.join(output_dir, png_filename)
-            render_latex_to_png(latex_code, png_path, display_mode=True)
-            img_src = f"{output_dir}/{png_filename}"
+    Returns:
+        Mermaid 블록이 이미지로 치환된 Markdown
+    """
+    jobs: Dict[RenderJob, int] = {}
+    md_text = extract_mermaid_jobs(md_text, jobs)
+    job_list = list(jobs)
+    png_list = render_jobs(job_list, cache)
+    return restore_rendered_images(md_text, job_list, png_list, use_base64, mermaid_dir=output_dir)
 
-        return f'<div style="text-align: center; margin: 1rem 0;"><img src="{img_src}" alt="Equation {equation_count[0]}" style="display: block; margin: 0 auto;" /></div>'
 
-    def replace_inline_math(match):
-        """인라인 수식 $...$ 치환"""
-        latex_code = match.group(1).strip()
+# LaTeX 명령어 패턴: \command, {}, ^, _, 등
+_LATEX_COMMAND_RE = re.compile(r"\\[a-zA-Z]+|[_^{}]|\\[^a-zA-Z]")
 
-        if is_simple_text(latex_code):
-            return f"<code>{latex_code}</code>"
 
-        equation_count[0] += 1
-        logging.debug(f"인라인 수식 {equation_count[0]} 렌더링 중...")
+def is_simple_text(text: str) -> bool:
+    """LaTeX 명령어가 없는 단순 텍스트인지 판별
 
-        if use_base64:
-            img_src = render_latex_base64(latex_code, display_mode=False)
-        else:
-            png_filename = f"eq_inline_{equation_count[0]:03d}.png"
-            png_path = os.path.join(output_dir, png_filename)
-            render_latex_to_png(latex_code, png_path, display_mode=False)
-            img_src = f"{output_dir}/{png_filename}"
+    Args:
+        text: 검사할 텍스트
 
-        return f'<img src="{img_src}" alt="Equation {equation_count[0]}" style="display: inline-block; vertical-align: middle;" />'
+    Returns:
+        True면 단순 텍스트, False면 LaTeX 수식
+    """
+    return _LATEX_COMMAND_RE.search(text) is None
 
-    md_text = re.sub(r"\$\$(.*?)\$\$", replace_display_math, md_text, flags=re.DOTALL)
-    md_text = re.sub(r"(?<!\$)\$(?!\$)(.+?)(?<!\$)\$(?!\$)", replace_inline_math, md_text)
 
-    return md_text
+def replace_latex_with_images(
+    md_text: str,
+    output_dir: str = "latex_equations",
+    use_base64: bool = False,
+    cache: Optional[RenderCache] = None,
+) -> str:
+    """Markdown의 LaTeX 수식을 PNG 이미지로 변환
+
+    Args:
+        md_text: Markdown 텍스트
+        output_dir: PNG 파일 저장 디렉토리 (use_base64=True일 때 미사용)
+        use_base64: True면 Base64로 인코딩, False면 파일 경로 사용
+        cache: 렌더 캐시 (None이면 매번 렌더링)
+
+    Returns:
+        LaTeX 수식이 이미지로 치환된 Markdown
+    """
+    jobs: Dict[RenderJob, int] = {}
+    md_text = extract_latex_jobs(md_text, jobs)
+    job_list = list(jobs)
+    png_list = render_jobs(job_list, cache)
+    return restore_rendered_images(md_text, job_list, png_list, use_base64, latex_dir=output_dir)
 
 
 def is_list_or_special_line(line: str) -> bool:
@@ -560,72 +1570,523 @@ def normalize_markdown_spacing(md_text: str) -> str:
     return "\n".join(result_lines)
 
 
-def md_to_html(md_text: str, title: Optional[str] = None, use_base64: bool = False) -> str:
-    """Markdown을 HTML로 변환하고 Mermaid/LaTeX를 PNG 이미지로 렌더링
+def md_to_html(
+    md_text: str,
+    title: Optional[str] = None,
+    use_base64: bool = False,
+    cache: Optional[RenderCache] = None,
+    workers: int = 1,
+    image_format: str = "png",
+    math: str = "image",
+    media_dir: Optional[str] = None,
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+    profile: Optional[ConversionProfile] = None,
+    session: Optional[RenderSession] = None,
+) -> str:
+    """Markdown을 HTML로 변환하고 Mermaid/LaTeX를 이미지로 렌더링
 
     Args:
         md_text: Markdown 텍스트
         title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
         use_base64: True면 이미지를 Base64로 인코딩하여 HTML에 임베드
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        workers: 동시 렌더링 브라우저 수 (1이면 순차 렌더링)
+        image_format: "png"면 스크린샷 PNG, "svg"면 Mermaid SVG와 KaTeX MathML
+            (스크린샷 없이 벡터 출력, DOCX 변환에는 "png" 사용)
+        math: "image"면 수식을 image_format으로 렌더링, "tex"면 렌더링 없이
+            \\(..\\) / \\[..\\] TeX로 출력 (Pandoc OMML 변환용), "fast"면 단순한 수식
+            (첨자, 그리스 문자, 연산자 등)은 브라우저 없이 HTML로, 나머지는 이미지로 출력
+        media_dir: use_base64=False일 때 이미지 파일을 저장할 디렉토리
+            (write_html 참고, None이면 패키지 상위의 mermaid_diagrams/latex_equations)
+        optimize_images: PNG 여백 제거/색상 축소/재압축 옵션 (None이면 원본 스크린샷,
+            Pillow 필요: pip install helper-md-doc[image])
+        profile: 단계별 소요 시간/바이트와 렌더링 항목을 기록할 ConversionProfile
+            (None이면 기록하지 않음, 호출한 쪽에서 활성화한 프로파일은 그대로 사용)
+        session: 브라우저를 소유하고 호출 간에 재사용할 RenderSession
+            (None이면 활성 세션 또는 모듈 전역 브라우저 사용)
 
     Returns:
         완성된 HTML 문자열
     """
-    if title is None:
-        h1_match = re.search(r"^#\s+(.+)$", md_text, re.MULTILINE)
-        title = h1_match.group(1).strip() if h1_match else "Document"
+    if cache is None:
+        cache = get_render_cache()
+
+    with _using_session(session), profiling(profile), profile_stage("md_to_html") as stage:
+        # Mermaid 다이어그램과 LaTeX 수식을 모두 수집한 뒤 고유 항목만 한 번씩 렌더링
+        body_text, job_list = extract_render_jobs(md_text)
+        rendered = render_jobs(
+            _jobs_to_render(job_list, math), cache, workers, image_format, optimize_images
+        )
+        png_list = _merge_rendered(job_list, math, rendered)
+        html = build_html(
+            md_text, body_text, job_list, png_list, title, use_base64, image_format, math, media_dir
+        )
+        if stage.profile is not None:
+            stage.bytes = len(html.encode("utf-8"))
+    return html
+
+
+def extract_render_jobs(md_text: str) -> Tuple[str, List[RenderJob]]:
+    """Markdown에서 Mermaid 다이어그램과 LaTeX 수식을 중복 없이 수집
+
+    _scan_markdown 단일 패스로 추출한다. 수식/코드가 밀집한 문서에서는 이전의
+    re.sub 연쇄(Mermaid, $$, $ 순서)보다 20-40% 느리고(benchmarks/bench_extract.py,
+    2 MB 기준 약 14.5 MB/s 대 19 MB/s) 산문 위주 문서에서는 같은 수준이다.
+    이전 방식은 코드 블록/코드 스팬 안의 $와 \\$ 이스케이프를 수식으로 잘못 처리했으므로
+    정확성을 위해 이 비용을 감수한다. 추출 시간은 이후의 브라우저 렌더링에 비해 작다.
+
+    normalize_markdown_spacing은 스캔에 합치지 않고 markdown_body에서 따로 실행한다.
+    코드 블록을 포함한 모든 줄의 앞뒤 관계로 <br/>을 넣는 줄 단위 규칙이라 스캐너에
+    합치면 코드 블록 안의 출력이 달라지기 때문이다.
+
+    Args:
+        md_text: Markdown 텍스트
+
+    Returns:
+        (플레이스홀더로 치환된 Markdown, 렌더링 작업 목록)
+    """
+    jobs: Dict[RenderJob, int] = {}
+    with profile_stage("extract") as stage:
+        md_text = _scan_markdown(md_text, jobs)
+        stage.count = len(jobs)
+    return md_text, list(jobs)
+
+
+def build_html(
+    md_text: str,
+    body_text: str,
+    jobs: List[RenderJob],
+    png_list: Sequence[Rendered],
+    title: Optional[str] = None,
+    use_base64: bool = False,
+    image_format: str = "png",
+    math: str = "image",
+    media_dir: Optional[str] = None,
+) -> str:
+    """Markdown을 HTML로 변환한 뒤 플레이스홀더에 렌더링 결과를 복원
+
+    이미지 태그와 MathML은 Markdown 변환 이후에 삽입되므로 마크업 안의
+    _, *, \\ 등이 Markdown 문법으로 해석되지 않는다.
+
+    Args:
+        md_text: 원본 Markdown 텍스트 (제목 추출용)
+        body_text: extract_render_jobs가 반환한 플레이스홀더 Markdown
+        jobs: 렌더링 작업 목록
+        png_list: jobs 순서와 동일한 렌더링 결과 목록 (render_jobs 반환값)
+        title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        use_base64: True면 이미지를 Base64로 인코딩하여 HTML에 임베드
+        image_format: render_jobs에 전달한 결과 형식 ("png" 또는 "svg")
+        math: 수식 출력 방식 ("image", "tex" 또는 "fast")
+        media_dir: use_base64=False일 때 이미지 파일 저장 디렉토리 (write_html 참고)
+
+    Returns:
+        완성된 HTML 문자열
+    """
+    out = io.StringIO()
+    write_html(
+        out, md_text, body_text, jobs, png_list, title, use_base64, image_format, math, media_dir
+    )
+    return out.getvalue()
+
+
+def write_html(
+    out: TextIO,
+    md_text: str,
+    body_text: str,
+    jobs: List[RenderJob],
+    png_list: Sequence[Rendered],
+    title: Optional[str] = None,
+    use_base64: bool = False,
+    image_format: str = "png",
+    math: str = "image",
+    media_dir: Optional[str] = None,
+) -> None:
+    """build_html과 같은 HTML 문서를 파일 객체에 순서대로 기록
+
+    완성된 문서 문자열을 만들지 않고 템플릿 머리, 본문 조각, 이미지를 차례로 쓰며,
+    Base64 이미지는 BASE64_CHUNK_SIZE 단위로 인코딩하여 바로 기록한다.
+
+    Args:
+        out: 텍스트 모드 출력 파일 객체
+        md_text: 원본 Markdown 텍스트 (제목 추출용)
+        body_text: extract_render_jobs가 반환한 플레이스홀더 Markdown
+        jobs: 렌더링 작업 목록
+        png_list: jobs 순서와 동일한 렌더링 결과 (바이트 또는 결과 파일 경로)
+        title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        use_base64: True면 이미지를 Base64로 인코딩하여 HTML에 임베드
+        image_format: render_jobs에 전달한 결과 형식 ("png" 또는 "svg")
+        math: 수식 출력 방식 ("image", "tex" 또는 "fast")
+        media_dir: use_base64=False일 때 이미지 파일을 저장할 디렉토리. 주어지면 이미지는
+            media_dir/mermaid_diagrams, media_dir/latex_equations에 저장되고 태그에는
+            media_dir 기준 상대 경로가 들어간다 (Pandoc --resource-path로 해석).
+            None이면 패키지 상위 디렉토리에 저장하고 해당 경로를 사용
+    """
+    html_body = markdown_body(body_text, jobs)
+    write_html_body(
+        out, md_text, html_body, jobs, png_list, title, use_base64, image_format, math, media_dir
+    )
 
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.join(base_dir, "..")
 
-    # Mermaid 다이어그램을 이미지로 변환
-    mermaid_dir = os.path.join(parent_dir, "mermaid_diagrams")
-    md_text = replace_mermaid_with_images(md_text, mermaid_dir, use_base64)
+def markdown_body(body_text: str, jobs: List[RenderJob]) -> str:
+    """플레이스홀더 Markdown을 HTML 본문으로 변환 (플레이스홀더는 그대로 유지)
 
-    # LaTeX 수식을 이미지로 변환
-    latex_dir = os.path.join(parent_dir, "latex_equations")
-    md_text = replace_latex_with_images(md_text, latex_dir, use_base64)
+    같은 렌더링 결과로 여러 출력(HTML, DOCX 입력 HTML)을 만들 때 Markdown 파싱을
+    한 번만 수행하도록 write_html_body와 나누어 둔다.
 
+    Args:
+        body_text: extract_render_jobs가 반환한 플레이스홀더 Markdown
+        jobs: 렌더링 작업 목록
+
+    Returns:
+        플레이스홀더가 포함된 HTML 본문
+    """
     # Markdown 리스트 정규화
-    md_text = normalize_markdown_spacing(md_text)
+    with profile_stage("normalize"):
+        body_text = normalize_markdown_spacing(body_text)
+
+    import markdown
 
     extensions = ["fenced_code", "tables", "toc"]
-    html_body = markdown.markdown(md_text, extensions=extensions, output_format="html")
+    with profile_stage("markdown"):
+        html_body = markdown.markdown(body_text, extensions=extensions, output_format="html")
+
+    # 단독 문단인 블록 수식은 <p> 없이 블록 요소로 복원
+    return re.sub(
+        r"<p>(\x00R(\d+)\x00)</p>",
+        lambda match: match.group(1) if jobs[int(match.group(2))].display_mode else match.group(0),
+        html_body,
+    )
+
+
+def write_html_body(
+    out: TextIO,
+    md_text: str,
+    html_body: str,
+    jobs: List[RenderJob],
+    png_list: Sequence[Rendered],
+    title: Optional[str] = None,
+    use_base64: bool = False,
+    image_format: str = "png",
+    math: str = "image",
+    media_dir: Optional[str] = None,
+) -> None:
+    """markdown_body 결과의 플레이스홀더를 이미지 태그로 바꾸며 HTML 문서를 기록
+
+    인자는 body_text 대신 html_body(markdown_body 반환값)를 받는 것 외에는 write_html과 같다.
+    html_body와 png_list는 읽기만 하므로 여러 스레드에서 동시에 호출해도 된다.
+    """
+    if title is None:
+        h1_match = re.search(r"^#\s+(.+)$", md_text, re.MULTILINE)
+        title = h1_match.group(1).strip() if h1_match else "Document"
+
+    if media_dir is None:
+        parent_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+        mermaid_dir = os.path.join(parent_dir, "mermaid_diagrams")
+        latex_dir = os.path.join(parent_dir, "latex_equations")
+    else:
+        mermaid_dir, latex_dir = "mermaid_diagrams", "latex_equations"
+
+    with profile_stage("image_tags", len(jobs)):
+        tags = _rendered_tags(
+            jobs, png_list, use_base64, mermaid_dir, latex_dir, image_format, math, media_dir
+        )
 
     scripts = ""
 
-    return HTML_TEMPLATE.format(title=title, scripts=scripts, content=html_body)
+    # Base64 인코딩은 출력 기록과 섞여 있으므로 이미지별 시간을 합산하여 한 번에 기록
+    encoded_count, encoded_bytes, encode_seconds = 0, 0, 0.0
+    head, tail = HTML_TEMPLATE.split("{content}")
+    out.write(head.format(title=title, scripts=scripts))
+    position = 0
+    for match in re.finditer(r"\x00R(\d+)\x00", html_body):
+        out.write(html_body[position : match.start()])
+        prefix, rendered, suffix = tags[int(match.group(1))]
+        out.write(prefix)
+        if rendered is not None:
+            start = time.perf_counter()
+            with _open_rendered(rendered) as f:
+                for chunk in iter(lambda: f.read(BASE64_CHUNK_SIZE), b""):
+                    encoded = base64.b64encode(chunk).decode("ascii")
+                    out.write(encoded)
+                    encoded_bytes += len(encoded)
+            encoded_count += 1
+            encode_seconds += time.perf_counter() - start
+        out.write(suffix)
+        position = match.end()
+    out.write(html_body[position:])
+    out.write(tail.format())
+
+    profile = current_profile()
+    if profile is not None and encoded_count:
+        profile.record("base64", encode_seconds, encoded_count, encoded_bytes)
+
+
+def md_to_html_stream(
+    md_text: str,
+    out: TextIO,
+    title: Optional[str] = None,
+    use_base64: bool = False,
+    cache: Optional[RenderCache] = None,
+    workers: int = 1,
+    image_format: str = "png",
+    math: str = "image",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+    profile: Optional[ConversionProfile] = None,
+    session: Optional[RenderSession] = None,
+) -> None:
+    """md_to_html의 스트리밍 버전: 완성된 HTML을 파일 객체에 점진적으로 기록
+
+    렌더링 결과를 STREAM_RENDER_BATCH개씩 임시 파일로 내보내고, 출력 시 파일에서
+    청크 단위로 Base64 인코딩하여 기록한다. 메모리 사용량은 문서 전체가 아니라
+    Markdown 본문과 렌더링 묶음 하나, 인코딩 청크 하나 크기로 제한된다.
+
+    Args:
+        md_text: Markdown 텍스트
+        out: 텍스트 모드 출력 파일 객체
+        title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        use_base64: True면 이미지를 Base64로 인코딩하여 HTML에 임베드
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        workers: 동시 렌더링 브라우저 수 (1이면 순차 렌더링)
+        image_format: "png" 또는 "svg" (md_to_html 참고)
+        math: "image", "tex" 또는 "fast" (md_to_html 참고)
+        optimize_images: PNG 최적화 옵션 (md_to_html 참고)
+        profile: 단계별 기록용 ConversionProfile (md_to_html 참고)
+        session: 재사용할 RenderSession (md_to_html 참고)
+    """
+    if cache is None:
+        cache = get_render_cache()
+
+    with _using_session(session), profiling(profile), profile_stage("md_to_html"):
+        _md_to_html_stream(
+            md_text, out, title, use_base64, cache, workers, image_format, math, optimize_images
+        )
+
+
+def _md_to_html_stream(
+    md_text: str,
+    out: TextIO,
+    title: Optional[str],
+    use_base64: bool,
+    cache: Optional[RenderCache],
+    workers: int,
+    image_format: str,
+    math: str,
+    optimize_images: Optional[ImageOptimizeOptions],
+) -> None:
+    """md_to_html_stream 본문 (프로파일 활성화 이후 실행)"""
+    body_text, job_list = extract_render_jobs(md_text)
+    render_list = _jobs_to_render(job_list, math)
+
+    with tempfile.TemporaryDirectory(prefix="helper_md_doc_") as spool_dir:
+        paths: List[Rendered] = []
+        for offset in range(0, len(render_list), STREAM_RENDER_BATCH):
+            batch = render_list[offset : offset + STREAM_RENDER_BATCH]
+            for rendered in render_jobs(batch, cache, workers, image_format, optimize_images):
+                path = os.path.join(spool_dir, f"{len(paths):06d}.bin")
+                with open(path, "wb") as f:
+                    f.write(rendered)
+                paths.append(path)
+
+        png_list = _merge_rendered(job_list, math, paths)
+        write_html(
+            out, md_text, body_text, job_list, png_list, title, use_base64, image_format, math
+        )
+
+
+def md_file_to_html(
+    md_path: str,
+    output_path: str,
+    title: Optional[str] = None,
+    use_base64: bool = False,
+    cache: Optional[RenderCache] = None,
+    workers: int = 1,
+    incremental: bool = False,
+    image_format: str = "png",
+    math: str = "image",
+    optimize_images: Optional[ImageOptimizeOptions] = None,
+    profile: Optional[ConversionProfile] = None,
+    session: Optional[RenderSession] = None,
+) -> bool:
+    """Markdown 파일을 HTML 파일로 변환 (증분 빌드 지원)
+
+    Args:
+        md_path: 입력 Markdown 파일 경로
+        output_path: 출력 HTML 파일 경로
+        title: HTML 문서 제목 (None일 경우 첫 번째 # 헤더 사용)
+        use_base64: True면 이미지를 Base64로 인코딩하여 HTML에 임베드
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        workers: 동시 렌더링 브라우저 수 (1이면 순차 렌더링)
+        incremental: True면 출력 디렉토리의 빌드 매니페스트를 확인하여
+            입력(참조 로컬 이미지 포함)/옵션/패키지 버전이 그대로인 경우 변환을 건너뜀
+        image_format: "png" 또는 "svg" (md_to_html 참고)
+        math: "image", "tex" 또는 "fast" (md_to_html 참고)
+        optimize_images: PNG 최적화 옵션 (md_to_html 참고)
+        profile: 단계별 기록용 ConversionProfile (md_to_html 참고)
+        session: 재사용할 RenderSession (md_to_html 참고)
+
+    Returns:
+        변환을 수행했으면 True, 변경이 없어 생략했으면 False
+    """
+    _check_math_mode(math)
+    manifest = BuildManifest.for_output(output_path) if incremental else None
+    options = {
+        "target": "html",
+        "title": title,
+        "use_base64": use_base64,
+        "image_format": image_format,
+        "math": math,
+    }
+    if optimize_images is not None:
+        options["optimize_images"] = optimize_images.cache_tag()
+    if manifest is not None and manifest.is_up_to_date(md_path, output_path, options):
+        logging.info(f"변경 없음, 변환 생략: {output_path}")
+        return False
+
+    with open(md_path, "r", encoding="utf-8") as f:
+        md_text = f.read()
+
+    # 스트리밍으로 임시 파일에 기록한 뒤 교체 (실패 시 기존 출력 유지)
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            md_to_html_stream(
+                md_text,
+                f,
+                title=title,
+                use_base64=use_base64,
+                cache=cache,
+                workers=workers,
+                image_format=image_format,
+                math=math,
+                optimize_images=optimize_images,
+                profile=profile,
+                session=session,
+            )
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    if manifest is not None:
+        manifest.record(md_path, output_path, options)
+        manifest.save()
+    return True
+
+
+def add_optimize_arguments(parser: argparse.ArgumentParser) -> None:
+    """렌더링 PNG 최적화 CLI 옵션 추가 (md2html, md2doc 공용)"""
+    parser.add_argument(
+        "--optimize-images",
+        nargs="?",
+        const="auto",
+        choices=IMAGE_QUANTIZE_MODES,
+        default=None,
+        help="렌더링 PNG 여백 제거/색상 축소/재압축 (색상 축소 방식, 생략 시 auto, Pillow 필요)",
+    )
+    parser.add_argument(
+        "--max-dpi",
+        type=int,
+        default=None,
+        help="--optimize-images 사용 시 이 DPI를 넘는 이미지 축소 (스크린샷은 96 DPI)",
+    )
+
+
+def add_daemon_argument(parser: argparse.ArgumentParser) -> None:
+    """렌더링 데몬 사용 CLI 옵션 추가 (md2html, md2doc 공용)"""
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="상주 렌더링 데몬으로 렌더링 (실행 중이 아니면 기동, 유휴 시 자동 종료)",
+    )
+
+
+def use_daemon_from_args(args: argparse.Namespace) -> None:
+    """--daemon이 지정되면 기본 렌더링 데몬 클라이언트 설정"""
+    if args.daemon:
+        set_render_daemon(RenderDaemonClient())
+
+
+def optimize_options_from_args(args: argparse.Namespace) -> Optional[ImageOptimizeOptions]:
+    """CLI 인자로부터 PNG 최적화 옵션 생성 (--optimize-images가 없으면 None)"""
+    if args.optimize_images is None:
+        return None
+    return ImageOptimizeOptions(quantize=args.optimize_images, max_dpi=args.max_dpi)
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = argparse.ArgumentParser(
-        description="Markdown(.md)을 HTML로 변환하고 Mermaid/LaTeX 수식을 PNG 이미지로 렌더링합니다."
+        description="Markdown(.md)을 HTML로 변환하고 Mermaid/LaTeX 수식을 이미지로 렌더링합니다."
     )
     parser.add_argument("input", help="입력 Markdown 파일 경로 (.md)")
     parser.add_argument("-o", "--output", help="출력 HTML 파일 경로 (.html)")
     parser.add_argument("--title", default=None, help="HTML 문서 제목")
     parser.add_argument(
-        "--base64", action="store_true", help="PNG 이미지를 Base64로 인코딩하여 HTML에 임베드"
+        "--base64", action="store_true", help="이미지를 Base64로 인코딩하여 HTML에 임베드"
+    )
+    parser.add_argument(
+        "--image-format",
+        choices=IMAGE_FORMATS,
+        default="png",
+        help="렌더링 형식: png(스크린샷) 또는 svg(Mermaid SVG + KaTeX MathML, 기본값 png)",
+    )
+    parser.add_argument(
+        "--math",
+        choices=MATH_MODES,
+        default="image",
+        help="수식 출력 방식: image(렌더링 이미지), tex(렌더링 없이 TeX 원문) 또는 "
+        "fast(단순한 수식은 브라우저 없이 텍스트로, 기본값 image)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="동시 렌더링 브라우저 수 (기본값 1)"
+    )
+    parser.add_argument("--cache-dir", default=None, help="렌더링 결과 디스크 캐시 디렉토리")
+    parser.add_argument(
+        "--cache-max-mb", type=int, default=256, help="렌더 캐시 최대 용량 (MB, 기본값 256)"
+    )
+    add_optimize_arguments(parser)
+    add_daemon_argument(parser)
+    add_profile_argument(parser)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="입력(참조 로컬 이미지 포함)/옵션/버전이 이전 변환과 같으면 변환 생략 (매니페스트)",
     )
     args = parser.parse_args()
 
+    use_daemon_from_args(args)
     in_path = args.input
     if not os.path.isfile(in_path):
         logging.warning(f"파일을 찾을 수 없습니다: {in_path}")
         sys.exit(1)
 
-    with open(in_path, "r", encoding="utf-8") as f:
-        md_text = f.read()
+    cache = None
+    if args.cache_dir:
+        cache = RenderCache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
 
     title = args.title or os.path.splitext(os.path.basename(in_path))[0]
-    html = md_to_html(md_text, title=title, use_base64=args.base64)
-
     out_path = args.output or os.path.splitext(in_path)[0] + ".html"
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    profile = profile_from_args(args)
+    md_file_to_html(
+        in_path,
+        out_path,
+        title=title,
+        use_base64=args.base64,
+        cache=cache,
+        workers=args.jobs,
+        incremental=args.incremental,
+        image_format=args.image_format,
+        math=args.math,
+        optimize_images=optimize_options_from_args(args),
+        profile=profile,
+    )
 
     _cleanup_browser()
+    if cache is not None:
+        logging.info(f"렌더 캐시: {cache.stats()}")
     logging.info(f"생성 완료: {out_path}")
+    if profile is not None:
+        profile.write_json(args.profile)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Callable, Dict, Iterator, List, Optional
+
+# 현재 컨텍스트에서 기록 중인 프로파일 (스레드 풀 작업은 copy_context로 전달)
+_current: ContextVar[Optional["ConversionProfile"]] = ContextVar(
+    "helper_md_doc_profile", default=None
+)
+
+
+class StageStats:
+    """단계별 누적 통계"""
+
+    __slots__ = ("count", "seconds", "bytes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.bytes = 0
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "seconds": round(self.seconds, 6), "bytes": self.bytes}
+
+
+class ConversionProfile:
+    """변환 단계별 소요 시간/호출 수/바이트와 렌더링 항목별 기록
+
+    md_to_html, html_to_doc, md_to_doc 등에 profile=로 전달하면 해당 변환 동안
+    활성화되어 내부 단계가 기록된다. callback이 주어지면 기록마다
+    {"type": "stage" | "item", ...} 이벤트로 호출된다 (지표 수집용).
+
+    단계의 count는 처리한 항목 수(extract는 수집한 작업 수, cache는 적중 수,
+    render.*는 렌더링한 항목 수)이고, 그 밖의 단계는 실행 횟수이다.
+
+    Args:
+        callback: 기록 이벤트를 받을 함수 (None이면 호출하지 않음)
+    """
+
+    def __init__(self, callback: Optional[Callable[[dict], None]] = None):
+        self.callback = callback
+        self.stages: Dict[str, StageStats] = {}
+        self.items: List[dict] = []
+        self._lock = threading.Lock()
+        self._started = time.time()
+
+    def record(self, stage: str, seconds: float, count: int = 1, nbytes: int = 0) -> None:
+        """단계 실행 한 번(또는 count개 묶음)의 소요 시간과 바이트 누적"""
+        with self._lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = StageStats()
+            stats.count += count
+            stats.seconds += seconds
+            stats.bytes += nbytes
+        if self.callback is not None:
+            self.callback(
+                {
+                    "type": "stage",
+                    "stage": stage,
+                    "seconds": seconds,
+                    "count": count,
+                    "bytes": nbytes,
+                }
+            )
+
+    def record_item(self, kind: str, seconds: float, nbytes: int, **fields) -> None:
+        """렌더링 항목(다이어그램/수식) 하나의 소요 시간과 결과 크기 기록"""
+        item = {"kind": kind, "seconds": round(seconds, 6), "bytes": nbytes, **fields}
+        with self._lock:
+            self.items.append(item)
+        if self.callback is not None:
+            self.callback({"type": "item", **item})
+
+    @contextmanager
+    def activate(self) -> Iterator["ConversionProfile"]:
+        """with 블록 동안 현재 컨텍스트의 프로파일로 설정"""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 사전 (단계는 처음 기록된 순서)"""
+        with self._lock:
+            return {
+                "started": self._started,
+                "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+                "items": list(self.items),
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def write_json(self, path: str) -> None:
+        """JSON 보고서 저장 ("-"이면 표준 출력)"""
+        if path == "-":
+            sys.stdout.write(self.to_json() + "\n")
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json() + "\n")
+
+
+class _Stage:
+    """profile_stage 컨텍스트 관리자 (프로파일이 없으면 기록하지 않음)"""
+
+    __slots__ = ("profile", "name", "count", "bytes", "start")
+
+    def __init__(self, profile: Optional[ConversionProfile], name: str, count: int, nbytes: int):
+        self.profile = profile
+        self.name = name
+        self.count = count
+        self.bytes = nbytes
+
+    def __enter__(self) -> "_Stage":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.profile is not None:
+            self.profile.record(self.name, time.perf_counter() - self.start, self.count, self.bytes)
+
+
+def current_profile() -> Optional[ConversionProfile]:
+    """현재 컨텍스트에서 활성화된 프로파일 (없으면 None)"""
+    return _current.get()
+
+
+def profile_stage(name: str, count: int = 1, nbytes: int = 0) -> _Stage:
+    """with 블록의 소요 시간을 현재 프로파일의 name 단계로 기록
+
+    블록 안에서 반환값의 bytes/count 속성을 바꾸면 기록되는 값이 바뀐다.
+    """
+    return _Stage(_current.get(), name, count, nbytes)
+
+
+@contextmanager
+def profiling(profile: Optional[ConversionProfile]) -> Iterator[Optional[ConversionProfile]]:
+    """profile이 주어지면 활성화, None이면 현재 컨텍스트의 프로파일을 그대로 유지"""
+    if profile is None:
+        yield current_profile()
+        return
+    with profile.activate():
+        yield profile
+
+
+def in_context(func: Callable) -> Callable:
+    """현재 컨텍스트(활성 프로파일)를 복사하여 func을 실행하는 함수 반환 (스레드 풀 제출용)"""
+    context = copy_context()
+
+    def run(*args, **kwargs):
+        # 같은 Context는 여러 스레드에서 동시에 진입할 수 없으므로 호출마다 복사
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """변환 프로파일 CLI 옵션 추가 (md2html, html2doc, md2doc 공용)"""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        default=None,
+        metavar="PATH",
+        help="단계별 소요 시간/횟수/바이트를 JSON으로 기록 (경로 생략 시 표준 출력)",
+    )
+
+
+def profile_from_args(args: argparse.Namespace) -> Optional[ConversionProfile]:
+    """--profile이 지정되면 ConversionProfile 생성 (없으면 None)"""
+    return ConversionProfile() if args.profile is not None else None
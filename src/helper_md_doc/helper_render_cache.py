@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+# 렌더링 결과(PNG/SVG)에 영향을 주는 렌더러 구현이 바뀌면 올려서 기존 캐시를 무효화
+#   2: 수식을 스프라이트 스크린샷 한 장으로 촬영한 뒤 띠 단위로 잘라냄
+#   3: Mermaid 다이어그램을 한 번의 evaluate로 렌더링하고 정수 높이 블록에서 clip 촬영
+#   4: 비동기 Mermaid 렌더링도 3과 같은 스크립트/clip 촬영 사용 (이전 요소 스크린샷 항목 폐기)
+RENDERER_VERSION = "4"
+
+# 캐시 디렉토리 환경 변수 (설정 시 md_to_html 기본 캐시로 사용)
+CACHE_DIR_ENV = "HELPER_MD_DOC_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "HELPER_MD_DOC_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_default_cache: Optional["RenderCache"] = None
+
+
+@lru_cache(maxsize=None)
+def asset_version(*parts: str) -> str:
+    """패키지 내장 자산(KaTeX/Mermaid JS)의 내용 해시 반환
+
+    Args:
+        *parts: 패키지 디렉토리 기준 상대 경로 조각
+
+    Returns:
+        SHA-256 해시 앞 16자리
+    """
+    with open(os.path.join(_ASSET_DIR, *parts), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+class RenderCache:
+    """렌더링 결과를 내용 해시 키로 저장하는 디스크 캐시 (LRU 용량 제한)
+
+    파일 수정 시각(mtime)을 최근 사용 시각으로 사용하며, 총 용량이
+    max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제한다.
+    한 인스턴스를 여러 스레드에서 공유해도 안전하다 (조회/저장/삭제를 잠금으로 직렬화).
+
+    Args:
+        cache_dir: 캐시 디렉토리 경로
+        max_bytes: 캐시 최대 용량 (바이트)
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._total_bytes = sum(_file_size(path) for path in self._entries())
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        code: str,
+        display_mode: bool = False,
+        theme: str = "default",
+        image_format: str = "png",
+        capture: Optional[str] = None,
+    ) -> str:
+        """렌더링 입력으로부터 캐시 키 생성
+
+        Args:
+            kind: "mermaid" 또는 "latex"
+            code: 다이어그램/수식 원본 코드
+            display_mode: 블록 수식 여부 (LaTeX)
+            theme: Mermaid 테마
+            image_format: 렌더링 결과 형식 ("png" 또는 "svg")
+            capture: 수식 PNG 촬영 방식 ("sprite" 또는 "element", 결과 바이트가 달라 키를 분리)
+
+        Returns:
+            SHA-256 16진수 키
+        """
+        if kind == "mermaid":
+            asset = asset_version("mermaid", "mermaid.min.js")
+        else:
+            asset = asset_version("katex", "katex.js")
+        payload = json.dumps(
+            [RENDERER_VERSION, kind, asset, theme, display_mode, image_format, capture, code],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.bin")
+
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if filename.endswith(".bin"):
+                    yield os.path.join(dirpath, filename)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시에서 렌더링 결과 조회 (적중 시 최근 사용 시각 갱신)
+
+        Args:
+            key: make_key로 생성한 캐시 키
+
+        Returns:
+            저장된 바이트, 없으면 None
+        """
+        path = self._path(key)
+        with self._lock:
+            # 다른 프로세스가 동시에 삭제할 수 있으므로 읽기 실패는 미스로 처리
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """렌더링 결과를 캐시에 저장하고 용량 초과 시 LRU 삭제
+
+        Args:
+            key: make_key로 생성한 캐시 키
+            data: 저장할 바이트
+        """
+        path = self._path(key)
+        with self._lock:
+            self._total_bytes -= _file_size(path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # 임시 파일 이름이 프로세스마다 달라야 동시 저장 시 서로 덮어쓰지 않음
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._total_bytes += len(data)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """최근 사용 시각이 오래된 항목부터 삭제하여 max_bytes 이하로 유지 (잠금 안에서 호출)"""
+        entries = []
+        for path in self._entries():
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                continue
+        for _, path in sorted(entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = _file_size(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # 다른 프로세스가 먼저 삭제한 항목
+                pass
+            self._total_bytes -= size
+            logging.debug(f"렌더 캐시 삭제: {os.path.basename(path)}")
+
+    def clear(self) -> None:
+        """캐시 항목 전체 삭제 및 카운터 초기화"""
+        with self._lock:
+            for path in list(self._entries()):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._total_bytes = 0
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스 카운터 및 현재 캐시 용량 반환"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": sum(1 for _ in self._entries()),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def _file_size(path: str) -> int:
+    """파일 크기 (없으면 0, 다른 프로세스가 동시에 삭제한 경우 포함)"""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def set_render_cache(cache: Optional[RenderCache]) -> None:
+    """md_to_html 등에서 기본으로 사용할 렌더 캐시 설정 (None이면 비활성화)"""
+    global _default_cache
+    _default_cache = cache
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """기본 렌더 캐시 반환
+
+    set_render_cache로 설정된 캐시가 없으면 HELPER_MD_DOC_CACHE_DIR 환경 변수로
+    캐시를 생성한다. 둘 다 없으면 None (캐시 미사용).
+    """
+    global _default_cache
+    if _default_cache is None and os.environ.get(CACHE_DIR_ENV):
+        max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+        _default_cache = RenderCache(os.environ[CACHE_DIR_ENV], max_bytes)
+    return _default_cache
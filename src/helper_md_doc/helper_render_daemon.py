@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import logging
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+# 패키지 루트를 sys.path에 추가하여 절대 임포트 통일
+_project_root = Path(__file__).resolve().parents[1]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+if TYPE_CHECKING:
+    from helper_md_doc.helper_md_html import RenderJob
+
+# 렌더링 데몬 사용 환경 변수 ("1"이면 기본 소켓 경로, 그 밖의 값은 소켓 경로로 사용)
+DAEMON_ENV = "HELPER_MD_DOC_DAEMON"
+
+# 마지막 요청 이후 이 시간(초) 동안 요청이 없으면 데몬 종료
+DAEMON_IDLE_TIMEOUT = 300.0
+
+# 데몬 기동(Chromium 실행 + Mermaid/KaTeX 로드) 대기 시간 (초)
+DAEMON_START_TIMEOUT = 30.0
+
+# 데몬 응답 여부 확인 시 연결 대기 시간 (초)
+DAEMON_PING_TIMEOUT = 1.0
+
+# 메시지 형식: 4바이트 길이 + JSON 헤더, 이어서 헤더 "sizes" 순서의 바이너리 페이로드
+_LENGTH = struct.Struct(">I")
+
+_default_daemon: Optional["RenderDaemonClient"] = None
+
+
+def runtime_dir() -> str:
+    """사용자 전용(0700) 데몬 실행 디렉토리 ($XDG_RUNTIME_DIR/helper_md_doc, 없으면 임시 디렉토리)
+
+    다른 사용자가 미리 만든 디렉토리나 심볼릭 링크는 사용하지 않는다.
+
+    Raises:
+        PermissionError: 경로가 현재 사용자 소유의 0700 디렉토리가 아닌 경우
+    """
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    path = (
+        os.path.join(base, "helper_md_doc")
+        if base
+        else os.path.join(tempfile.gettempdir(), f"helper_md_doc-{uid}")
+    )
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != uid or info.st_mode & 0o077:
+        raise PermissionError(f"렌더링 데몬 디렉토리가 사용자 전용(0700)이 아닙니다: {path}")
+    return path
+
+
+def default_socket_path() -> str:
+    """사용자별 기본 데몬 소켓 경로 (runtime_dir() 안)"""
+    return os.path.join(runtime_dir(), "render.sock")
+
+
+def _open_private(path: str, mode: str):
+    """심볼릭 링크를 따라가지 않고 0600 권한으로 잠금/로그 파일 열기 (mode: "w" 또는 "ab")"""
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+    flags |= os.O_APPEND if mode.startswith("a") else 0
+    return os.fdopen(os.open(path, flags, 0o600), mode)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    """연결에서 정확히 size 바이트 수신 (도중에 끊기면 ConnectionError)"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = conn.recv_into(view[received:])
+        if not count:
+            raise ConnectionError("렌더링 데몬 연결이 끊어졌습니다")
+        received += count
+    return bytes(buffer)
+
+
+def _send_message(conn: socket.socket, header: dict, payloads: Sequence[bytes] = ()) -> None:
+    """JSON 헤더와 바이너리 페이로드 전송"""
+    header = dict(header, sizes=[len(payload) for payload in payloads])
+    data = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    conn.sendall(_LENGTH.pack(len(data)) + data)
+    for payload in payloads:
+        conn.sendall(payload)
+
+
+def _recv_message(conn: socket.socket) -> Tuple[dict, List[bytes]]:
+    """_send_message로 보낸 JSON 헤더와 바이너리 페이로드 수신"""
+    (length,) = _LENGTH.unpack(_recv_exact(conn, _LENGTH.size))
+    header = json.loads(_recv_exact(conn, length).decode("utf-8"))
+    return header, [_recv_exact(conn, size) for size in header.get("sizes", [])]
+
+
+class RenderDaemonClient:
+    """렌더링 데몬 클라이언트 (필요 시 데몬을 백그라운드 프로세스로 기동)
+
+    Args:
+        socket_path: 데몬 Unix 소켓 경로 (None이면 default_socket_path())
+        idle_timeout: 자동 기동하는 데몬의 유휴 종료 시간 (초)
+        autostart: True면 응답이 없을 때 데몬을 기동
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        idle_timeout: float = DAEMON_IDLE_TIMEOUT,
+        autostart: bool = True,
+    ):
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.autostart = autostart
+
+    def _connect(self, timeout: Optional[float] = None) -> socket.socket:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.settimeout(timeout)
+        try:
+            conn.connect(self.socket_path)
+        except OSError:
+            conn.close()
+            raise
+        return conn
+
+    def _request(self, header: dict) -> Tuple[dict, List[bytes]]:
+        with self._connect() as conn:
+            _send_message(conn, header)
+            return _recv_message(conn)
+
+    def ping(self) -> bool:
+        """데몬이 요청을 받을 수 있는지 확인"""
+        try:
+            with self._connect(DAEMON_PING_TIMEOUT) as conn:
+                _send_message(conn, {"op": "ping"})
+                return _recv_message(conn)[0].get("ok", False)
+        except OSError:
+            return False
+
+    def start(self) -> None:
+        """데몬 프로세스를 기동하고 응답할 때까지 대기
+
+        Raises:
+            ConnectionError: 데몬 프로세스가 오류로 종료된 경우 (Chromium 미설치 등)
+            TimeoutError: DAEMON_START_TIMEOUT 안에 응답하지 않은 경우
+        """
+        log_path = f"{self.socket_path}.log"
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(_project_root), env.get("PYTHONPATH")])
+        )
+        with _open_private(log_path, "ab") as log_file:
+            process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "helper_md_doc.helper_render_daemon",
+                    "--socket",
+                    self.socket_path,
+                    "--idle-timeout",
+                    str(self.idle_timeout),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=log_file,
+                env=env,
+                start_new_session=True,
+            )
+
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.ping():
+                return
+            # 종료 코드 0은 이미 실행 중인 다른 데몬이 있어 양보한 경우이므로 계속 대기
+            if process.poll():
+                raise ConnectionError(f"렌더링 데몬 기동 실패 (로그: {log_path})")
+            time.sleep(0.05)
+        raise TimeoutError(f"렌더링 데몬이 응답하지 않습니다 (로그: {log_path})")
+
+    def ensure_running(self) -> None:
+        """데몬이 응답하지 않으면 autostart 설정에 따라 기동 (기동 불가 시 OSError)"""
+        if self.ping():
+            return
+        if not self.autostart:
+            raise ConnectionError(f"렌더링 데몬이 실행 중이 아닙니다: {self.socket_path}")
+        logging.info(f"렌더링 데몬 기동: {self.socket_path}")
+        self.start()
+
+    def render(
+        self, jobs: List["RenderJob"], image_format: str = "png", capture: Optional[str] = None
+    ) -> List[bytes]:
+        """데몬의 상주 브라우저로 렌더링 작업 수행
+
+        Args:
+            jobs: 렌더링 작업 목록
+            image_format: "png" 또는 "svg"
+            capture: 수식 PNG 촬영 방식 (None이면 데몬 쪽 latex_capture_mode,
+                호출자의 캐시 키와 맞추려면 호출자가 정한 방식을 전달)
+
+        Returns:
+            jobs 순서와 동일한 렌더링 결과 목록
+
+        Raises:
+            OSError: 데몬에 연결할 수 없는 경우
+            RuntimeError: 데몬에서 렌더링이 실패한 경우 (Mermaid 구문 오류 등)
+        """
+        self.ensure_running()
+        header, payloads = self._request(
+            {
+                "op": "render",
+                "image_format": image_format,
+                "capture": capture,
+                "jobs": [[job.kind, job.code, job.display_mode] for job in jobs],
+            }
+        )
+        if not header.get("ok"):
+            raise RuntimeError(header.get("error") or "렌더링 데몬 오류")
+        return payloads
+
+    def shutdown(self) -> bool:
+        """실행 중인 데몬 종료 요청 (실행 중이 아니면 False)"""
+        try:
+            self._request({"op": "shutdown"})
+        except OSError:
+            return False
+        return True
+
+
+def set_render_daemon(daemon: Optional[RenderDaemonClient]) -> None:
+    """md_to_html 등에서 사용할 렌더링 데몬 설정 (None이면 프로세스 내 브라우저 사용)"""
+    global _default_daemon
+    _default_daemon = daemon
+
+
+def get_render_daemon() -> Optional[RenderDaemonClient]:
+    """기본 렌더링 데몬 클라이언트 반환
+
+    set_render_daemon으로 설정된 클라이언트가 없으면 HELPER_MD_DOC_DAEMON 환경 변수로
+    생성한다 ("1"이면 기본 소켓 경로). 둘 다 없으면 None (데몬 미사용).
+    """
+    global _default_daemon
+    value = os.environ.get(DAEMON_ENV)
+    if _default_daemon is None and value and value != "0":
+        _default_daemon = RenderDaemonClient(None if value == "1" else value)
+    return _default_daemon
+
+
+def _handle(conn: socket.socket) -> bool:
+    """요청 하나를 처리하고 종료 요청이면 True 반환"""
+    from helper_md_doc.helper_md_html import RenderJob, _render_uncached
+
+    header, _ = _recv_message(conn)
+    op = header.get("op")
+    if op == "ping":
+        _send_message(conn, {"ok": True})
+    elif op == "shutdown":
+        _send_message(conn, {"ok": True})
+        return True
+    elif op == "render":
+        jobs = [RenderJob(kind, code, display) for kind, code, display in header["jobs"]]
+        try:
+            rendered = _render_uncached(
+                jobs, header.get("image_format", "png"), header.get("capture")
+            )
+        except Exception as e:
+            logging.warning(f"렌더링 실패: {e}")
+            _send_message(conn, {"ok": False, "error": str(e)})
+        else:
+            _send_message(conn, {"ok": True}, rendered)
+    else:
+        _send_message(conn, {"ok": False, "error": f"알 수 없는 요청: {op}"})
+    return False
+
+
+def serve(socket_path: Optional[str] = None, idle_timeout: float = DAEMON_IDLE_TIMEOUT) -> None:
+    """Chromium과 Mermaid/KaTeX를 미리 로드한 렌더링 데몬 실행 (요청은 순차 처리)
+
+    같은 소켓 경로의 데몬은 하나만 실행되며(잠금 파일), idle_timeout초 동안 요청이
+    없거나 종료 요청을 받으면 브라우저를 정리하고 소켓을 삭제한 뒤 반환한다.
+
+    Args:
+        socket_path: Unix 소켓 경로 (None이면 default_socket_path())
+        idle_timeout: 유휴 종료 시간 (초)
+    """
+    import fcntl
+
+    from helper_md_doc.helper_md_html import _cleanup_browser, _get_browser_page, _get_katex_page
+
+    socket_path = socket_path or default_socket_path()
+    with _open_private(f"{socket_path}.lock", "w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logging.info(f"렌더링 데몬이 이미 실행 중입니다: {socket_path}")
+            return
+
+        start = time.perf_counter()
+        _get_browser_page()
+        _get_katex_page()
+        logging.info(f"브라우저 준비 완료: {time.perf_counter() - start:.2f}s")
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # bind 직후부터 다른 사용자가 연결할 수 없도록 소켓을 0600으로 생성
+            umask = os.umask(0o077)
+            try:
+                server.bind(socket_path)
+            finally:
+                os.umask(umask)
+            os.chmod(socket_path, 0o600)
+            server.listen()
+            server.settimeout(idle_timeout)
+            logging.info(f"렌더링 데몬 대기 중: {socket_path}")
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    logging.info("유휴 시간 초과, 렌더링 데몬 종료")
+                    break
+                with conn:
+                    conn.settimeout(None)
+                    try:
+                        if _handle(conn):
+                            logging.info("종료 요청, 렌더링 데몬 종료")
+                            break
+                    except (OSError, ValueError, KeyError) as e:
+                        logging.warning(f"잘못된 요청: {e!r}")
+        finally:
+            server.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            _cleanup_browser()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    parser = argparse.ArgumentParser(
+        description="Mermaid/KaTeX 렌더링 데몬 (Chromium을 상주시켜 CLI 기동 비용 제거)"
+    )
+    parser.add_argument(
+        "--socket", default=None, help="Unix 소켓 경로 (기본값: 사용자 전용 실행 디렉토리)"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DAEMON_IDLE_TIMEOUT,
+        help=f"유휴 종료 시간 (초, 기본값 {DAEMON_IDLE_TIMEOUT:.0f})",
+    )
+    parser.add_argument("--stop", action="store_true", help="실행 중인 데몬 종료")
+    parser.add_argument("--status", action="store_true", help="데몬 실행 여부 출력")
+    args = parser.parse_args()
+
+    client = RenderDaemonClient(args.socket, autostart=False)
+    if args.stop:
+        stopped = client.shutdown()
+        logging.info("렌더링 데몬 종료" if stopped else "실행 중인 데몬 없음")
+        return
+    if args.status:
+        running = client.ping()
+        logging.info(f"렌더링 데몬: {'실행 중' if running else '중지'} ({client.socket_path})")
+        sys.exit(0 if running else 1)
+
+    serve(args.socket, args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Deque, List, Optional, Sequence, Tuple, Type, cast
+from urllib.parse import parse_qs, urlsplit
+
+# 패키지 루트를 sys.path에 추가하여 절대 임포트 통일
+_project_root = Path(__file__).resolve().parents[1]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from helper_md_doc.helper_docx_backend import (
+    DOCX_BACKENDS,
+    check_docx_backend,
+    close_docx_backends,
+    get_docx_backend,
+)
+from helper_md_doc.helper_html_doc import html_to_doc
+from helper_md_doc.helper_md_doc import DOC_MATH_MODES, md_to_doc
+from helper_md_doc.helper_md_html import RenderSession, md_to_html
+from helper_md_doc.helper_render_cache import RenderCache
+
+# 기본 바인드 주소/포트 (외부 노출 없이 로컬 전용)
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8765
+
+# 변환 작업자 수 (작업자마다 미리 띄운 브라우저 하나)와 대기 큐 크기 (가득 차면 429)
+SERVE_WORKERS = 2
+SERVE_QUEUE_SIZE = 16
+
+# 요청별 응답 대기 시간 (초, 넘으면 504)과 요청 본문 최대 크기 (넘으면 413)
+SERVE_REQUEST_TIMEOUT = 300.0
+SERVE_MAX_BODY_BYTES = 16 * 1024 * 1024
+
+# 지연 시간 통계에 사용하는 최근 요청 수
+LATENCY_WINDOW = 1000
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# (입력 형식, 출력 형식) → 응답 Content-Type
+CONVERSIONS = {
+    ("md", "html"): "text/html; charset=utf-8",
+    ("md", "docx"): DOCX_CONTENT_TYPE,
+    ("html", "docx"): DOCX_CONTENT_TYPE,
+}
+
+
+class ConversionRequest:
+    """큐에서 대기하는 변환 요청 (작업자가 result 또는 error를 채운 뒤 done 설정)"""
+
+    def __init__(
+        self,
+        text: str,
+        source: str = "md",
+        target: str = "docx",
+        title: Optional[str] = None,
+        math: str = "image",
+    ):
+        self.text = text
+        self.source = source
+        self.target = target
+        self.title = title
+        self.math = math
+        self.enqueued = time.perf_counter()
+        self.started: Optional[float] = None
+        self.done = threading.Event()
+        self.result: Optional[bytes] = None
+        self.error: Optional[Exception] = None
+        # 응답 대기 시간이 지나 504로 응답한 요청 (작업자가 꺼내면 변환하지 않고 버림)
+        self.cancelled = False
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """정렬된 값 목록의 nearest-rank 백분위수 (빈 목록이면 0)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(fraction * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def _summary(samples: Deque[float]) -> dict:
+    """지연 시간 표본의 평균/p50/p95/최댓값 (초)"""
+    values = sorted(samples)
+    return {
+        "mean": round(sum(values) / len(values), 6) if values else 0.0,
+        "p50": round(_percentile(values, 0.50), 6),
+        "p95": round(_percentile(values, 0.95), 6),
+        "max": round(values[-1], 6) if values else 0.0,
+    }
+
+
+class ServerStats:
+    """변환 서버의 요청 수, 처리량, 지연 시간 통계 (스레드 안전)
+
+    지연 시간은 큐 투입부터 변환 완료까지, 대기 시간은 큐 투입부터 작업자가
+    꺼낼 때까지이며 최근 LATENCY_WINDOW개 요청 기준이다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.accepted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.in_flight = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._queue_waits: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def accept(self) -> None:
+        with self._lock:
+            self.accepted += 1
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled += 1
+
+    def start(self, request: ConversionRequest) -> None:
+        request.started = time.perf_counter()
+        with self._lock:
+            self.in_flight += 1
+            self._queue_waits.append(request.started - request.enqueued)
+
+    def finish(self, request: ConversionRequest) -> None:
+        latency = time.perf_counter() - request.enqueued
+        with self._lock:
+            self.in_flight -= 1
+            if request.error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self._latencies.append(latency)
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 통계 (throughput은 기동 이후 초당 완료 요청 수)"""
+        with self._lock:
+            uptime = time.monotonic() - self._started
+            return {
+                "uptime": round(uptime, 3),
+                "accepted": self.accepted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "cancelled": self.cancelled,
+                "in_flight": self.in_flight,
+                "throughput": round(self.completed / uptime, 3) if uptime > 0 else 0.0,
+                "latency": _summary(self._latencies),
+                "queue_wait": _summary(self._queue_waits),
+            }
+
+
+class ConversionServer:
+    """Markdown/HTML을 HTML/DOCX로 변환하는 로컬 HTTP 서버
+
+    작업자 스레드마다 RenderSession(미리 띄운 Chromium과 Mermaid/KaTeX 페이지)을 하나씩
+    소유하고, DOCX 변환은 공용 백엔드(기본 문서별 pandoc 프로세스)를 사용한다.
+    요청은 크기가 제한된 큐에 넣고, 큐가 가득 차면 대기하지 않고 429로 거절한다.
+
+    엔드포인트:
+        POST /convert?from=md|html&to=html|docx[&title=..][&math=image|omml|fast]
+            요청 본문은 UTF-8 Markdown/HTML, 응답은 변환 결과 (md→html, md→docx, html→docx)
+        GET /stats: 요청 수, 처리량, 지연 시간 통계 JSON
+        GET /health: {"status": "ok"}
+
+    Args:
+        host: 바인드 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+        workers: 동시 변환 작업자 수
+        queue_size: 대기 큐 크기 (처리 중인 요청 제외)
+        backend: DOCX 변환 백엔드 (DOCX_BACKENDS 참고, pandoc-server는 스레드 런타임으로
+            빌드된 pandoc에서만 동작하므로 명시적으로 선택할 때만 사용)
+        cache: 렌더 캐시 (None이면 get_render_cache() 기본 캐시 사용)
+        warm: True면 시작 시 작업자 브라우저와 DOCX 백엔드를 미리 준비
+        request_timeout: 요청별 응답 대기 시간 (초)
+    """
+
+    def __init__(
+        self,
+        host: str = SERVE_HOST,
+        port: int = SERVE_PORT,
+        workers: int = SERVE_WORKERS,
+        queue_size: int = SERVE_QUEUE_SIZE,
+        backend: str = "pandoc",
+        cache: Optional[RenderCache] = None,
+        warm: bool = True,
+        request_timeout: float = SERVE_REQUEST_TIMEOUT,
+    ):
+        check_docx_backend(backend)
+        if workers < 1 or queue_size < 1:
+            raise ValueError("workers와 queue_size는 1 이상이어야 합니다")
+        self.workers = workers
+        self.backend = backend
+        self.cache = cache
+        self.warm = warm
+        self.request_timeout = request_timeout
+        self.stats = ServerStats()
+        self._queue: "queue.Queue[Optional[ConversionRequest]]" = queue.Queue(queue_size)
+        self._threads: List[threading.Thread] = []
+        self._httpd = _ServeHTTPServer((host, port), _ConversionHandler, self)
+
+    @property
+    def url(self) -> str:
+        host = self._httpd.server_address[0]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{self._httpd.server_port}"
+
+    def start(self) -> "ConversionServer":
+        """작업자와 HTTP 서버 스레드 시작"""
+        if self.warm:
+            try:
+                get_docx_backend(self.backend).warm()
+            except Exception as e:
+                logging.warning(f"DOCX 백엔드 준비 실패 (첫 요청 시 다시 시도): {e}")
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"md2doc-serve-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        thread = threading.Thread(target=self._httpd.serve_forever, name="md2doc-serve-http")
+        thread.daemon = True
+        thread.start()
+        self._threads.append(thread)
+        logging.info(f"변환 서버 시작: {self.url} (작업자 {self.workers}개)")
+        return self
+
+    def stop(self) -> None:
+        """새 요청 수신을 멈추고 대기 중인 요청을 처리한 뒤 작업자 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        for _ in range(self.workers):
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> "ConversionServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def submit(self, request: ConversionRequest) -> bool:
+        """요청을 큐에 넣음 (큐가 가득 차면 False)"""
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            self.stats.reject()
+            return False
+        self.stats.accept()
+        return True
+
+    def stats_dict(self) -> dict:
+        """/stats 응답 (ServerStats에 큐/작업자 현황 추가)"""
+        stats = self.stats.to_dict()
+        stats.update(
+            workers=self.workers, queued=self._queue.qsize(), queue_size=self._queue.maxsize
+        )
+        return stats
+
+    def _work(self) -> None:
+        """작업자 스레드: 자신의 RenderSession으로 큐의 요청을 순서대로 변환"""
+        with RenderSession() as session:
+            if self.warm:
+                try:
+                    session.warm()
+                except Exception as e:
+                    logging.warning(f"브라우저 준비 실패 (첫 요청 시 다시 시도): {e}")
+            while True:
+                request = self._queue.get()
+                if request is None:
+                    break
+                if request.cancelled:
+                    self.stats.cancel()
+                    continue
+                self.stats.start(request)
+                try:
+                    request.result = self._convert(request, session)
+                except Exception as e:
+                    logging.warning(f"변환 실패 ({request.source} -> {request.target}): {e}")
+                    request.error = e
+                finally:
+                    self.stats.finish(request)
+                    request.done.set()
+
+    def _convert(self, request: ConversionRequest, session: RenderSession) -> bytes:
+        """요청 하나를 변환하여 응답 본문 반환"""
+        if request.target == "html":
+            html_text = md_to_html(
+                request.text,
+                request.title,
+                use_base64=True,
+                cache=self.cache,
+                math="fast" if request.math == "fast" else "image",
+                session=session,
+            )
+            return html_text.encode("utf-8")
+
+        with tempfile.TemporaryDirectory(prefix="helper_md_doc_serve_") as tmp_dir:
+            input_path = os.path.join(tmp_dir, f"input.{request.source}")
+            output_path = os.path.join(tmp_dir, "output.docx")
+            with open(input_path, "w", encoding="utf-8") as f:
+                f.write(request.text)
+            if request.source == "md":
+                md_to_doc(
+                    input_path,
+                    output_path,
+                    request.title,
+                    cache=self.cache,
+                    math=request.math,
+                    backend=self.backend,
+                    session=session,
+                )
+            else:
+                html_to_doc(input_path, output_path, backend=self.backend)
+            with open(output_path, "rb") as f:
+                return f.read()
+
+
+class _ServeHTTPServer(ThreadingHTTPServer):
+    """요청 처리기가 ConversionServer에 접근할 수 있도록 app을 보관하는 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        handler_class: Type[BaseHTTPRequestHandler],
+        app: ConversionServer,
+    ) -> None:
+        super().__init__(address, handler_class)
+        self.app = app
+
+
+class _ConversionHandler(BaseHTTPRequestHandler):
+    """ConversionServer HTTP 요청 처리 (self.server.app이 ConversionServer)"""
+
+    server_version = "md2doc-serve"
+
+    @property
+    def app(self) -> ConversionServer:
+        return cast(_ServeHTTPServer, self.server).app
+
+    def log_message(self, format: str, *args) -> None:
+        logging.debug(f"{self.address_string()} {format % args}")
+
+    def _send(
+        self, status: HTTPStatus, body: bytes, content_type: str, headers: Optional[dict] = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: HTTPStatus, data: dict, headers: Optional[dict] = None) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self._send(status, body, "application/json; charset=utf-8", headers)
+
+    def _send_error(self, status: HTTPStatus, message: str, headers: Optional[dict] = None) -> None:
+        self._send_json(status, {"error": message}, headers)
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/stats":
+            self._send_json(HTTPStatus.OK, self.app.stats_dict())
+        elif path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {path}")
+
+    def do_POST(self) -> None:
+        app = self.app
+        url = urlsplit(self.path)
+        if url.path != "/convert":
+            self._send_error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {url.path}")
+            return
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        source, target = params.get("from", "md"), params.get("to", "docx")
+        content_type = CONVERSIONS.get((source, target))
+        math = params.get("math", "image")
+        if content_type is None:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"지원하지 않는 변환: {source} -> {target}")
+            return
+        if math not in DOC_MATH_MODES:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"지원하지 않는 수식 출력 방식: {math}")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "잘못된 Content-Length")
+            return
+        if length > SERVE_MAX_BODY_BYTES:
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "요청 본문이 너무 큽니다")
+            return
+        try:
+            text = self.rfile.read(length).decode("utf-8")
+        except UnicodeDecodeError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "요청 본문은 UTF-8이어야 합니다")
+            return
+
+        request = ConversionRequest(text, source, target, params.get("title"), math)
+        if not app.submit(request):
+            self._send_error(
+                HTTPStatus.TOO_MANY_REQUESTS, "변환 대기열이 가득 찼습니다", {"Retry-After": "1"}
+            )
+            return
+        if not request.done.wait(app.request_timeout):
+            # 아직 큐에서 대기 중이면 작업자가 변환하지 않도록 취소
+            request.cancelled = True
+            self._send_error(HTTPStatus.GATEWAY_TIMEOUT, "변환 시간 초과")
+            return
+        if request.error is not None:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(request.error))
+            return
+        result = request.result
+        assert result is not None
+        self._send(HTTPStatus.OK, result, content_type)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    parser = argparse.ArgumentParser(
+        prog="md2doc serve",
+        description="Markdown/HTML을 HTML/DOCX로 변환하는 로컬 HTTP 서버 (POST /convert, GET /stats)",
+    )
+    parser.add_argument("--host", default=SERVE_HOST, help=f"바인드 주소 (기본값 {SERVE_HOST})")
+    parser.add_argument("--port", type=int, default=SERVE_PORT, help=f"포트 (기본값 {SERVE_PORT})")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=SERVE_WORKERS,
+        help=f"동시 변환 작업자(브라우저) 수 (기본값 {SERVE_WORKERS})",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=SERVE_QUEUE_SIZE,
+        help=f"대기 큐 크기, 가득 차면 429 응답 (기본값 {SERVE_QUEUE_SIZE})",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=DOCX_BACKENDS,
+        default="pandoc",
+        help="DOCX 변환 백엔드 (기본값 pandoc, pandoc-server는 스레드 런타임 pandoc 필요)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=SERVE_REQUEST_TIMEOUT,
+        help=f"요청별 응답 대기 시간 (초, 기본값 {SERVE_REQUEST_TIMEOUT:.0f})",
+    )
+    parser.add_argument("--cache-dir", default=None, help="렌더링 결과 디스크 캐시 디렉토리")
+    parser.add_argument(
+        "--cache-max-mb", type=int, default=256, help="렌더 캐시 최대 용량 (MB, 기본값 256)"
+    )
+    args = parser.parse_args(argv)
+
+    cache = None
+    if args.cache_dir:
+        cache = RenderCache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+
+    server = ConversionServer(
+        args.host,
+        args.port,
+        args.workers,
+        args.queue_size,
+        args.backend,
+        cache,
+        request_timeout=args.timeout,
+    )
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        logging.info("변환 서버 종료 중...")
+    finally:
+        server.stop()
+        close_docx_backends()
+        logging.info(f"변환 서버 통계: {server.stats_dict()}")
+
+
+if __name__ == "__main__":
+    main()
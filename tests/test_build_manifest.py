@@ -0,0 +1,100 @@
+"""Tests for the incremental build manifest"""
+
+from helper_md_doc.helper_build_manifest import BuildManifest, MANIFEST_NAME
+from helper_md_doc.helper_md_html import md_file_to_html
+
+
+def test_manifest_up_to_date(tmp_path):
+    """입력/옵션이 같으면 최신, 하나라도 바뀌면 재변환 필요"""
+    md_path = tmp_path / "a.md"
+    out_path = tmp_path / "a.html"
+    md_path.write_text("# A", encoding="utf-8")
+    out_path.write_text("<html></html>", encoding="utf-8")
+
+    manifest = BuildManifest(str(tmp_path / MANIFEST_NAME))
+    options = {"target": "html", "title": "A"}
+    assert not manifest.is_up_to_date(str(md_path), str(out_path), options)
+
+    manifest.record(str(md_path), str(out_path), options)
+    manifest.save()
+
+    reloaded = BuildManifest.for_output(str(out_path))
+    assert reloaded.is_up_to_date(str(md_path), str(out_path), options)
+    assert not reloaded.is_up_to_date(str(md_path), str(out_path), {"target": "html"})
+
+    md_path.write_text("# B", encoding="utf-8")
+    assert not reloaded.is_up_to_date(str(md_path), str(out_path), options)
+
+
+def test_md_file_to_html_incremental(tmp_path):
+    """변경되지 않은 입력은 두 번째 변환에서 생략"""
+    md_path = tmp_path / "doc.md"
+    out_path = tmp_path / "doc.html"
+    md_path.write_text("# 문서\n\n본문", encoding="utf-8")
+
+    assert md_file_to_html(str(md_path), str(out_path), title="문서", incremental=True)
+    assert not md_file_to_html(str(md_path), str(out_path), title="문서", incremental=True)
+
+    out_path.unlink()
+    assert md_file_to_html(str(md_path), str(out_path), title="문서", incremental=True)
+    assert out_path.is_file()
+
+
+def test_md_file_to_html_math_option(tmp_path, monkeypatch):
+    """math 옵션은 변환에 전달되고, 바뀌면 증분 빌드에서 재변환"""
+    import sys
+
+    from helper_md_doc import helper_md_html
+
+    md_path = tmp_path / "doc.md"
+    out_path = tmp_path / "doc.html"
+    md_path.write_text("# 문서\n\n식 $x^2$", encoding="utf-8")
+
+    assert md_file_to_html(str(md_path), str(out_path), math="tex", incremental=True)
+    assert "\\(x^2\\)" in out_path.read_text(encoding="utf-8")
+    assert not md_file_to_html(str(md_path), str(out_path), math="tex", incremental=True)
+    assert md_file_to_html(str(md_path), str(out_path), math="fast", incremental=True)
+    assert "<sup>2</sup>" in out_path.read_text(encoding="utf-8")
+
+    monkeypatch.setattr(
+        sys, "argv", ["md2html", str(md_path), "-o", str(out_path), "--math", "tex"]
+    )
+    helper_md_html.main()
+    assert "\\(x^2\\)" in out_path.read_text(encoding="utf-8")
+
+
+def test_corrupt_manifest_starts_empty(tmp_path):
+    """손상된 매니페스트는 무시하고 빈 매니페스트로 시작하며, 다음 저장 시 복구"""
+    md_path = tmp_path / "doc.md"
+    out_path = tmp_path / "doc.html"
+    md_path.write_text("# 문서", encoding="utf-8")
+    (tmp_path / MANIFEST_NAME).write_text("{bad", encoding="utf-8")
+
+    assert BuildManifest.for_output(str(out_path)).entries == {}
+    assert md_file_to_html(str(md_path), str(out_path), incremental=True)
+    assert not md_file_to_html(str(md_path), str(out_path), incremental=True)
+
+
+def test_manifest_tracks_referenced_images(tmp_path):
+    """Markdown이 참조하는 로컬 이미지가 바뀌면 재변환 필요 (URL 이미지는 무시)"""
+    (tmp_path / "img").mkdir()
+    image_path = tmp_path / "img" / "fig.png"
+    image_path.write_bytes(b"v1")
+    md_path = tmp_path / "doc.md"
+    md_path.write_text(
+        '# 문서\n\n![그림](img/fig.png "제목")\n\n<img src="img/fig.png">\n\n'
+        "![원격](https://example.com/a.png)\n",
+        encoding="utf-8",
+    )
+    out_path = tmp_path / "doc.html"
+    out_path.write_text("<html></html>", encoding="utf-8")
+
+    manifest = BuildManifest.for_output(str(out_path))
+    manifest.record(str(md_path), str(out_path), {})
+    assert list(manifest.entries[str(out_path)]["images"]) == [str(image_path)]
+    assert manifest.is_up_to_date(str(md_path), str(out_path), {})
+
+    image_path.write_bytes(b"v2")
+    assert not manifest.is_up_to_date(str(md_path), str(out_path), {})
+    image_path.unlink()
+    assert not manifest.is_up_to_date(str(md_path), str(out_path), {})
@@ -0,0 +1,158 @@
+"""Tests for DOCX backends"""
+
+import base64
+import zipfile
+
+import pytest
+
+from helper_md_doc import helper_docx_backend
+from helper_md_doc.helper_docx_backend import (
+    DOCX_BACKENDS,
+    DocxBackend,
+    PandocServerBackend,
+    _collect_media,
+    get_docx_backend,
+)
+
+SAMPLE_HTML = """<html><head><title>백엔드</title></head><body>
+<h1>제목</h1>
+<p>본문 <strong>굵게</strong> 그리고 <code>code</code></p>
+<ul><li>하나<ul><li>둘</li></ul></li></ul>
+<pre><code>line1
+line2
+</code></pre>
+<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>
+</body></html>"""
+
+
+def test_get_docx_backend_reuses_instance():
+    """백엔드 이름별로 같은 인스턴스를 재사용하고, 알 수 없는 이름은 ValueError"""
+    for name in DOCX_BACKENDS:
+        assert get_docx_backend(name) is get_docx_backend(name)
+        assert get_docx_backend(name).name == name
+
+    with pytest.raises(ValueError):
+        get_docx_backend("unknown")
+
+
+def test_collect_media_deduplicates_images(tmp_path):
+    """pandoc server 요청용 미디어백: data URI와 로컬 파일을 한 번씩만 전달"""
+    data = base64.b64encode(b"png-bytes").decode("ascii")
+    (tmp_path / "eq 1.png").write_bytes(b"file-bytes")
+    html_text = (
+        f'<img src="data:image/png;base64,{data}" alt="a" />'
+        f'<img src="data:image/png;base64,{data}" alt="b" />'
+        '<img src="eq%201.png" /><img src="eq%201.png" />'
+        '<img src="missing.png" /><img src="https://example.com/a.png" />'
+    )
+
+    html_text, files = _collect_media(html_text, str(tmp_path))
+
+    assert files == {
+        "media/image1.png": data,
+        "media/image2.png": base64.b64encode(b"file-bytes").decode("ascii"),
+    }
+    assert html_text.count('src="media/image1.png"') == 2
+    assert html_text.count('src="media/image2.png"') == 2
+    assert 'src="missing.png"' in html_text
+    assert 'src="https://example.com/a.png"' in html_text
+
+
+def test_native_backend_structure(tmp_path):
+    """native 백엔드: 제목/서식/목록/코드 블록/표를 python-docx 문서로 변환"""
+    docx = pytest.importorskip("docx")
+
+    output_path = tmp_path / "native.docx"
+    get_docx_backend("native").convert(SAMPLE_HTML, str(output_path))
+
+    document = docx.Document(str(output_path))
+    paragraphs = [(p.style.name, p.text) for p in document.paragraphs]
+    assert ("Heading 1", "제목") in paragraphs
+    assert ("Normal", "본문 굵게 그리고 code") in paragraphs
+    assert ("List Bullet", "하나") in paragraphs
+    assert ("List Bullet 2", "둘") in paragraphs
+    assert ("Normal", "line1\nline2") in paragraphs
+    assert [[cell.text for cell in row.cells] for row in document.tables[0].rows] == [
+        ["A", "B"],
+        ["1", "2"],
+    ]
+    assert document.core_properties.title == "백엔드"
+
+
+def test_native_backend_loose_list_and_table_images(tmp_path):
+    """native 백엔드: <li><p>는 목록 문단 하나로, 표 셀의 이미지(수식)는 그림으로 변환"""
+    docx = pytest.importorskip("docx")
+
+    png = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+    html_text = (
+        "<ul>\n<li>\n<p>첫째</p>\n</li>\n<li>\n<p>둘째</p>\n<p>이어짐</p>\n</li>\n</ul>"
+        "<table><tr><th>수식</th></tr><tr><td>값 "
+        f'<img src="data:image/png;base64,{png}" alt="Equation 1" /> 끝</td></tr></table>'
+    )
+    output_path = tmp_path / "loose.docx"
+    get_docx_backend("native").convert(html_text, str(output_path))
+
+    document = docx.Document(str(output_path))
+    paragraphs = [(p.style.name, p.text) for p in document.paragraphs]
+    assert paragraphs == [
+        ("List Bullet", "첫째"),
+        ("List Bullet", "둘째"),
+        ("Normal", "이어짐"),
+    ]
+    cell = document.tables[0].rows[1].cells[0]
+    assert cell.text == "값  끝"
+    assert len(cell._tc.xpath(".//pic:pic")) == 1
+
+
+def test_native_backend_rejects_omml(tmp_path):
+    """native 백엔드는 TeX 수식(omml) 입력을 지원하지 않음"""
+    from helper_md_doc.helper_md_doc import md_to_doc
+
+    md_path = tmp_path / "math.md"
+    md_path.write_text("$x$", encoding="utf-8")
+    with pytest.raises(ValueError):
+        md_to_doc(str(md_path), str(tmp_path / "math.docx"), math="omml", backend="native")
+
+
+@pytest.mark.parametrize("backend", ["pandoc", "native"])
+def test_html_to_doc_image_files(tmp_path, backend):
+    """images="files": HTML 기준 상대 경로 이미지를 Base64 임베딩 없이 DOCX에 포함"""
+    if backend == "native":
+        pytest.importorskip("docx")
+    else:
+        pypandoc = pytest.importorskip("pypandoc")
+        try:
+            pypandoc.get_pandoc_version()
+        except OSError:
+            pytest.skip("pandoc이 설치되지 않아 테스트를 건너뜁니다.")
+    from helper_md_doc import html_to_doc
+
+    png = base64.b64decode(
+        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+    )
+    (tmp_path / "media").mkdir()
+    (tmp_path / "media" / "dot.png").write_bytes(png)
+    html_path = tmp_path / "page.html"
+    html_path.write_text('<p>그림 <img src="media/dot.png" alt="dot" /></p>', encoding="utf-8")
+    output_path = tmp_path / "page.docx"
+
+    html_to_doc(str(html_path), str(output_path), backend=backend, images="files")
+
+    with zipfile.ZipFile(output_path) as docx_zip:
+        media = [name for name in docx_zip.namelist() if name.startswith("word/media/")]
+        assert len(media) == 1
+        assert docx_zip.read(media[0]) == png
+
+
+def test_backend_interface_and_single_atexit(monkeypatch):
+    """convert가 없는 백엔드는 생성 불가, pandoc server 정리 함수는 인스턴스당 한 번 등록"""
+    with pytest.raises(TypeError):
+        DocxBackend()
+
+    registered = []
+    monkeypatch.setattr(helper_docx_backend.atexit, "register", registered.append)
+    monkeypatch.setattr(PandocServerBackend, "_start", lambda self: None)
+    backend = PandocServerBackend()
+    backend.warm()
+    backend.warm()
+    assert registered == [backend.close]
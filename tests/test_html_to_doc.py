@@ -56,3 +56,65 @@ def test_embed_images_with_file_path():
 
     # 원본 HTML이 반환되는지 확인 (파일이 없으므로)
     assert "nonexistent.png" in result
+
+
+def test_embed_images_encodes_each_file_once(tmp_path, monkeypatch):
+    """같은 이미지 반복 참조는 한 번만 인코딩, 호출 간 캐시는 파일 변경 시 무효화"""
+    from helper_md_doc import helper_html_doc
+
+    helper_html_doc.clear_embed_cache()
+    encoded = []
+    original = helper_html_doc._encode_image
+
+    def counting_encode(full_path, img_bytes):
+        encoded.append(os.path.basename(full_path))
+        return original(full_path, img_bytes)
+
+    monkeypatch.setattr(helper_html_doc, "_encode_image", counting_encode)
+    (tmp_path / "logo.png").write_bytes(b"logo")
+    (tmp_path / "icon.gif").write_bytes(b"icon")
+    html = '<img src="logo.png" /><img src="icon.gif" />' * 3 + '<img src="./logo.png" />'
+
+    result = embed_images_as_base64(html, str(tmp_path))
+    assert sorted(encoded) == ["icon.gif", "logo.png"]
+    assert result.count("data:image/png;base64,bG9nbw==") == 4
+    assert result.count("data:image/gif;base64,aWNvbg==") == 3
+
+    # 호출 간 캐시: 변경 없는 파일은 다시 읽지 않음
+    encoded.clear()
+    assert embed_images_as_base64(html, str(tmp_path)) == result
+    assert encoded == []
+
+    # 파일이 바뀌면 (크기/수정 시각) 다시 인코딩
+    (tmp_path / "logo.png").write_bytes(b"new logo")
+    result = embed_images_as_base64(html, str(tmp_path))
+    assert encoded == ["logo.png"]
+    assert "data:image/png;base64,bmV3IGxvZ28=" in result
+    helper_html_doc.clear_embed_cache()
+
+
+def test_html_to_doc_defaults_to_base64(tmp_path, monkeypatch):
+    """html_to_doc은 기본으로 이미지를 Base64로 임베딩 (files는 명시적으로 선택)"""
+    from helper_md_doc import helper_html_doc
+
+    embedded = []
+    converted = []
+
+    class FakeBackend:
+        def convert(self, html_text, output_path, resource_dir=None):
+            converted.append(html_text)
+
+    monkeypatch.setattr(helper_html_doc, "get_docx_backend", lambda backend: FakeBackend())
+    monkeypatch.setattr(
+        helper_html_doc,
+        "embed_images_as_base64",
+        lambda html_text, base_dir: embedded.append(base_dir) or html_text,
+    )
+    html_path = tmp_path / "page.html"
+    html_path.write_text('<p><img src="a.png" /></p>', encoding="utf-8")
+
+    helper_html_doc.html_to_doc(str(html_path), str(tmp_path / "a.docx"))
+    helper_html_doc.html_to_doc(str(html_path), str(tmp_path / "b.docx"), images="files")
+
+    assert embedded == [str(tmp_path)]
+    assert len(converted) == 2
@@ -0,0 +1,86 @@
+"""Tests for rendered PNG optimization"""
+
+import io
+
+import pytest
+
+from helper_md_doc.helper_image_optimize import (
+    ImageOptimizeOptions,
+    optimize_png,
+    optimize_png_list,
+)
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+
+def make_screenshot(color=(0, 0, 0, 255)) -> bytes:
+    """흰 여백이 큰 RGBA 스크린샷 PNG (렌더링된 수식/다이어그램 대용)"""
+    image = Image.new("RGBA", (400, 160), (255, 255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((100, 50, 219, 89), outline=color, width=3)
+    draw.text((110, 60), "x_1 + y^2", fill=color)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_optimize_png_crops_and_reduces_colors():
+    """여백 제거 후 무채색은 grayscale, 유채색은 palette로 축소"""
+    source = make_screenshot()
+    optimized = optimize_png(source)
+
+    image = Image.open(io.BytesIO(optimized))
+    assert len(optimized) < len(source)
+    assert image.size == (124, 44)
+    assert image.mode == "L"
+
+    colored = Image.open(io.BytesIO(optimize_png(make_screenshot((30, 120, 200, 255)))))
+    assert colored.mode == "P"
+
+
+def test_optimize_png_caps_dpi():
+    """max_dpi: 96 DPI 스크린샷을 축소하고 DPI 정보로 표시 크기 유지"""
+    optimized = optimize_png(make_screenshot(), ImageOptimizeOptions(crop=False, max_dpi=48))
+
+    image = Image.open(io.BytesIO(optimized))
+    assert image.size == (200, 80)
+    assert round(image.info["dpi"][0]) == 48
+
+
+def test_optimize_png_list_keeps_order_and_skips_markup():
+    """PNG가 아닌 결과(SVG, 빈 바이트)는 그대로 두고 절감량 보고"""
+    source = make_screenshot()
+    results, stats = optimize_png_list([b"<svg/>", source, b""], workers=2)
+
+    assert results[0] == b"<svg/>" and results[2] == b""
+    assert results[1] == optimize_png(source)
+    assert stats.images == 1
+    assert stats.saved_bytes == len(source) - len(results[1]) > 0
+
+    with pytest.raises(ValueError):
+        optimize_png_list([source], ImageOptimizeOptions(quantize="jpeg"))
+
+
+def test_render_jobs_caches_optimized_png(tmp_path, monkeypatch):
+    """최적화 결과는 별도 캐시 키로 저장되어 재사용 시 렌더링/최적화를 생략"""
+    from helper_md_doc import helper_md_html
+    from helper_md_doc.helper_render_cache import RenderCache
+
+    calls = []
+    source = make_screenshot()
+
+    def fake_render(codes):
+        calls.extend(codes)
+        return [source for _ in codes]
+
+    monkeypatch.setattr(helper_md_html, "render_mermaid_batch", fake_render)
+    cache = RenderCache(str(tmp_path / "cache"))
+    jobs = [helper_md_html.RenderJob("mermaid", "graph TD; A-->B")]
+    options = ImageOptimizeOptions()
+
+    assert helper_md_html.render_jobs(jobs, cache) == [source]
+    optimized = helper_md_html.render_jobs(jobs, cache, optimize_images=options)
+    assert optimized == [optimize_png(source)]
+    assert helper_md_html.render_jobs(jobs, cache, optimize_images=options) == optimized
+    assert len(calls) == 2
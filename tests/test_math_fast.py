@@ -0,0 +1,73 @@
+"""Tests for the browser-free LaTeX fast path (math="fast")"""
+
+import pytest
+
+from helper_md_doc import helper_md_html
+from helper_md_doc.helper_math_fast import latex_to_html
+from helper_md_doc.helper_md_html import md_to_html
+from helper_md_doc.helper_profile import ConversionProfile
+from helper_md_doc.helper_render_cache import RenderCache
+
+
+def body(html):
+    """<span class="math"> 안쪽 HTML"""
+    return html.split(">", 1)[1].rsplit("</span>", 1)[0]
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("x^2", "<i>x</i><sup>2</sup>"),
+        ("a_{i+1}^{n}", "<i>a</i><sub><i>i</i>+1</sub><sup><i>n</i></sup>"),
+        ("E = mc^2", "<i>E</i> = <i>mc</i><sup>2</sup>"),
+        (r"\alpha \leq \beta", "α ≤ β"),
+        ("-x + y", "−<i>x</i> + <i>y</i>"),
+        (r"\sin x", "sin <i>x</i>"),
+        (r"\text{if } x > 0", "if <i>x</i> &gt; 0"),
+        (r"\mathbf{v}_1", "<b>v</b><sub>1</sub>"),
+        (
+            r"\sum_{i=1}^{n} x_i",
+            "∑<sub><i>i</i>=1</sub><sup><i>n</i></sup><i>x</i><sub><i>i</i></sub>",
+        ),
+    ],
+)
+def test_supported_subset(code, expected):
+    assert body(latex_to_html(code)) == expected
+
+
+@pytest.mark.parametrize(
+    "code", [r"\frac{a}{b}", r"\sqrt{2}", r"\begin{matrix}1\end{matrix}", "x^", "{a", "a}", "x_1_2"]
+)
+def test_unsupported_returns_none(code):
+    assert latex_to_html(code) is None
+
+
+def test_display_mode():
+    """블록 수식은 가운데 정렬, 큰 연산자는 브라우저로 넘김"""
+    assert latex_to_html("x^2", True).startswith('<div style="text-align: center;')
+    assert latex_to_html(r"\sum_{i=1}^n x_i", True) is None
+
+
+def test_md_to_html_fast_tier(monkeypatch, tmp_path):
+    """단순한 수식은 브라우저 없이 출력하고 나머지만 렌더링하며 계층별 수를 기록"""
+    rendered = []
+
+    def fake_latex_batch(items, sprite=None):
+        rendered.extend(code for code, _ in items)
+        return [b"\x89PNG" for _ in items]
+
+    monkeypatch.setattr(helper_md_html, "render_latex_batch", fake_latex_batch)
+    md_text = "# 수식\n\n$x^2$ 와 $\\alpha_i$ 와 $\\frac{1}{2}$ 와 $n$\n"
+    profile = ConversionProfile()
+
+    html = md_to_html(
+        md_text, use_base64=True, cache=RenderCache(str(tmp_path)), math="fast", profile=profile
+    )
+
+    assert rendered == [r"\frac{1}{2}"]
+    assert "<i>x</i><sup>2</sup>" in html and "α<sub><i>i</i></sub>" in html
+    assert html.count("data:image/png;base64,") == 1
+    stages = profile.to_dict()["stages"]
+    assert stages["math.text"]["count"] == 1
+    assert stages["math.fast"]["count"] == 2
+    assert stages["math.browser"]["count"] == 1
@@ -0,0 +1,149 @@
+"""Tests for the asyncio API"""
+
+import asyncio
+
+from helper_md_doc import amd_to_html
+from helper_md_doc import helper_md_async
+from helper_md_doc.helper_md_html import RenderJob
+
+
+def test_amd_to_html_basic():
+    """렌더링 대상이 없는 문서는 브라우저 없이 변환되는지 확인"""
+    html = asyncio.run(amd_to_html("# 비동기\n\n**본문**", title="비동기"))
+
+    assert "<title>비동기</title>" in html
+    assert "<strong>본문</strong>" in html
+
+
+def test_arender_jobs_order(monkeypatch):
+    """동시 렌더링 결과가 작업 순서대로 반환되는지 확인"""
+
+    async def fake_render_mermaid(state, code, image_format="png"):
+        await asyncio.sleep(0.01)
+        return f"mermaid:{code}".encode()
+
+    async def fake_render_latex(state, items, image_format="png"):
+        await asyncio.sleep(0)
+        return [f"latex:{code}".encode() for code, _ in items]
+
+    monkeypatch.setattr(helper_md_async, "_render_mermaid", fake_render_mermaid)
+    monkeypatch.setattr(helper_md_async, "_render_latex", fake_render_latex)
+
+    jobs = [RenderJob("latex", "a^2"), RenderJob("mermaid", "graph TD"), RenderJob("latex", "b_1")]
+    result = asyncio.run(helper_md_async.arender_jobs(jobs, workers=2))
+
+    assert result == [b"latex:a^2", b"mermaid:graph TD", b"latex:b_1"]
+
+
+def test_acquire_page_failure_keeps_pool_slot(monkeypatch):
+    """페이지 생성이 실패해도 풀 크기가 줄지 않고 대기 중인 작업이 다시 생성"""
+    attempts = []
+
+    async def flaky_new_page(state, kind):
+        attempts.append(kind)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("브라우저 기동 실패")
+        return f"page-{len(attempts)}"
+
+    monkeypatch.setattr(helper_md_async, "_new_page", flaky_new_page)
+
+    async def use(state):
+        async with helper_md_async._acquire_page(state, "latex") as page:
+            return page
+
+    async def main():
+        state = helper_md_async._AsyncBrowserState(asyncio.get_running_loop(), 1)
+        first, second = await asyncio.wait_for(
+            asyncio.gather(use(state), use(state), return_exceptions=True), 5
+        )
+        return state, first, second
+
+    state, first, second = asyncio.run(main())
+
+    assert isinstance(first, RuntimeError)
+    assert second == "page-2"
+    assert state.created["latex"] == 1
+
+
+def test_browser_state_per_loop_grows_and_closes_on_shutdown():
+    """루프별 상태: 더 큰 workers로 풀 확장, asyncio.run 종료 시 해당 루프의 브라우저 정리"""
+    closed = []
+
+    class FakeBrowser:
+        async def close(self):
+            closed.append(self)
+
+    async def main():
+        state = await helper_md_async._get_state(2)
+        assert await helper_md_async._get_state(6) is state
+        assert state.pool_size == 6
+        browser = state.browser = FakeBrowser()
+        return state, browser
+
+    first, first_browser = asyncio.run(main())
+    assert closed == [first_browser] and first.browser is None
+
+    second, second_browser = asyncio.run(main())
+    assert second is not first and closed == [first_browser, second_browser]
+
+
+def test_acleanup_browser_closes_current_loop_state():
+    """acleanup_browser는 현재 루프의 상태를 닫고 제거 (루프 종료 시 중복 정리 없음)"""
+    closed = []
+
+    class FakeBrowser:
+        async def close(self):
+            closed.append(self)
+
+    async def main():
+        state = await helper_md_async._get_state()
+        state.browser = FakeBrowser()
+        await helper_md_async.acleanup_browser()
+        assert asyncio.get_running_loop() not in helper_md_async._states
+
+    asyncio.run(main())
+    assert len(closed) == 1
+
+
+def test_async_mermaid_matches_sync_capture(monkeypatch):
+    """비동기 Mermaid 렌더링은 동기 일괄 렌더링과 같은 스크립트와 clip 영역으로 촬영"""
+    from contextlib import asynccontextmanager
+
+    from helper_md_doc import helper_md_html
+
+    result = {"svg": "<svg></svg>", "box": [28.0, 28.5, 39.5, 20.0], "error": None}
+    calls = []
+
+    class SyncPage:
+        def evaluate(self, script, codes):
+            calls.append(("sync", script, codes))
+            return [dict(result) for _ in codes]
+
+        def screenshot(self, clip, full_page):
+            calls.append(("sync", clip))
+            return b"png"
+
+    class AsyncPage:
+        async def evaluate(self, script, codes):
+            calls.append(("async", script, codes))
+            return [dict(result) for _ in codes]
+
+        async def screenshot(self, clip, full_page):
+            calls.append(("async", clip))
+            return b"png"
+
+    @asynccontextmanager
+    async def fake_acquire(state, kind):
+        yield AsyncPage()
+
+    monkeypatch.setattr(helper_md_html, "_get_browser_page", SyncPage)
+    monkeypatch.setattr(helper_md_async, "_acquire_page", fake_acquire)
+
+    assert helper_md_html.render_mermaid_batch(["graph TD"]) == [b"png"]
+    assert asyncio.run(helper_md_async._render_mermaid(None, "graph TD")) == b"png"
+
+    sync_calls = [call[1:] for call in calls if call[0] == "sync"]
+    async_calls = [call[1:] for call in calls if call[0] == "async"]
+    assert async_calls == sync_calls
+    assert sync_calls[0][0] == helper_md_html._MERMAID_BATCH_JS
@@ -52,3 +52,172 @@ def test_md_to_doc_file_not_found():
 
     except ImportError:
         pytest.skip("pypandoc이 설치되지 않아 테스트를 건너뜁니다.")
+
+
+def test_md_dir_to_doc_batch(tmp_path):
+    """디렉토리 일괄 변환: 하위 경로 유지 및 실패 파일 기록 확인"""
+    try:
+        import pypandoc
+
+        pypandoc.get_pandoc_version()
+    except (ImportError, OSError):
+        pytest.skip("Pandoc이 설치되지 않아 테스트를 건너뜁니다.")
+
+    from helper_md_doc.helper_md_doc import md_dir_to_doc
+
+    src = tmp_path / "docs"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.md").write_text("# A\n\n본문", encoding="utf-8")
+    (src / "sub" / "b.md").write_text("# B\n\n- 항목", encoding="utf-8")
+    (src / "broken.md").write_bytes(b"\xff\xfe\xfa")
+    out = tmp_path / "out"
+
+    results = md_dir_to_doc(str(src), str(out), recursive=True, jobs=2)
+
+    assert [os.path.basename(r.input_path) for r in results] == ["a.md", "broken.md", "b.md"]
+    assert (out / "a.docx").is_file()
+    assert (out / "sub" / "b.docx").is_file()
+    failures = [r for r in results if r.error]
+    assert len(failures) == 1 and failures[0].input_path.endswith("broken.md")
+
+
+def test_md_dir_to_doc_shares_manifest_with_md_to_doc(monkeypatch, tmp_path):
+    """일괄 변환도 출력 파일 디렉토리별 매니페스트를 사용하여 md_to_doc과 증분 기록 공유"""
+    pytest.importorskip("docx")
+    from helper_md_doc import helper_md_doc
+    from helper_md_doc.helper_build_manifest import MANIFEST_NAME
+    from helper_md_doc.helper_md_doc import md_dir_to_doc, md_to_doc
+
+    src = tmp_path / "docs"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.md").write_text("# A", encoding="utf-8")
+    (src / "sub" / "b.md").write_text("# B", encoding="utf-8")
+    out = tmp_path / "out"
+
+    md_dir_to_doc(str(src), str(out), recursive=True, incremental=True, backend="native")
+    assert sorted(path.relative_to(out) for path in out.rglob(MANIFEST_NAME)) == [
+        Path(MANIFEST_NAME),
+        Path("sub") / MANIFEST_NAME,
+    ]
+
+    def fail_convert(*args):
+        raise AssertionError("변경 없는 파일을 다시 변환")
+
+    monkeypatch.setattr(helper_md_doc, "_html_to_docx", fail_convert)
+    md_to_doc(
+        str(src / "sub" / "b.md"),
+        str(out / "sub" / "b.docx"),
+        title="b",
+        incremental=True,
+        backend="native",
+    )
+    results = md_dir_to_doc(str(src), str(out), recursive=True, incremental=True, backend="native")
+    assert all(result.skipped for result in results)
+
+
+def test_md_to_doc_omml_math(monkeypatch, tmp_path):
+    """omml 모드는 브라우저 렌더링 없이 Word 수식(OMML)을 생성하는지 확인"""
+    try:
+        import pypandoc
+
+        pypandoc.get_pandoc_version()
+    except (ImportError, OSError):
+        pytest.skip("Pandoc이 설치되지 않아 테스트를 건너뜁니다.")
+
+    import zipfile
+
+    from helper_md_doc import helper_md_html
+    from helper_md_doc.helper_md_doc import md_to_doc
+
+    def fail_render(*args):
+        raise AssertionError("omml 모드에서 수식 렌더링 호출")
+
+    monkeypatch.setattr(helper_md_html, "render_latex_batch", fail_render)
+
+    md_path = tmp_path / "math.md"
+    md_path.write_text(
+        "# 수식\n\n인라인 $a_i < b^2$ 문장\n\n$$\\frac{1}{n}\\sum_{i=1}^{n} x_i$$\n",
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "math.docx"
+    md_to_doc(str(md_path), str(output_path), math="omml")
+
+    document = zipfile.ZipFile(output_path).read("word/document.xml").decode("utf-8")
+    assert document.count("<m:oMath>") == 2
+    assert "<m:oMathPara>" in document
+    assert "<w:drawing>" not in document
+
+
+def test_md_to_targets_single_render_pass(monkeypatch, tmp_path):
+    """HTML과 DOCX를 함께 출력할 때 렌더링과 Markdown 파싱은 한 번만 수행"""
+    pytest.importorskip("docx")
+    import zipfile
+
+    import markdown
+
+    from helper_md_doc import helper_md_html
+    from helper_md_doc.helper_md_doc import md_to_targets
+    from helper_md_doc.helper_render_cache import RenderCache
+    from tests.test_render_session import tiny_png
+
+    calls = {"mermaid": 0, "latex": 0, "markdown": 0}
+
+    def fake_mermaid(codes):
+        calls["mermaid"] += len(codes)
+        return [tiny_png() for _ in codes]
+
+    def fake_latex(items, sprite=None):
+        calls["latex"] += len(items)
+        return [tiny_png() for _ in items]
+
+    parse = markdown.markdown
+
+    def counting_markdown(*args, **kwargs):
+        calls["markdown"] += 1
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(helper_md_html, "render_mermaid_batch", fake_mermaid)
+    monkeypatch.setattr(helper_md_html, "render_latex_batch", fake_latex)
+    monkeypatch.setattr(markdown, "markdown", counting_markdown)
+
+    md_path = tmp_path / "doc.md"
+    md_path.write_text(
+        "# 문서\n\n```mermaid\ngraph TD; A-->B\n```\n\n본문 $\\frac{1}{2}$\n", encoding="utf-8"
+    )
+    html_path, docx_path = tmp_path / "out" / "doc.html", tmp_path / "doc.docx"
+    html_path.parent.mkdir()
+
+    md_to_targets(
+        str(md_path),
+        str(html_path),
+        str(docx_path),
+        cache=RenderCache(str(tmp_path / "cache")),
+        backend="native",
+        html_base64=False,
+    )
+
+    assert calls == {"mermaid": 1, "latex": 1, "markdown": 1}
+    html = html_path.read_text(encoding="utf-8")
+    assert 'src="mermaid_diagrams/diagram_001.png"' in html
+    assert (html_path.parent / "latex_equations" / "eq_inline_001.png").is_file()
+    document = zipfile.ZipFile(docx_path).read("word/document.xml").decode("utf-8")
+    assert "본문" in document and document.count("<w:drawing>") == 2
+
+
+def test_md_to_targets_cli(monkeypatch, tmp_path):
+    """md2doc input.md --html out.html --docx out.docx"""
+    pytest.importorskip("docx")
+    import sys
+
+    from helper_md_doc import helper_md_doc
+
+    md_path = tmp_path / "doc.md"
+    md_path.write_text("# 문서\n\n본문 $x^2$\n", encoding="utf-8")
+    html_path, docx_path = tmp_path / "doc.html", tmp_path / "doc.docx"
+    argv = ["md2doc", str(md_path), "--html", str(html_path), "--docx", str(docx_path)]
+    monkeypatch.setattr(sys, "argv", argv + ["--backend", "native", "--math", "fast"])
+
+    helper_md_doc.main()
+
+    assert "<i>x</i><sup>2</sup>" in html_path.read_text(encoding="utf-8")
+    assert docx_path.is_file()
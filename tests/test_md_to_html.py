@@ -1,6 +1,7 @@
 """Tests for helper_md_doc package"""
 
 import pytest
+import os
 from helper_md_doc import md_to_html, __version__
 
 
@@ -78,3 +79,351 @@ def test_md_to_html_no_title():
     html = md_to_html(md_text, title=None, use_base64=True)
 
     assert "<title>Untitled</title>" in html or "<title></title>" in html
+
+
+def test_md_to_html_dedup_equations(monkeypatch, tmp_path):
+    """동일한 수식은 한 번만 렌더링하고 같은 PNG 파일을 공유하는지 확인"""
+    from helper_md_doc import helper_md_html
+
+    rendered = []
+
+    def fake_render_latex_batch(items):
+        rendered.extend(items)
+        return [b"\x89PNG" + code.encode("utf-8") for code, _ in items]
+
+    monkeypatch.setattr(helper_md_html, "render_latex_batch", fake_render_latex_batch)
+
+    md_text = "# 수식\n\n$x_i$ 와 $x_i$ 그리고 $y^2$\n\n$$x_i$$\n"
+    jobs = {}
+    md_text = helper_md_html.extract_latex_jobs(md_text, jobs)
+    job_list = list(jobs)
+    png_list = helper_md_html.render_jobs(job_list)
+    html = helper_md_html.restore_rendered_images(
+        md_text, job_list, png_list, use_base64=False, latex_dir=str(tmp_path)
+    )
+
+    assert rendered == [("x_i", False), ("y^2", False), ("x_i", True)]
+    assert html.count(f"{tmp_path}/eq_inline_001.png") == 2
+    assert sorted(os.listdir(tmp_path)) == [
+        "eq_display_003.png",
+        "eq_inline_001.png",
+        "eq_inline_002.png",
+    ]
+
+
+def test_render_jobs_parallel_matches_sequential(monkeypatch):
+    """병렬 렌더링 결과가 순차 렌더링과 동일한 순서인지 확인"""
+    from helper_md_doc import helper_md_html
+    from helper_md_doc.helper_md_html import RenderJob
+
+    monkeypatch.setattr(
+        helper_md_html,
+        "render_latex_batch",
+        lambda items: [f"latex:{code}:{display}".encode() for code, display in items],
+    )
+    monkeypatch.setattr(
+        helper_md_html,
+        "render_mermaid_batch",
+        lambda codes: [f"mermaid:{code}".encode() for code in codes],
+    )
+
+    jobs = [RenderJob("mermaid", f"graph TD; A{i}-->B") for i in range(3)]
+    jobs += [RenderJob("latex", f"x_{i}", i % 2 == 0) for i in range(7)]
+
+    sequential = helper_md_html.render_jobs(jobs)
+    parallel = helper_md_html.render_jobs(jobs, workers=4)
+
+    assert parallel == sequential
+    assert sequential[0] == b"mermaid:graph TD; A0-->B"
+    assert sequential[3] == b"latex:x_0:True"
+
+
+@pytest.mark.parametrize("capture", ["sprite", "element"])
+def test_render_jobs_workers_match_sequential_bytes(monkeypatch, capture):
+    """작업자 수로 묶음 크기가 바뀌어도 수식별 PNG 바이트가 순차 렌더링과 동일 (가짜 페이지)"""
+    import io
+    import zlib
+
+    Image = pytest.importorskip("PIL.Image")
+    from helper_md_doc import helper_md_html
+    from helper_md_doc.helper_md_html import RenderJob
+
+    class FakeHandle:
+        def __init__(self, code):
+            self.code = code
+
+        def screenshot(self):
+            return f"element:{self.code}".encode()
+
+    class FakePage:
+        def evaluate(self, script, items):
+            self.codes = [code for code, _ in items]
+            if script == helper_md_html._KATEX_SPRITE_JS:
+                return [[[0.0, 10.0 * i, 8.0, 6.0] for i in range(len(items))], []]
+            return []
+
+        def query_selector_all(self, selector):
+            return [FakeHandle(code) for code in self.codes]
+
+        def screenshot(self, clip, full_page):
+            # 수식마다 코드에서 정한 색으로 칠한 격자 (위치와 무관하게 같은 수식은 같은 조각)
+            sheet = Image.new("RGB", (16, 10 * len(self.codes)), "white")
+            for i, code in enumerate(self.codes):
+                color = zlib.crc32(code.encode()).to_bytes(4, "big")[1:]
+                sheet.paste(tuple(color), (0, 10 * i, 8, 10 * i + 6))
+            box = (clip["x"], clip["y"], clip["x"] + clip["width"], clip["y"] + clip["height"])
+            buffer = io.BytesIO()
+            sheet.crop(box).save(buffer, "PNG")
+            return buffer.getvalue()
+
+    monkeypatch.setenv(helper_md_html.LATEX_CAPTURE_ENV, capture)
+    monkeypatch.setattr(helper_md_html, "_get_katex_page", FakePage)
+    monkeypatch.setattr(helper_md_html, "_cleanup_browser", lambda: None)
+    jobs = [RenderJob("latex", f"x_{{{i}}}", i % 3 == 0) for i in range(10)]
+
+    sequential = helper_md_html.render_jobs(jobs, workers=1)
+
+    assert helper_md_html.render_jobs(jobs, workers=4) == sequential
+    assert len(set(sequential)) == len(jobs)
+
+
+def test_package_import_is_lazy():
+    """패키지 임포트 시 무거운 의존성을 로드하지 않는지 확인"""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    src_dir = str(Path(__file__).resolve().parents[1] / "src")
+    code = (
+        f"import sys; sys.path.insert(0, {src_dir!r}); import helper_md_doc; "
+        "print(sorted(m for m in ('playwright', 'pypandoc', 'markdown') if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+    assert output.strip() == "[]"
+
+
+def test_md_to_html_svg_format(monkeypatch, tmp_path):
+    """svg 형식은 스크린샷 없이 SVG/MathML을 삽입하고 캐시 키를 분리하는지 확인"""
+    from helper_md_doc import helper_md_html
+    from helper_md_doc.helper_render_cache import RenderCache
+
+    def fail_png(*args):
+        raise AssertionError("svg 형식에서 PNG 렌더링 호출")
+
+    monkeypatch.setattr(helper_md_html, "render_mermaid_batch", fail_png)
+    monkeypatch.setattr(helper_md_html, "render_latex_batch", fail_png)
+    monkeypatch.setattr(
+        helper_md_html,
+        "render_mermaid_svg_batch",
+        lambda codes: ['<svg width="120" height="40" viewBox="0 0 120 40"></svg>' for _ in codes],
+    )
+    monkeypatch.setattr(
+        helper_md_html,
+        "render_latex_mathml_batch",
+        lambda items: [f"<math><mi>{code}</mi></math>" for code, _ in items],
+    )
+
+    md_text = "# SVG\n\n```mermaid\ngraph TD; A-->B\n```\n\n인라인 $a_1 * b_2 * c$\n\n$$x_i$$\n"
+    cache = RenderCache(str(tmp_path / "cache"))
+    html = md_to_html(md_text, use_base64=True, cache=cache, image_format="svg")
+
+    assert 'src="data:image/svg+xml;base64,' in html
+    assert "<math><mi>a_1 * b_2 * c</mi></math>" in html
+    assert (
+        '<div style="text-align: center; margin: 1rem 0;"><math><mi>x_i</mi></math></div>' in html
+    )
+    assert "<p><div" not in html
+    assert "image/png" not in html
+
+    png_key = RenderCache.make_key("latex", "x_i", True)
+    svg_key = RenderCache.make_key("latex", "x_i", True, image_format="svg")
+    assert png_key != svg_key
+    assert cache.get(svg_key) == b"<math><mi>x_i</mi></math>"
+
+    with pytest.raises(ValueError):
+        md_to_html(md_text, image_format="gif")
+
+
+def test_svg_with_intrinsic_size():
+    """Mermaid SVG 루트의 width=100%가 viewBox 크기로 바뀌는지 확인"""
+    from helper_md_doc.helper_md_html import _svg_with_intrinsic_size
+
+    svg = '<svg id="m" width="100%" style="max-width: 200px;" viewBox="-8 -8 200.5 96"><g/></svg>'
+    fixed = _svg_with_intrinsic_size(svg)
+
+    assert fixed.startswith('<svg width="200.5" height="96" id="m"')
+    assert 'width="100%"' not in fixed
+    assert fixed.endswith("<g/></svg>")
+
+
+def test_extract_render_jobs_skips_code():
+    """코드 블록/코드 스팬 안의 $는 수식으로 처리하지 않고 \\$는 $ 문자로 남기는지 확인"""
+    from helper_md_doc.helper_md_html import RenderJob, extract_render_jobs
+
+    md_text = (
+        "가격 \\$5, 코드 `$a_1$` 와 ``x `$b_1$` y`` 다음 $c_1$\n\n"
+        '```python\nx = "$d_1$"\n```\n\n'
+        "~~~mermaid\ngraph TD; A-->B\n~~~\n\n"
+        "$$\n\\frac{a}{b}\n$$\n"
+        "닫히지 않은 $$ 와 $e_1$\n"
+    )
+    body, jobs = extract_render_jobs(md_text)
+
+    assert jobs == [
+        RenderJob("latex", "c_1"),
+        RenderJob("mermaid", "graph TD; A-->B"),
+        RenderJob("latex", "\\frac{a}{b}", True),
+        RenderJob("latex", "e_1"),
+    ]
+    assert body.startswith("가격 $5, 코드 `$a_1$` 와 ``x `$b_1$` y`` 다음 \x00R0\x00\n")
+    assert '```python\nx = "$d_1$"\n```' in body
+    assert "\x00R1\x00\n\n\x00R2\x00\n닫히지 않은 $$ 와 \x00R3\x00\n" in body
+
+
+def test_md_to_html_stream_matches_md_to_html(monkeypatch):
+    """스트리밍 출력이 md_to_html과 동일하고 Base64가 청크 경계에서 유효한지 확인"""
+    import io
+
+    from helper_md_doc import helper_md_html
+
+    monkeypatch.setattr(
+        helper_md_html,
+        "render_latex_batch",
+        lambda items: [bytes(range(256)) * (len(code) + 3) for code, _ in items],
+    )
+    monkeypatch.setattr(
+        helper_md_html, "render_mermaid_batch", lambda codes: [b"\x89PNG" * 1001 for _ in codes]
+    )
+    monkeypatch.setattr(helper_md_html, "BASE64_CHUNK_SIZE", 3 * 7)
+    monkeypatch.setattr(helper_md_html, "STREAM_RENDER_BATCH", 2)
+
+    md_text = (
+        "# 스트림\n\n```mermaid\ngraph TD; A-->B\n```\n\n"
+        "$a_1$ 와 $b_2$ 와 $a_1$\n\n$$\\frac{1}{2}$$\n\n| 표 | $c^2$ |\n|---|---|\n| 1 | 2 |\n"
+    )
+    expected = md_to_html(md_text, use_base64=True)
+    out = io.StringIO()
+    helper_md_html.md_to_html_stream(md_text, out, use_base64=True)
+
+    assert out.getvalue() == expected
+    assert expected.count("data:image/png;base64,") == 6
+
+
+def test_sprite_bands_split_rows_by_height():
+    """스프라이트 띠: 세로 한도 안에서 행 단위로 묶고 큰 상자는 단독 띠"""
+    from helper_md_doc.helper_md_html import _sprite_bands
+
+    boxes = [(0, 0, 50, 30), (60, 0, 90, 40), (0, 50, 40, 80), (0, 90, 70, 300)]
+
+    assert _sprite_bands(boxes, max_height=100) == [
+        ((0, 0, 90, 80), [0, 1, 2]),
+        ((0, 90, 70, 300), [3]),
+    ]
+    assert _sprite_bands([]) == []
+
+
+def test_render_latex_sprite_slices_screenshot(monkeypatch):
+    """render_latex_sprite: 띠 스크린샷을 수식별 경계 상자로 분할 (브라우저 대신 가짜 페이지)"""
+    import io
+
+    Image = pytest.importorskip("PIL.Image")
+    from helper_md_doc import helper_md_html
+
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    rects = [[8.0, 8.0, 40.0, 20.0], [50.0, 8.0, 30.5, 20.0], [8.0, 30.0, 60.0, 25.0]]
+    sheet = Image.new("RGB", (200, 100), "white")
+    for rect, color in zip(rects, colors):
+        box = helper_md_html._pixel_box(*rect)
+        sheet.paste(color, box)
+
+    class FakePage:
+        def __init__(self):
+            self.screenshots = 0
+
+        def evaluate(self, script, items):
+            assert script == helper_md_html._KATEX_SPRITE_JS
+            return [rects, [[2, "ParseError"]]]
+
+        def screenshot(self, clip, full_page):
+            self.screenshots += 1
+            box = (clip["x"], clip["y"], clip["x"] + clip["width"], clip["y"] + clip["height"])
+            buffer = io.BytesIO()
+            sheet.crop(box).save(buffer, "PNG")
+            return buffer.getvalue()
+
+    page = FakePage()
+    monkeypatch.setattr(helper_md_html, "_get_katex_page", lambda: page)
+    items = [("a", False), ("b", False), ("c", True)]
+    results = helper_md_html.render_latex_batch(items, sprite=True)
+
+    assert page.screenshots == 1
+    sizes = [(40, 20), (31, 20), (60, 25)]
+    for png_bytes, color, size in zip(results, colors, sizes):
+        image = Image.open(io.BytesIO(png_bytes)).convert("RGB")
+        assert image.size == size
+        assert image.getcolors() == [(size[0] * size[1], color)]
+
+
+def test_latex_capture_mode_ignores_batch_size(monkeypatch):
+    """수식 촬영 방식은 수식 수와 무관하게 환경 변수(없으면 Pillow 설치 여부)로 결정"""
+    from helper_md_doc import helper_md_html
+
+    used = []
+    monkeypatch.setattr(helper_md_html, "render_latex_sprite", lambda items: used.append("sprite"))
+    monkeypatch.setattr(helper_md_html, "pillow_available", lambda: True)
+
+    monkeypatch.delenv(helper_md_html.LATEX_CAPTURE_ENV, raising=False)
+    assert helper_md_html.latex_capture_mode() == "sprite"
+    helper_md_html.render_latex_batch([("x", False)])
+    assert used == ["sprite"]
+
+    monkeypatch.setenv(helper_md_html.LATEX_CAPTURE_ENV, "element")
+    assert helper_md_html.latex_capture_mode() == "element"
+    monkeypatch.setenv(helper_md_html.LATEX_CAPTURE_ENV, "tiles")
+    with pytest.raises(ValueError):
+        helper_md_html.latex_capture_mode()
+
+    monkeypatch.delenv(helper_md_html.LATEX_CAPTURE_ENV)
+    monkeypatch.setattr(helper_md_html, "pillow_available", lambda: False)
+    assert helper_md_html.latex_capture_mode() == "element"
+
+
+def test_render_mermaid_batch_single_evaluate(monkeypatch):
+    """Mermaid 일괄 렌더링: evaluate 한 번, 경계 상자별 clip 스크린샷, 첫 번째 오류는 RuntimeError"""
+    from helper_md_doc import helper_md_html
+
+    results = [
+        {"svg": '<svg viewBox="0 0 40 20"></svg>', "box": [28.0, 28.0, 39.5, 20.0], "error": None},
+        {"svg": '<svg viewBox="0 0 10 10"></svg>', "box": [28.0, 48.0, 10.0, 10.0], "error": None},
+    ]
+
+    class FakePage:
+        def __init__(self):
+            self.evaluated = []
+            self.clips = []
+
+        def evaluate(self, script, codes):
+            assert script == helper_md_html._MERMAID_BATCH_JS
+            self.evaluated.append(codes)
+            return results
+
+        def screenshot(self, clip, full_page):
+            self.clips.append(clip)
+            return f"png:{clip['y']}".encode()
+
+    page = FakePage()
+    monkeypatch.setattr(helper_md_html, "_get_browser_page", lambda: page)
+    codes = ["graph TD; A-->B", 'graph LR; C["<b>"]-->D']
+
+    assert helper_md_html.render_mermaid_batch(codes) == [b"png:28", b"png:48"]
+    assert page.evaluated == [[helper_md_html.sanitize_mermaid_code(code) for code in codes]]
+    assert page.clips[0] == {"x": 28, "y": 28, "width": 40, "height": 20}
+
+    svgs = helper_md_html.render_mermaid_svg_batch(codes)
+    assert svgs[0].startswith('<svg width="40" height="20"')
+    assert len(page.evaluated) == 2 and len(page.clips) == 2
+
+    results[1] = {"svg": None, "box": None, "error": "Parse error on line 1"}
+    with pytest.raises(RuntimeError, match="Parse error"):
+        helper_md_html.render_mermaid_batch(codes)
@@ -0,0 +1,97 @@
+"""Tests for conversion profiling (browser renderers replaced, no Chromium needed)"""
+
+import json
+import sys
+
+import pytest
+
+from helper_md_doc import helper_md_html
+from helper_md_doc.helper_md_html import md_to_html
+from helper_md_doc.helper_profile import ConversionProfile, profile_stage
+from helper_md_doc.helper_render_cache import RenderCache
+
+MD_TEXT = "# 프로파일\n\n```mermaid\ngraph TD; A-->B\n```\n\n인라인 $a_1$ 그리고 $b^2$\n"
+
+
+@pytest.fixture
+def fake_renderers(monkeypatch):
+    monkeypatch.setattr(
+        helper_md_html, "render_mermaid_batch", lambda codes: [b"\x89PNG" * 100 for _ in codes]
+    )
+    monkeypatch.setattr(
+        helper_md_html,
+        "render_latex_batch",
+        lambda items, sprite=None: [b"\x89PNG" * 10 for _ in items],
+    )
+
+
+def test_md_to_html_records_stages_and_items(fake_renderers, tmp_path):
+    """단계별 통계와 렌더링 항목이 기록되고, 두 번째 변환은 캐시 적중으로 기록"""
+    events = []
+    cache = RenderCache(str(tmp_path / "cache"))
+    profile = ConversionProfile(callback=events.append)
+
+    md_to_html(MD_TEXT, use_base64=True, cache=cache, profile=profile)
+
+    stages = profile.to_dict()["stages"]
+    for name in ("extract", "cache", "render.mermaid", "render.latex", "markdown", "md_to_html"):
+        assert name in stages
+    assert stages["extract"]["count"] == 3
+    assert stages["render.mermaid"] == {
+        "count": 1,
+        "seconds": stages["render.mermaid"]["seconds"],
+        "bytes": 400,
+    }
+    assert stages["render.latex"]["count"] == 2
+    assert stages["base64"]["count"] == 3
+    assert stages["md_to_html"]["bytes"] > stages["base64"]["bytes"] > 0
+    assert [item["kind"] for item in profile.items] == ["mermaid", "latex", "latex"]
+    assert all(item["batched"] for item in profile.items[1:])
+    assert {event["type"] for event in events} == {"stage", "item"}
+
+    second = ConversionProfile()
+    md_to_html(MD_TEXT, use_base64=True, cache=cache, profile=second)
+    assert "render.latex" not in second.stages
+    assert [item["cached"] for item in second.items] == [True, True, True]
+    assert json.loads(second.to_json())["stages"]["cache"]["count"] == 3
+
+
+def test_profile_follows_worker_threads(fake_renderers, tmp_path):
+    """workers>1 렌더링 스레드에서도 호출한 쪽의 프로파일에 기록"""
+    profile = ConversionProfile()
+    cache = RenderCache(str(tmp_path / "cache"))
+    md_to_html(MD_TEXT, cache=cache, workers=2, profile=profile, media_dir=str(tmp_path))
+
+    assert profile.stages["render.mermaid"].count == 1
+    assert profile.stages["render.latex"].count == 2
+    assert len(profile.items) == 3
+
+
+def test_no_profile_records_nothing(fake_renderers, tmp_path):
+    """프로파일이 없으면 profile_stage는 기록 대상이 없음"""
+    with profile_stage("extract") as stage:
+        pass
+    assert stage.profile is None
+    assert "<img" in md_to_html(MD_TEXT, use_base64=True, cache=RenderCache(str(tmp_path)))
+
+
+def test_cli_profile_json(tmp_path, monkeypatch):
+    """html2doc --profile PATH: 단계별 JSON 보고서 기록"""
+    pytest.importorskip("docx")
+    from helper_md_doc import helper_html_doc
+
+    html_path = tmp_path / "doc.html"
+    html_path.write_text("<html><body><h1>제목</h1><p>본문</p></body></html>", encoding="utf-8")
+    report_path = tmp_path / "profile.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["html2doc", str(html_path), "--backend", "native", "--profile", str(report_path)],
+    )
+
+    helper_html_doc.main()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert set(report["stages"]) == {"html_to_doc", "read", "embed_images", "clean_html", "docx"}
+    assert report["stages"]["docx"]["bytes"] == (tmp_path / "doc.docx").stat().st_size
+    assert report["items"] == []
@@ -0,0 +1,114 @@
+"""Tests for the on-disk render cache"""
+
+import os
+import time
+
+from helper_md_doc import RenderCache
+
+
+def test_render_cache_hit_miss(tmp_path):
+    """저장 전후 조회 시 적중/미스 카운터 확인"""
+    cache = RenderCache(str(tmp_path))
+    key = RenderCache.make_key("latex", r"\alpha", display_mode=False)
+
+    assert cache.get(key) is None
+    cache.put(key, b"png-bytes")
+    assert cache.get(key) == b"png-bytes"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes"] == len(b"png-bytes")
+
+
+def test_render_cache_key_inputs():
+    """코드, display_mode, 종류, 테마, 수식 촬영 방식이 다르면 다른 키 생성"""
+    base = RenderCache.make_key("latex", "x^2", display_mode=False)
+
+    assert base == RenderCache.make_key("latex", "x^2", display_mode=False)
+    assert base != RenderCache.make_key("latex", "x^2", display_mode=True)
+    assert base != RenderCache.make_key("latex", "x^3", display_mode=False)
+    assert RenderCache.make_key("latex", "x^2", capture="sprite") != RenderCache.make_key(
+        "latex", "x^2", capture="element"
+    )
+    assert RenderCache.make_key("mermaid", "graph TD") != RenderCache.make_key(
+        "mermaid", "graph TD", theme="dark"
+    )
+
+
+def test_render_cache_lru_eviction(tmp_path):
+    """용량 초과 시 가장 오래 사용되지 않은 항목부터 삭제"""
+    cache = RenderCache(str(tmp_path), max_bytes=20)
+    keys = [RenderCache.make_key("latex", f"x_{i}") for i in range(3)]
+
+    cache.put(keys[0], b"0" * 8)
+    cache.put(keys[1], b"1" * 8)
+    # keys[0]을 최근 사용으로 갱신
+    past = time.time() - 100
+    os.utime(cache._path(keys[1]), (past, past))
+    assert cache.get(keys[0]) is not None
+
+    cache.put(keys[2], b"2" * 8)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == b"0" * 8
+    assert cache.get(keys[2]) == b"2" * 8
+    assert cache.stats()["bytes"] <= 20
+
+
+def test_render_cache_shared_directory_races(tmp_path):
+    """같은 디렉토리를 쓰는 여러 캐시(프로세스)가 동시에 저장/조회/삭제해도 오류 없음"""
+    import threading
+
+    errors = []
+
+    def worker(index):
+        cache = RenderCache(str(tmp_path), max_bytes=2048)
+        try:
+            for i in range(200):
+                key = RenderCache.make_key("latex", f"x_{i % 20}")
+                cache.put(key, bytes([index]) * 300)
+                data = cache.get(key)
+                assert data is None or len(data) == 300
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert not [
+        name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(".tmp")
+    ]
+
+
+def test_render_cache_shared_instance_threads(tmp_path):
+    """한 인스턴스를 여러 스레드가 공유해도 오류 없이 카운터와 용량이 일관됨"""
+    import threading
+
+    cache = RenderCache(str(tmp_path), max_bytes=2048)
+    errors = []
+
+    def worker(index):
+        try:
+            for i in range(200):
+                key = RenderCache.make_key("latex", f"x_{i % 20}")
+                cache.put(key, bytes([index]) * 300)
+                cache.get(key)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert errors == []
+    assert stats["hits"] + stats["misses"] == 800
+    assert stats["bytes"] == stats["entries"] * 300 <= 2048
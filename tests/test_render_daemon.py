@@ -0,0 +1,125 @@
+"""Tests for the rendering daemon (browser functions replaced, no Chromium needed)"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from helper_md_doc import helper_md_html
+from helper_md_doc.helper_md_html import RenderJob, render_jobs
+from helper_md_doc.helper_render_daemon import (
+    RenderDaemonClient,
+    _open_private,
+    default_socket_path,
+    runtime_dir,
+    serve,
+    set_render_daemon,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="Unix 소켓 전용")
+
+
+def fake_render(jobs, image_format="png", capture=None):
+    if any(job.code == "bad" for job in jobs):
+        raise RuntimeError("Mermaid 구문 오류: bad")
+    return [f"{image_format}:{job.kind}:{job.code}".encode() * 1000 for job in jobs]
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """스레드에서 실행하는 데몬과 연결된 클라이언트"""
+    monkeypatch.setattr(helper_md_html, "_render_uncached", fake_render)
+    for name in ("_get_browser_page", "_get_katex_page", "_cleanup_browser"):
+        monkeypatch.setattr(helper_md_html, name, lambda: None)
+
+    socket_path = str(tmp_path / "render.sock")
+    thread = threading.Thread(target=serve, args=(socket_path, 10.0), daemon=True)
+    thread.start()
+    client = RenderDaemonClient(socket_path, autostart=False)
+    deadline = time.monotonic() + 5
+    while not client.ping():
+        assert time.monotonic() < deadline, "데몬이 기동되지 않음"
+        time.sleep(0.01)
+    yield client
+    client.shutdown()
+    thread.join(5)
+    set_render_daemon(None)
+
+
+def test_daemon_renders_and_reports_errors(daemon):
+    """데몬 렌더링 결과는 요청 순서대로 반환되고, 렌더링 오류는 RuntimeError"""
+    jobs = [RenderJob("mermaid", "graph TD"), RenderJob("latex", "x^2", True)]
+
+    assert daemon.render(jobs) == fake_render(jobs)
+    assert daemon.render(jobs, "svg") == fake_render(jobs, "svg")
+    with pytest.raises(RuntimeError, match="bad"):
+        daemon.render([RenderJob("mermaid", "bad")])
+    assert daemon.ping()
+
+
+def test_daemon_shutdown_removes_socket(daemon):
+    """종료 요청 후 소켓 파일 삭제"""
+    assert daemon.shutdown()
+    deadline = time.monotonic() + 5
+    while os.path.exists(daemon.socket_path):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert not daemon.ping()
+    assert not daemon.shutdown()
+
+
+def test_render_jobs_uses_daemon_and_falls_back(daemon, tmp_path, monkeypatch):
+    """render_jobs: 설정된 데몬으로 렌더링, 연결할 수 없으면 현재 프로세스에서 렌더링"""
+    jobs = [RenderJob("latex", "a_1"), RenderJob("mermaid", "graph LR")]
+    in_main_thread = []
+
+    captures = []
+
+    def tracking_render(jobs, image_format="png", capture=None):
+        in_main_thread.append(threading.current_thread() is threading.main_thread())
+        captures.append(capture)
+        return fake_render(jobs, image_format)
+
+    monkeypatch.setattr(helper_md_html, "_render_uncached", tracking_render)
+    set_render_daemon(daemon)
+    assert render_jobs(jobs) == fake_render(jobs)
+    assert in_main_thread == [False]
+
+    set_render_daemon(RenderDaemonClient(str(tmp_path / "missing.sock"), autostart=False))
+    assert render_jobs(jobs) == fake_render(jobs)
+    assert in_main_thread == [False, True]
+    # 데몬도 호출자의 캐시 키와 같은 수식 촬영 방식으로 렌더링
+    assert captures[0] == helper_md_html.latex_capture_mode()
+
+
+def test_daemon_exits_when_idle(tmp_path, monkeypatch):
+    """idle_timeout 동안 요청이 없으면 serve가 반환"""
+    for name in ("_get_browser_page", "_get_katex_page", "_cleanup_browser"):
+        monkeypatch.setattr(helper_md_html, name, lambda: None)
+    socket_path = str(tmp_path / "idle.sock")
+
+    start = time.monotonic()
+    serve(socket_path, idle_timeout=0.2)
+
+    assert time.monotonic() - start < 5
+    assert not os.path.exists(socket_path)
+
+
+def test_runtime_dir_is_private(monkeypatch, tmp_path):
+    """기본 소켓 디렉토리는 사용자 전용 0700, 권한이 열린 디렉토리와 심볼릭 링크는 거부"""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    path = runtime_dir()
+    assert os.stat(path).st_mode & 0o777 == 0o700
+    assert os.path.dirname(default_socket_path()) == path
+
+    os.chmod(path, 0o755)
+    with pytest.raises(PermissionError):
+        runtime_dir()
+
+    target = tmp_path / "target"
+    link = tmp_path / "render.sock.lock"
+    link.symlink_to(target)
+    with pytest.raises(OSError):
+        _open_private(str(link), "w")
+    assert not target.exists()
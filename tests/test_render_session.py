@@ -0,0 +1,161 @@
+"""Tests for RenderSession browser reuse (Playwright replaced by a fake, no Chromium needed)"""
+
+import struct
+import threading
+import zlib
+
+import pytest
+
+from helper_md_doc import helper_md_html
+from helper_md_doc.helper_md_doc import md_to_doc
+from helper_md_doc.helper_md_html import RenderSession, current_session, md_to_html
+from helper_md_doc.helper_render_cache import RenderCache
+
+sync_api = pytest.importorskip("playwright.sync_api")
+
+MD_TEXT = "# 세션\n\n```mermaid\ngraph TD; A-->B\n```\n"
+
+
+def tiny_png() -> bytes:
+    """1x1 흰색 PNG"""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    pixels = zlib.compress(b"\x00\xff\xff\xff")
+    return (
+        b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+    )
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def set_content(self, html):
+        pass
+
+    def add_script_tag(self, content):
+        pass
+
+    def evaluate(self, script, *args):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, launches):
+        self.closed = False
+        self.thread = threading.current_thread()
+        launches.append(self)
+
+    def new_page(self):
+        return FakePage(self)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def launches(monkeypatch, tmp_path):
+    """기동된 FakeBrowser 목록 (Mermaid 렌더링은 현재 브라우저 페이지를 거쳐 PNG 반환)"""
+    launched = []
+
+    class FakePlaywright:
+        def __init__(self):
+            self.chromium = self
+
+        def launch(self, headless=True):
+            return FakeBrowser(launched)
+
+        def start(self):
+            return self
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(sync_api, "sync_playwright", FakePlaywright)
+    monkeypatch.setattr(
+        helper_md_html,
+        "render_mermaid_batch",
+        lambda codes: helper_md_html._get_browser_page() and [tiny_png() for _ in codes],
+    )
+    yield launched
+    helper_md_html._cleanup_browser()
+
+
+def convert_twice(tmp_path, **kwargs):
+    md_path = tmp_path / "doc.md"
+    for index in range(2):
+        md_path.write_text(MD_TEXT + f"\n{index}\n", encoding="utf-8")
+        md_to_doc(
+            str(md_path),
+            str(tmp_path / "doc.docx"),
+            cache=RenderCache(str(tmp_path / f"cache{index}")),
+            backend="native",
+            **kwargs,
+        )
+
+
+def test_session_reuses_browser_across_calls(launches, tmp_path):
+    """세션을 전달하면 md_to_doc 호출 간에 브라우저 하나를 재사용하고 세션 종료 시 닫음"""
+    pytest.importorskip("docx")
+    with RenderSession() as session:
+        convert_twice(tmp_path, session=session)
+        assert len(launches) == 1
+        assert not launches[0].closed
+        assert current_session() is session
+    assert launches[0].closed
+    assert current_session() is None
+    assert helper_md_html._state.browser is None
+
+
+def test_without_session_browser_closed_per_call(launches, tmp_path):
+    """세션 없이 호출하면 기존처럼 md_to_doc마다 브라우저를 닫음"""
+    pytest.importorskip("docx")
+    convert_twice(tmp_path)
+    assert len(launches) == 2
+    assert all(browser.closed for browser in launches)
+
+
+def test_session_worker_threads_use_own_browser(launches, tmp_path):
+    """workers>1 렌더링 스레드는 별도 브라우저를 띄우고 작업 후 닫으며, 세션 브라우저는 유지"""
+    session = RenderSession().warm()
+    md_text = MD_TEXT + "\n```mermaid\ngraph LR; C-->D\n```\n"
+    md_to_html(
+        md_text,
+        cache=RenderCache(str(tmp_path)),
+        workers=2,
+        media_dir=str(tmp_path),
+        session=session,
+    )
+
+    main_browser = launches[0]
+    workers = launches[1:]
+    assert main_browser.thread is threading.current_thread() and not main_browser.closed
+    assert workers and all(browser.closed for browser in workers)
+    assert all(browser.thread is not threading.current_thread() for browser in workers)
+
+    session.close()
+    assert main_browser.closed
+
+
+def test_failed_conversion_still_closes_browser(launches, tmp_path, monkeypatch):
+    """DOCX 변환이 실패해도 세션 없이 띄운 브라우저는 닫음"""
+    from helper_md_doc import helper_md_doc
+
+    def fail_convert(*args):
+        raise RuntimeError("pandoc 실패")
+
+    monkeypatch.setattr(helper_md_doc, "_html_to_docx", fail_convert)
+    md_path = tmp_path / "doc.md"
+    md_path.write_text(MD_TEXT, encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        md_to_doc(str(md_path), str(tmp_path / "doc.docx"), cache=RenderCache(str(tmp_path)))
+
+    assert len(launches) == 1 and launches[0].closed
@@ -0,0 +1,156 @@
+"""Tests for the local HTTP conversion server (browser renderers replaced, no Chromium needed)"""
+
+import io
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import zipfile
+
+import pytest
+
+from helper_md_doc import helper_md_html
+from helper_md_doc.helper_serve import ConversionServer
+
+MD_TEXT = "# 서버\n\n```mermaid\ngraph TD; A-->B\n```\n\n본문 $x^2$\n"
+
+
+def post(server, text, **params):
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    request = urllib.request.Request(f"{server.url}/convert?{query}", data=text.encode("utf-8"))
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.status, response.headers["Content-Type"], response.read()
+
+
+def get_json(server, path):
+    with urllib.request.urlopen(f"{server.url}{path}", timeout=10) as response:
+        return json.loads(response.read())
+
+
+@pytest.fixture
+def fake_renderers(monkeypatch):
+    monkeypatch.setattr(
+        helper_md_html, "render_mermaid_batch", lambda codes: [b"\x89PNG-m" for _ in codes]
+    )
+    monkeypatch.setattr(
+        helper_md_html, "render_latex_batch", lambda items: [b"\x89PNG-l" for _ in items]
+    )
+    for name in ("_get_browser_page", "_get_katex_page", "_cleanup_browser"):
+        monkeypatch.setattr(helper_md_html, name, lambda: None)
+
+
+@pytest.fixture
+def server(fake_renderers):
+    with ConversionServer(port=0, workers=2, backend="native", warm=False) as server:
+        yield server
+
+
+def test_convert_endpoints(server):
+    """md→html, md→docx, html→docx 변환과 잘못된 요청 처리"""
+    pytest.importorskip("docx")
+    status, content_type, body = post(server, MD_TEXT, to="html")
+    assert status == 200 and content_type.startswith("text/html")
+    assert "<h1" in body.decode("utf-8") and "data:image/png;base64," in body.decode("utf-8")
+
+    status, content_type, body = post(server, "# 문서\n\n본문\n", to="docx", title="t")
+    assert content_type.endswith("wordprocessingml.document")
+    assert "본문" in zipfile.ZipFile(io.BytesIO(body)).read("word/document.xml").decode("utf-8")
+
+    status, _, body = post(server, "<html><body><p>HTML 본문</p></body></html>", **{"from": "html"})
+    assert "HTML 본문" in zipfile.ZipFile(io.BytesIO(body)).read("word/document.xml").decode()
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(server, "x", **{"from": "html", "to": "html"})
+    assert error.value.code == 400
+
+    assert get_json(server, "/health") == {"status": "ok"}
+    stats = get_json(server, "/stats")
+    assert stats["completed"] == 3 and stats["failed"] == 0 and stats["workers"] == 2
+    assert stats["latency"]["max"] >= stats["latency"]["p50"] > 0
+
+
+def test_render_error_returns_500(server, monkeypatch):
+    """변환 실패는 오류 메시지와 함께 500, 통계의 failed 증가"""
+
+    def fail(codes):
+        raise RuntimeError("Mermaid 렌더링 실패: Parse error")
+
+    monkeypatch.setattr(helper_md_html, "render_mermaid_batch", fail)
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(server, MD_TEXT, to="html")
+    assert error.value.code == 500
+    assert "Parse error" in json.loads(error.value.read())["error"]
+    assert get_json(server, "/stats")["failed"] == 1
+
+
+def test_full_queue_returns_429(fake_renderers, monkeypatch):
+    """작업자 1개, 큐 1개: 처리 중 1건 + 대기 1건 이후 요청은 즉시 429"""
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_render(codes):
+        started.set()
+        assert release.wait(10)
+        return [b"\x89PNG" for _ in codes]
+
+    monkeypatch.setattr(helper_md_html, "render_mermaid_batch", blocking_render)
+    with ConversionServer(port=0, workers=1, queue_size=1, warm=False) as server:
+        results = []
+        clients = [
+            threading.Thread(target=lambda: results.append(post(server, MD_TEXT, to="html")))
+            for _ in range(2)
+        ]
+        clients[0].start()
+        assert started.wait(10)
+        clients[1].start()
+        while get_json(server, "/stats")["queued"] < 1:
+            time.sleep(0.01)
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post(server, MD_TEXT, to="html")
+        assert error.value.code == 429
+        assert error.value.headers["Retry-After"] == "1"
+
+        release.set()
+        for client in clients:
+            client.join(10)
+        assert [status for status, _, _ in results] == [200, 200]
+        stats = get_json(server, "/stats")
+        assert stats["rejected"] == 1 and stats["completed"] == 2
+
+
+def test_timed_out_request_is_cancelled(fake_renderers, monkeypatch):
+    """504로 응답한 대기 중 요청은 작업자가 변환하지 않고 버림"""
+    started, release = threading.Event(), threading.Event()
+    converted = []
+
+    def blocking_render(codes):
+        converted.append(codes)
+        started.set()
+        assert release.wait(10)
+        return [b"\x89PNG" for _ in codes]
+
+    monkeypatch.setattr(helper_md_html, "render_mermaid_batch", blocking_render)
+    with ConversionServer(port=0, workers=1, warm=False, request_timeout=0.2) as server:
+        assert server.backend == "pandoc"
+        errors = []
+
+        def client():
+            try:
+                post(server, MD_TEXT, to="html")
+            except urllib.error.HTTPError as e:
+                errors.append(e.code)
+
+        first = threading.Thread(target=client)
+        first.start()
+        assert started.wait(10)
+        client()
+        release.set()
+        first.join(10)
+        deadline = time.monotonic() + 10
+        while get_json(server, "/stats")["cancelled"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert errors == [504, 504]
+        assert len(converted) == 1
+        assert get_json(server, "/stats")["cancelled"] == 1